@@ -0,0 +1,274 @@
+# benchmark_buddy.py
+import argparse
+import math
+import random
+import sys
+import time
+from collections import namedtuple
+
+from buddy_system import BuddySystem, BACKENDS
+from buddy_slab import BuddySystemSlab
+
+# Distribuciones de tamaño y políticas de liberación para las trazas sintéticas.
+TAMANOS = ("uniforme", "potencia")
+LIBERACIONES = ("lifo", "fifo", "aleatoria")
+
+Resultado = namedtuple("Resultado", [
+    "backend", "traza", "operaciones", "segundos", "ops_por_segundo",
+    "p50_us", "p99_us", "fragmentacion_maxima", "tasa_fallos",
+    "divisiones", "fusiones", "tasa_aciertos_slab",
+])
+
+
+def generar_traza(operaciones, total_blocks, tamanos="uniforme", liberacion="aleatoria", semilla=0):
+    """
+    Genera una traza sintética como lista de operaciones:
+    ("RESERVAR", nombre, cantidad) o ("LIBERAR", nombre).
+
+    - tamanos="uniforme": cantidades uniformes entre 1 y total_blocks // 16.
+    - tamanos="potencia": cantidades con distribución de ley de potencias (muchas pequeñas).
+    - liberacion: orden en que se liberan los procesos vivos (lifo, fifo o aleatoria).
+    """
+    if tamanos not in TAMANOS:
+        raise ValueError(f"Distribución de tamaños '{tamanos}' desconocida.")
+    if liberacion not in LIBERACIONES:
+        raise ValueError(f"Política de liberación '{liberacion}' desconocida.")
+
+    rng = random.Random(semilla)
+    maximo = max(1, total_blocks // 16)
+    # Número de procesos vivos alrededor del cual oscila la traza (~70% de ocupación uniforme).
+    objetivo = total_blocks // maximo
+    vivos = []
+    traza = []
+    for i in range(operaciones):
+        probabilidad_reservar = 0.75 if len(vivos) < objetivo else 0.25
+        if vivos and rng.random() >= probabilidad_reservar:
+            if liberacion == "lifo":
+                nombre = vivos.pop()
+            elif liberacion == "fifo":
+                nombre = vivos.pop(0)
+            else:
+                indice = rng.randrange(len(vivos))
+                vivos[indice], vivos[-1] = vivos[-1], vivos[indice]
+                nombre = vivos.pop()
+            traza.append(("LIBERAR", nombre))
+        else:
+            if tamanos == "uniforme":
+                cantidad = rng.randint(1, maximo)
+            else:
+                cantidad = min(maximo, int(rng.paretovariate(1.2)))
+            nombre = f"p{i}"
+            vivos.append(nombre)
+            traza.append(("RESERVAR", nombre, cantidad))
+    return traza
+
+
+def cargar_traza(path):
+    """
+    Lee una traza en el formato de la interfaz interactiva:
+    una operación por línea, `RESERVAR <cantidad> <nombre>` o `LIBERAR <nombre>`.
+    Se ignoran las líneas vacías y las que empiezan con '#'.
+    """
+    traza = []
+    with open(path, encoding="utf-8") as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            partes = linea.split()
+            if not partes or partes[0].startswith("#"):
+                continue
+            accion = partes[0].upper()
+            if accion == "RESERVAR" and len(partes) == 3:
+                traza.append(("RESERVAR", partes[2].lower(), int(partes[1])))
+            elif accion == "LIBERAR" and len(partes) == 2:
+                traza.append(("LIBERAR", partes[1].lower()))
+            else:
+                raise ValueError(f"Línea {numero} inválida en la traza: {linea.strip()!r}")
+    return traza
+
+
+def guardar_traza(traza, path):
+    """Escribe una traza en el mismo formato que lee `cargar_traza`."""
+    with open(path, "w", encoding="utf-8") as archivo:
+        for operacion in traza:
+            if operacion[0] == "RESERVAR":
+                archivo.write(f"RESERVAR {operacion[2]} {operacion[1]}\n")
+            else:
+                archivo.write(f"LIBERAR {operacion[1]}\n")
+
+
+def fragmentacion_externa(memoria):
+    """1 - (bloque libre más grande / total libre). 0 si no hay memoria libre."""
+    estadisticas = memoria.stats()
+    if not estadisticas.bloques_libres:
+        return 0.0
+    return 1 - 2**estadisticas.orden_libre_maximo / estadisticas.bloques_libres
+
+
+def _percentil(ordenados, fraccion):
+    if not ordenados:
+        return 0
+    return ordenados[int(fraccion * (len(ordenados) - 1))]
+
+
+def reproducir(traza, total_blocks, backend="lista", muestreo=100, nombre_traza="traza", slab=None):
+    """
+    Reproduce una traza contra un BuddySystem nuevo y devuelve un Resultado.
+    La fragmentación se mide cada `muestreo` operaciones para no distorsionar
+    la latencia, que se toma operación por operación.
+    Con `slab` (dict de opciones de BuddySystemSlab) se usa la capa de slabs.
+    """
+    if slab is None:
+        memoria = BuddySystem(total_blocks, backend)
+    else:
+        memoria = BuddySystemSlab(total_blocks, backend, **slab)
+    reloj = time.perf_counter_ns
+    latencias = []
+    reservas = 0
+    fallos = 0
+    fragmentacion_maxima = 0.0
+
+    for i, operacion in enumerate(traza, 1):
+        if operacion[0] == "RESERVAR":
+            t0 = reloj()
+            resultado = memoria._reservar(operacion[1], operacion[2])
+            latencias.append(reloj() - t0)
+            reservas += 1
+            if resultado < 0:
+                fallos += 1
+        else:
+            t0 = reloj()
+            memoria._liberar(operacion[1])
+            latencias.append(reloj() - t0)
+        if muestreo and i % muestreo == 0:
+            fragmentacion_maxima = max(fragmentacion_maxima, fragmentacion_externa(memoria))
+    # Solo cuenta el tiempo dentro del asignador, no el muestreo de fragmentación.
+    segundos = sum(latencias) / 1e9
+
+    latencias.sort()
+    operaciones = len(traza)
+    estadisticas = memoria.stats()
+    return Resultado(
+        backend=backend if slab is None else f"{backend}+slab",
+        traza=nombre_traza,
+        operaciones=operaciones,
+        segundos=segundos,
+        ops_por_segundo=operaciones / segundos if segundos else 0.0,
+        p50_us=_percentil(latencias, 0.50) / 1000,
+        p99_us=_percentil(latencias, 0.99) / 1000,
+        fragmentacion_maxima=fragmentacion_maxima,
+        tasa_fallos=fallos / reservas if reservas else 0.0,
+        divisiones=estadisticas.divisiones,
+        fusiones=estadisticas.fusiones,
+        tasa_aciertos_slab=None if slab is None else memoria.estadisticas_slab().tasa_aciertos,
+    )
+
+
+def medir_calculo_orden(repeticiones=200000, semilla=0):
+    """
+    Microbenchmark del cálculo del orden de una reserva: compara la fórmula con
+    flotantes, math.ceil(math.log2(c)), con la entera, (c - 1).bit_length().
+    Devuelve {"flotante": ns/op, "entero": ns/op, "errores_flotante": n}, donde
+    n cuenta las cantidades grandes (cerca de 2**53 y más) en que la fórmula con
+    flotantes da un orden incorrecto.
+    """
+    rng = random.Random(semilla)
+    cantidades = [rng.randint(1, 2**20) for _ in range(repeticiones)]
+    ceil, log2 = math.ceil, math.log2
+    reloj = time.perf_counter_ns
+
+    t0 = reloj()
+    for cantidad in cantidades:
+        ceil(log2(cantidad))
+    flotante = (reloj() - t0) / repeticiones
+
+    t0 = reloj()
+    for cantidad in cantidades:
+        (cantidad - 1).bit_length()
+    entero = (reloj() - t0) / repeticiones
+
+    grandes = [2**k + d for k in range(50, 70) for d in (-1, 1)]
+    errores = sum(1 for c in grandes if ceil(log2(c)) != (c - 1).bit_length())
+    return {"flotante": flotante, "entero": entero, "errores_flotante": errores}
+
+
+def comparar(trazas, total_blocks, backends=tuple(BACKENDS), muestreo=100, slab=None):
+    """
+    Reproduce cada traza {nombre: traza} con cada backend y devuelve la lista de Resultados.
+    Con `slab`, cada backend se reproduce también con la capa de slabs.
+    """
+    variantes = [None] if slab is None else [None, slab]
+    return [
+        reproducir(traza, total_blocks, backend, muestreo, nombre, variante)
+        for nombre, traza in trazas.items()
+        for backend in backends
+        for variante in variantes
+    ]
+
+
+def formatear_tabla(resultados):
+    """Tabla de texto con una fila por (traza, backend)."""
+    encabezado = (
+        f"{'traza':<20} {'backend':<14} {'ops/s':>12} {'p50 us':>9} {'p99 us':>9} "
+        f"{'frag max':>9} {'fallos':>8} {'div+fus':>9} {'slab':>7}"
+    )
+    filas = [encabezado, "-" * len(encabezado)]
+    for r in resultados:
+        slab = "-" if r.tasa_aciertos_slab is None else f"{r.tasa_aciertos_slab:.1%}"
+        filas.append(
+            f"{r.traza:<20} {r.backend:<14} {r.ops_por_segundo:>12,.0f} {r.p50_us:>9.2f} "
+            f"{r.p99_us:>9.2f} {r.fragmentacion_maxima:>9.1%} {r.tasa_fallos:>8.1%} "
+            f"{r.divisiones + r.fusiones:>9} {slab:>7}"
+        )
+    return "\n".join(filas)
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos del benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark del Buddy System a partir de trazas.")
+    parser.add_argument("--bloques", type=int, default=1024, help="total de bloques (potencia de 2)")
+    parser.add_argument("--operaciones", type=int, default=20000, help="operaciones por traza sintética")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument("--tamanos", nargs="+", choices=TAMANOS, default=list(TAMANOS))
+    parser.add_argument("--liberacion", nargs="+", choices=LIBERACIONES, default=list(LIBERACIONES))
+    parser.add_argument("--traza", help="reproducir una traza desde archivo en lugar de generarlas")
+    parser.add_argument("--guardar-traza", help="guardar la primera traza generada en este archivo")
+    parser.add_argument("--muestreo", type=int, default=100, help="medir fragmentación cada N operaciones")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--micro-orden", action="store_true",
+                        help="solo medir el cálculo del orden (flotantes vs. bit_length)")
+    parser.add_argument("--slab", action="store_true", help="comparar también con la capa de slabs")
+    parser.add_argument("--slab-orden", type=int, default=2, help="orden máximo servido por los slabs")
+    parser.add_argument("--slab-marcas", type=int, nargs=2, default=(4, 32), metavar=("BAJA", "ALTA"))
+    args = parser.parse_args(argv)
+
+    if args.micro_orden:
+        medicion = medir_calculo_orden(semilla=args.semilla)
+        print(f"math.ceil(math.log2(c)): {medicion['flotante']:.1f} ns/op, "
+              f"{medicion['errores_flotante']} órdenes incorrectos en cantidades cercanas a 2**50..2**69")
+        print(f"(c - 1).bit_length():    {medicion['entero']:.1f} ns/op, sin errores")
+        return
+
+    if args.traza:
+        trazas = {args.traza: cargar_traza(args.traza)}
+    else:
+        trazas = {
+            f"{tamanos}/{liberacion}": generar_traza(
+                args.operaciones, args.bloques, tamanos, liberacion, args.semilla)
+            for tamanos in args.tamanos
+            for liberacion in args.liberacion
+        }
+        if args.guardar_traza:
+            guardar_traza(next(iter(trazas.values())), args.guardar_traza)
+
+    try:
+        slab = None
+        if args.slab:
+            slab = {"orden_max_slab": args.slab_orden, "marca_baja": args.slab_marcas[0], "marca_alta": args.slab_marcas[1]}
+        resultados = comparar(trazas, args.bloques, args.backends, args.muestreo, slab)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(formatear_tabla(resultados))
+
+
+if __name__ == "__main__":
+    main()
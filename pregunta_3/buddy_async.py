@@ -0,0 +1,156 @@
+# buddy_async.py
+import asyncio
+from collections import deque, namedtuple
+
+from buddy_system import (
+    BuddySystem, ERROR_NOMBRE_EN_USO, ERROR_CANTIDAD_INVALIDA,
+    ERROR_MEMORIA_INSUFICIENTE, ERROR_FRAGMENTACION,
+)
+
+# Métricas de la cola de espera devueltas por BuddySystemAsync.metricas_espera().
+EstadisticasEspera = namedtuple("EstadisticasEspera", [
+    "en_espera", "profundidad_maxima", "inmediatas", "atendidas", "vencidas",
+    "espera_media_s", "espera_maxima_s",
+])
+
+
+class _Espera:
+    """Reserva pendiente en la cola de BuddySystemAsync."""
+    def __init__(self, nombre, cantidad, futuro, inicio):
+        self.nombre = nombre
+        self.cantidad = cantidad
+        self.futuro = futuro
+        self.inicio = inicio
+
+
+class BuddySystemAsync(BuddySystem):
+    """
+    BuddySystem para usar desde un bucle de asyncio.
+
+    `await reservar_async(nombre, cantidad, timeout)` no devuelve error cuando la
+    memoria está fragmentada: suspende la tarea hasta que una liberación deje un
+    bloque del orden necesario. Las esperas se atienden en orden FIFO estricto:
+    si la primera de la cola no cabe, las siguientes esperan aunque cupieran, para
+    que las reservas grandes no queden postergadas indefinidamente. Una reserva
+    nueva tampoco se adelanta a las que ya esperan.
+
+    Las reservas síncronas (`reservar`, `reservar_many`) no pasan por la cola.
+    Como el resto del manejador, no es seguro usarlo desde varios hilos.
+    """
+    def __init__(self, total_blocks, backend="lista", **kwargs):
+        super().__init__(total_blocks, backend, **kwargs)
+        self._espera = deque()
+        self._nombres_en_espera = set()
+        self._profundidad_maxima = 0
+        self._inmediatas = 0
+        self._atendidas = 0
+        self._vencidas = 0
+        self._espera_total = 0.0
+        self._espera_maxima = 0.0
+
+    async def reservar_async(self, nombre, cantidad, timeout=None):
+        """
+        Reserva como `reservar`, pero si no hay un bloque libre suficiente espera
+        a que se libere (como mucho `timeout` segundos). Devuelve el mismo mensaje
+        que `reservar`; lanza asyncio.TimeoutError si vence el plazo, y en ese caso
+        no queda ninguna reserva hecha.
+        """
+        if nombre in self._nombres_en_espera:
+            return self._mensaje_error(ERROR_NOMBRE_EN_USO, nombre)
+        if not self._espera:
+            resultado = self._reservar(nombre, cantidad)
+            if resultado != ERROR_FRAGMENTACION:
+                if resultado >= 0:
+                    self._inmediatas += 1
+                return self._mensaje_reserva(nombre, cantidad, resultado)
+        else:
+            codigo = self._validar(nombre, cantidad)
+            if codigo is not None:
+                return self._mensaje_error(codigo, nombre, cantidad)
+
+        loop = asyncio.get_running_loop()
+        espera = _Espera(nombre, cantidad, loop.create_future(), loop.time())
+        self._espera.append(espera)
+        self._nombres_en_espera.add(nombre)
+        self._profundidad_maxima = max(self._profundidad_maxima, len(self._espera))
+        try:
+            # shield: si vence el plazo justo después de atender la espera, la reserva no se pierde.
+            resultado = await asyncio.wait_for(asyncio.shield(espera.futuro), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            if espera.futuro.done():
+                # Se atendió al mismo tiempo que se cancelaba: deshacer la reserva.
+                if espera.futuro.result() >= 0:
+                    self._liberar(nombre)
+            else:
+                espera.futuro.cancel()
+                self._retirar(espera)
+                self._vencidas += 1
+                # La espera retirada pudo ser la que bloqueaba la cabeza de la cola.
+                self._despertar()
+            raise
+        return self._mensaje_reserva(nombre, cantidad, resultado)
+
+    def _validar(self, nombre, cantidad):
+        """Código de error que `_reservar` devolvería sin depender de la fragmentación, o None."""
+        if nombre in self.allocated:
+            return ERROR_NOMBRE_EN_USO
+        if cantidad <= 0:
+            return ERROR_CANTIDAD_INVALIDA
+        if 2**(cantidad - 1).bit_length() > self.total_blocks:
+            return ERROR_MEMORIA_INSUFICIENTE
+        return None
+
+    def _mensaje_reserva(self, nombre, cantidad, resultado):
+        if resultado < 0:
+            return self._mensaje_error(resultado, nombre, cantidad)
+        size = self.allocated[nombre][1]
+        return f"Éxito: Se reservaron {size} bloques para '{nombre}' en la dirección {resultado}."
+
+    def _retirar(self, espera):
+        self._espera.remove(espera)
+        self._nombres_en_espera.discard(espera.nombre)
+
+    def _despertar(self):
+        """Atiende las esperas desde la cabeza de la cola mientras quepan."""
+        while self._espera:
+            espera = self._espera[0]
+            resultado = self._reservar(espera.nombre, espera.cantidad)
+            if resultado == ERROR_FRAGMENTACION:
+                break
+            self._retirar(espera)
+            if resultado < 0:
+                # El nombre se usó con una reserva síncrona mientras esperaba.
+                espera.futuro.set_result(resultado)
+                continue
+            transcurrido = espera.futuro.get_loop().time() - espera.inicio
+            self._atendidas += 1
+            self._espera_total += transcurrido
+            self._espera_maxima = max(self._espera_maxima, transcurrido)
+            espera.futuro.set_result(resultado)
+
+    def _liberar(self, nombre):
+        resultado = super()._liberar(nombre)
+        self._despertar()
+        return resultado
+
+    def liberar_many(self, nombres):
+        resultados = super().liberar_many(nombres)
+        self._despertar()
+        return resultados
+
+    def _redimensionar(self, nombre, nueva_cantidad):
+        resultado = super()._redimensionar(nombre, nueva_cantidad)
+        self._despertar()
+        return resultado
+
+    def metricas_espera(self):
+        """Profundidad de la cola y tiempos de espera de las reservas asíncronas."""
+        return EstadisticasEspera(
+            en_espera=len(self._espera),
+            profundidad_maxima=self._profundidad_maxima,
+            inmediatas=self._inmediatas,
+            atendidas=self._atendidas,
+            vencidas=self._vencidas,
+            espera_media_s=self._espera_total / self._atendidas if self._atendidas else 0.0,
+            espera_maxima_s=self._espera_maxima,
+        )
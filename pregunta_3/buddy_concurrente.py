@@ -0,0 +1,240 @@
+# buddy_concurrente.py
+import threading
+
+from buddy_system import (
+    BuddySystem, OK, ERROR_NOMBRE_EN_USO, ERROR_CANTIDAD_INVALIDA,
+    ERROR_MEMORIA_INSUFICIENTE, ERROR_FRAGMENTACION, ERROR_NO_ENCONTRADO,
+)
+
+
+class _CacheHilo:
+    """Bloques libres de los órdenes bajos reservados para un solo hilo."""
+    def __init__(self, nivel_cache):
+        self.lock = threading.Lock()
+        self.niveles = [[] for _ in range(nivel_cache + 1)]
+
+
+class BuddySystemConcurrente(BuddySystem):
+    """
+    Variante de BuddySystem segura para usar desde varios hilos.
+
+    Cada hilo guarda una pequeña caché de bloques libres de los órdenes
+    0..nivel_cache (como mucho `limite_cache` por orden). Las reservas y
+    liberaciones de esos tamaños se resuelven en la caché del hilo; solo las
+    divisiones y fusiones pasan por el árbol compartido, protegido por un lock.
+    El diccionario de nombres tiene su propio lock. Cuando se necesitan varios
+    locks a la vez se toman siempre en el orden caché → árbol → nombres (como
+    en `_redimensionar`; `_bloquear_todo` toma antes el del registro de
+    cachés). La única excepción es tomar las cachés de otros hilos con el árbol
+    tomado, que se hace sin esperar (acquire(blocking=False)).
+
+    Los bloques en caché cuentan como libres. `mostrar` y el resto de métodos
+    heredados que recorren las estructuras no toman locks; para una vista
+    consistente use `contar_bloques`.
+    """
+    def __init__(self, total_blocks, backend="lista", nivel_cache=2, limite_cache=16, **kwargs):
+        super().__init__(total_blocks, backend, **kwargs)
+        self.nivel_cache = min(nivel_cache, self.max_level)
+        self.limite_cache = limite_cache
+        self._lock_arbol = threading.Lock()
+        self._lock_nombres = threading.Lock()
+        self._lock_registro = threading.Lock()
+        self._local = threading.local()
+        self._caches = []
+
+    def _cache_hilo(self):
+        """Caché del hilo actual, creada y registrada en su primer uso."""
+        cache = getattr(self._local, "cache", None)
+        if cache is None:
+            cache = _CacheHilo(self.nivel_cache)
+            with self._lock_registro:
+                self._caches.append(cache)
+            self._local.cache = cache
+        return cache
+
+    def _reservar(self, nombre, cantidad):
+        cache = self._cache_hilo()
+        with cache.lock:
+            with self._lock_nombres:
+                if nombre in self.allocated:
+                    return ERROR_NOMBRE_EN_USO
+                if cantidad <= 0:
+                    return ERROR_CANTIDAD_INVALIDA
+                level_needed = (cantidad - 1).bit_length()
+                size_needed = 2**level_needed
+                if size_needed > self.total_blocks:
+                    return ERROR_MEMORIA_INSUFICIENTE
+                # El nombre queda apartado mientras se busca el bloque.
+                self.allocated[nombre] = None
+
+            block_address = None
+            if level_needed <= self.nivel_cache and cache.niveles[level_needed]:
+                block_address = cache.niveles[level_needed].pop()
+            else:
+                with self._lock_arbol:
+                    block_address = self._tomar_bloque(level_needed)
+
+            with self._lock_nombres:
+                if block_address is None:
+                    del self.allocated[nombre]
+                    return ERROR_FRAGMENTACION
+                self._registrar_reserva(nombre, cantidad, block_address, size_needed)
+            return block_address
+
+    def _tomar_bloque(self, level):
+        """
+        Toma un bloque del árbol compartido. Si no hay, devuelve al árbol la
+        caché del hilo y las cachés ajenas que no estén en uso, y reintenta,
+        para que los bloques retenidos no provoquen fallos por fragmentación.
+        Se llama con el lock de la caché propia y el del árbol tomados.
+        """
+        address = self.free_list.reservar_bloque(level)
+        if address is None:
+            cache = self._cache_hilo()
+            devueltos = self._vaciar_cache(cache)
+            if self._devolver_caches_ajenas(cache) or devueltos:
+                address = self.free_list.reservar_bloque(level)
+        return address
+
+    def _liberar(self, nombre):
+        cache = self._cache_hilo()
+        with cache.lock:
+            with self._lock_nombres:
+                if self.allocated.get(nombre) is None:
+                    return ERROR_NO_ENCONTRADO
+                address, size = self._quitar_reserva(nombre)
+
+            level = size.bit_length() - 1
+            if level <= self.nivel_cache and len(cache.niveles[level]) < self.limite_cache:
+                cache.niveles[level].append(address)
+            else:
+                with self._lock_arbol:
+                    self.free_list.liberar_bloque(address, level)
+            return OK
+
+    def _redimensionar(self, nombre, nueva_cantidad):
+        """
+        Como BuddySystem._redimensionar, con los locks de caché, árbol y nombres
+        tomados en ese orden. Si hace falta mover el bloque se toma del árbol
+        compartido, no de la caché del hilo.
+        """
+        cache = self._cache_hilo()
+        with cache.lock, self._lock_arbol, self._lock_nombres:
+            return super()._redimensionar(nombre, nueva_cantidad)
+
+    def _redimensionar_con_anterior(self, nombre, nueva_cantidad):
+        """Como BuddySystem._redimensionar_con_anterior, leyendo la dirección anterior con los mismos locks."""
+        cache = self._cache_hilo()
+        with cache.lock, self._lock_arbol, self._lock_nombres:
+            entrada = self.allocated.get(nombre)
+            return entrada and entrada[0], super()._redimensionar(nombre, nueva_cantidad)
+
+    def liberar_many(self, nombres):
+        """Libera en lote directamente sobre el árbol compartido, en orden de dirección."""
+        cache = self._cache_hilo()
+        with cache.lock:
+            resultados = []
+            bloques = []
+            with self._lock_nombres:
+                for nombre in nombres:
+                    if self.allocated.get(nombre) is None:
+                        resultados.append(ERROR_NO_ENCONTRADO)
+                        continue
+                    resultados.append(OK)
+                    bloques.append(self._quitar_reserva(nombre))
+
+            bloques.sort()
+            with self._lock_arbol:
+                for address, size in bloques:
+                    self.free_list.liberar_bloque(address, size.bit_length() - 1)
+            return resultados
+
+    def _devolver_caches_ajenas(self, propia):
+        """
+        Devuelve al árbol los bloques de las cachés de otros hilos que no estén
+        en uso en este momento. Se llama con el lock del árbol tomado.
+        Devuelve True si se devolvió algún bloque.
+        """
+        # Copia sin el lock de registro: tomarlo aquí invertiría el orden de locks.
+        caches = [cache for cache in list(self._caches) if cache is not propia]
+        devueltos = False
+        for cache in caches:
+            if not cache.lock.acquire(blocking=False):
+                continue
+            try:
+                devueltos |= self._vaciar_cache(cache)
+            finally:
+                cache.lock.release()
+        return devueltos
+
+    def _vaciar_cache(self, cache):
+        devueltos = False
+        for level, nivel in enumerate(cache.niveles):
+            while nivel:
+                self.free_list.liberar_bloque(nivel.pop(), level)
+                devueltos = True
+        return devueltos
+
+    def _bloquear_todo(self):
+        """Toma todos los locks en orden fijo: registro, cachés, árbol y nombres."""
+        self._lock_registro.acquire()
+        locks = [cache.lock for cache in self._caches] + [self._lock_arbol, self._lock_nombres]
+        for lock in locks:
+            lock.acquire()
+        return locks
+
+    def _desbloquear_todo(self, locks):
+        for lock in reversed(locks):
+            lock.release()
+        self._lock_registro.release()
+
+    def vaciar_caches(self):
+        """Devuelve al árbol compartido los bloques de las cachés de todos los hilos."""
+        locks = self._bloquear_todo()
+        try:
+            for cache in self._caches:
+                self._vaciar_cache(cache)
+        finally:
+            self._desbloquear_todo(locks)
+
+    def save(self, path):
+        """Como BuddySystem.save, con todos los locks tomados y las cachés devueltas al árbol."""
+        locks = self._bloquear_todo()
+        try:
+            for cache in self._caches:
+                self._vaciar_cache(cache)
+            super().save(path)
+        finally:
+            self._desbloquear_todo(locks)
+
+    def contar_bloques(self):
+        """
+        Devuelve (bloques_libres, bloques_reservados) tomados de forma consistente.
+        Los bloques en las cachés de los hilos cuentan como libres.
+        """
+        locks = self._bloquear_todo()
+        try:
+            libres = sum(len(nivel) * 2**level for level, nivel in enumerate(self.free_list))
+            for cache in self._caches:
+                libres += sum(len(nivel) * 2**level for level, nivel in enumerate(cache.niveles))
+            reservados = sum(entrada[1] for entrada in self.allocated.values() if entrada is not None)
+            return libres, reservados
+        finally:
+            self._desbloquear_todo(locks)
+
+    def stats(self):
+        """Como BuddySystem.stats, tomada con todos los locks y contando los bloques en caché como libres."""
+        locks = self._bloquear_todo()
+        try:
+            estadisticas = super().stats()
+            libres_por_orden = list(estadisticas.libres_por_orden)
+            for cache in self._caches:
+                for level, nivel in enumerate(cache.niveles):
+                    libres_por_orden[level] += len(nivel)
+        finally:
+            self._desbloquear_todo(locks)
+        orden_libre_maximo = max((orden for orden, cantidad in enumerate(libres_por_orden) if cantidad), default=-1)
+        return estadisticas._replace(
+            orden_libre_maximo=orden_libre_maximo,
+            libres_por_orden=tuple(libres_por_orden),
+        )
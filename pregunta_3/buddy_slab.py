@@ -0,0 +1,111 @@
+# buddy_slab.py
+from collections import namedtuple
+
+from buddy_system import BuddySystem
+
+# Estadísticas de la capa de slabs devueltas por BuddySystemSlab.estadisticas_slab().
+EstadisticasSlab = namedtuple("EstadisticasSlab", [
+    "aciertos", "fallos", "tasa_aciertos", "bloques_en_pool", "divisiones", "fusiones",
+])
+
+
+class BuddySystemSlab(BuddySystem):
+    """
+    BuddySystem con una capa de slabs para las reservas pequeñas.
+
+    Para cada orden 0..orden_max_slab se mantiene un pool de bloques ya divididos.
+    Una reserva de esos tamaños toma un bloque del pool (acierto); si el pool está
+    vacío (fallo) se rellena con `marca_baja` bloques del backend de una vez.
+    Al liberar, el bloque vuelve al pool sin fusionarse; solo cuando el pool supera
+    `marca_alta` se devuelven al backend los bloques sobrantes hasta dejar `marca_baja`.
+
+    Los bloques en los pools cuentan como libres en `stats`. Si el backend no
+    puede satisfacer una reserva, se vacían los pools y se reintenta, para que
+    los bloques retenidos no provoquen fallos por fragmentación.
+    """
+    def __init__(self, total_blocks, backend="lista", orden_max_slab=2, marca_baja=4, marca_alta=32, **kwargs):
+        super().__init__(total_blocks, backend, **kwargs)
+        if not 0 <= marca_baja <= marca_alta:
+            raise ValueError("Las marcas del slab deben cumplir 0 <= marca_baja <= marca_alta.")
+        self.orden_max_slab = min(orden_max_slab, self.max_level)
+        self.marca_baja = marca_baja
+        self.marca_alta = marca_alta
+        self._pools = [[] for _ in range(self.orden_max_slab + 1)]
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _tomar_bloque(self, level):
+        if level <= self.orden_max_slab:
+            pool = self._pools[level]
+            if pool:
+                self.aciertos += 1
+                return pool.pop()
+            self.fallos += 1
+            # Rellenar el pool con varios bloques divididos de una sola vez.
+            for _ in range(max(1, self.marca_baja)):
+                address = self.free_list.reservar_bloque(level)
+                if address is None:
+                    break
+                pool.append(address)
+            pool.reverse() # Entregar primero la dirección más baja.
+            if pool:
+                return pool.pop()
+
+        address = self.free_list.reservar_bloque(level)
+        if address is None and self.vaciar_pools():
+            address = self.free_list.reservar_bloque(level)
+        return address
+
+    def _devolver_bloque(self, address, level):
+        if level > self.orden_max_slab:
+            self.free_list.liberar_bloque(address, level)
+            return
+        pool = self._pools[level]
+        pool.append(address)
+        if len(pool) > self.marca_alta:
+            # Devolver los sobrantes en orden de dirección para que se fusionen en cascada.
+            pool.sort()
+            sobrantes = pool[self.marca_baja:]
+            del pool[self.marca_baja:]
+            for sobrante in sobrantes:
+                self.free_list.liberar_bloque(sobrante, level)
+
+    def vaciar_pools(self):
+        """Devuelve al backend todos los bloques de los pools. Devuelve True si había alguno."""
+        devueltos = False
+        for level, pool in enumerate(self._pools):
+            pool.sort()
+            for address in pool:
+                self.free_list.liberar_bloque(address, level)
+                devueltos = True
+            pool.clear()
+        return devueltos
+
+    def save(self, path):
+        """Como BuddySystem.save; antes devuelve los pools al backend para que sus bloques consten como libres."""
+        self.vaciar_pools()
+        super().save(path)
+
+    def stats(self):
+        """Como BuddySystem.stats, contando como libres los bloques de los pools."""
+        estadisticas = super().stats()
+        libres_por_orden = list(estadisticas.libres_por_orden)
+        for level, pool in enumerate(self._pools):
+            libres_por_orden[level] += len(pool)
+        orden_libre_maximo = max((orden for orden, cantidad in enumerate(libres_por_orden) if cantidad), default=-1)
+        return estadisticas._replace(
+            orden_libre_maximo=orden_libre_maximo,
+            libres_por_orden=tuple(libres_por_orden),
+        )
+
+    def estadisticas_slab(self):
+        """Aciertos y fallos de los pools y trabajo de división/fusión del backend."""
+        consultas = self.aciertos + self.fallos
+        return EstadisticasSlab(
+            aciertos=self.aciertos,
+            fallos=self.fallos,
+            tasa_aciertos=self.aciertos / consultas if consultas else 0.0,
+            bloques_en_pool=sum(len(pool) for pool in self._pools),
+            divisiones=self.free_list.divisiones,
+            fusiones=self.free_list.fusiones,
+        )
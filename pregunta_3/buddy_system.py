@@ -1,130 +1,1057 @@
 # buddy_system.py
 import sys
-import math
+import time
+import mmap
+import struct
+import zlib
+import weakref
+from array import array
+from collections import namedtuple
+
+class NivelLista(list):
+    """
+    Nivel de la lista de libres respaldado por una lista de Python.
+    Tomar el primer bloque y quitar un bloque concreto cuestan O(n).
+    """
+    def agregar(self, address):
+        self.append(address)
+
+    def tomar(self):
+        """Saca el bloque libre más antiguo del nivel."""
+        return self.pop(0)
+
+    def quitar(self, address):
+        """Quita un bloque concreto del nivel. Devuelve False si no estaba libre."""
+        try:
+            self.remove(address)
+            return True
+        except ValueError:
+            return False
+
+
+class NivelEnlazado:
+    """
+    Nivel de la lista de libres implementado como una lista doblemente enlazada
+    intrusiva indexada por dirección: {dirección: [anterior, siguiente]}.
+    Agregar, tomar y quitar cuestan O(1) y se conserva el orden de llegada,
+    por lo que el comportamiento es idéntico al de NivelLista.
+    """
+    def __init__(self, direcciones=()):
+        self._nodos = {}
+        self._cabeza = None
+        self._cola = None
+        for address in direcciones:
+            self.agregar(address)
+
+    def agregar(self, address):
+        self._nodos[address] = [self._cola, None]
+        if self._cola is None:
+            self._cabeza = address
+        else:
+            self._nodos[self._cola][1] = address
+        self._cola = address
+
+    def tomar(self):
+        """Saca el bloque libre más antiguo del nivel."""
+        if self._cabeza is None:
+            raise IndexError("tomar de un nivel vacío")
+        address = self._cabeza
+        self.quitar(address)
+        return address
+
+    def quitar(self, address):
+        """Quita un bloque concreto del nivel. Devuelve False si no estaba libre."""
+        nodo = self._nodos.pop(address, None)
+        if nodo is None:
+            return False
+        anterior, siguiente = nodo
+        if anterior is None:
+            self._cabeza = siguiente
+        else:
+            self._nodos[anterior][1] = siguiente
+        if siguiente is None:
+            self._cola = anterior
+        else:
+            self._nodos[siguiente][0] = anterior
+        return True
+
+    def __contains__(self, address):
+        return address in self._nodos
+
+    def __len__(self):
+        return len(self._nodos)
+
+    def __iter__(self):
+        address = self._cabeza
+        while address is not None:
+            yield address
+            address = self._nodos[address][1]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return f"NivelEnlazado({list(self)})"
+
+
+class ListaLibres:
+    """
+    Backend de bloques libres: una colección por nivel, donde el nivel i
+    contiene las direcciones de los bloques libres de tamaño 2**i.
+    La clase del nivel decide el coste de cada operación.
+
+    La representación es dispersa: solo existen los buddies libres que dejan las
+    divisiones, así que la memoria crece con el número de nodos divididos y no con
+    total_blocks. Sirve para espacios de direcciones de 2**64 bloques o más.
+    """
+    nivel = NivelLista
+
+    def __init__(self, max_level):
+        self.max_level = max_level
+        self.niveles = [self.nivel() for _ in range(max_level + 1)]
+        # El bloque inicial completo está en el nivel más alto.
+        self.niveles[max_level].agregar(0)
+        # Trabajo acumulado de divisiones y fusiones de bloques.
+        self.divisiones = 0
+        self.fusiones = 0
+
+    def __getitem__(self, level):
+        return self.niveles[level]
+
+    def __len__(self):
+        return len(self.niveles)
+
+    def restaurar(self, niveles):
+        """Reemplaza el contenido por las direcciones libres dadas para cada nivel, en ese orden."""
+        self.niveles = [self.nivel(direcciones) for direcciones in niveles]
+
+    def __iter__(self):
+        return iter(self.niveles)
+
+    def reservar_bloque(self, level_needed):
+        """
+        Toma un bloque libre de tamaño 2**level_needed, dividiendo uno mayor si hace falta.
+        Devuelve su dirección, o None si la memoria está demasiado fragmentada.
+        """
+        # Buscar un bloque libre del tamaño adecuado, comenzando desde el nivel necesario.
+        level_found = -1
+        for i in range(level_needed, self.max_level + 1):
+            if self.niveles[i]:
+                level_found = i
+                break
+
+        if level_found == -1:
+            return None
+
+        # Tomar el primer bloque disponible del nivel encontrado.
+        block_address = self.niveles[level_found].tomar()
+
+        # Si el bloque es más grande de lo necesario, dividirlo.
+        while level_found > level_needed:
+            level_found -= 1
+            buddy_address = block_address + 2**level_found
+            self.niveles[level_found].agregar(buddy_address)
+            self.divisiones += 1
+
+        return block_address
+
+    def liberar_bloque(self, address, level):
+        """Devuelve un bloque a la lista de libres, fusionándolo con sus buddies libres."""
+        while level < self.max_level:
+            buddy_address = address ^ 2**level # Operación XOR
+            # Si el buddy estaba libre se quita de su nivel y se fusiona.
+            if not self.niveles[level].quitar(buddy_address):
+                break
+            address = min(address, buddy_address) # La nueva dirección es la menor de las dos.
+            level += 1
+            self.fusiones += 1
+
+        # Añadir el bloque (ya fusionado o no) a la lista de libres.
+        self.niveles[level].agregar(address)
+
+    def crecer_bloque(self, address, level, nuevo_level):
+        """
+        Agranda en su lugar un bloque reservado hasta 2**nuevo_level absorbiendo sus
+        buddies libres. Solo es posible si el bloque es el buddy inferior en cada
+        nivel y todos los buddies superiores están libres. Devuelve True si creció.
+        """
+        if address % 2**nuevo_level:
+            return False
+        buddies = [(address + 2**l, l) for l in range(level, nuevo_level)]
+        if not all(buddy in self.niveles[l] for buddy, l in buddies):
+            return False
+        for buddy, l in buddies:
+            self.niveles[l].quitar(buddy)
+        self.fusiones += nuevo_level - level
+        return True
+
+    def encoger_bloque(self, address, level, nuevo_level):
+        """Reduce en su lugar un bloque reservado a 2**nuevo_level, liberando las mitades superiores."""
+        while level > nuevo_level:
+            level -= 1
+            self.niveles[level].agregar(address + 2**level)
+            self.divisiones += 1
+
+    def conteo_libres(self):
+        """Cantidad de bloques libres en cada nivel."""
+        return [len(nivel) for nivel in self.niveles]
+
+    def huella_memoria(self):
+        """Bytes aproximados que ocupan las estructuras de bloques libres."""
+        total = sys.getsizeof(self.niveles)
+        for nivel in self.niveles:
+            total += sys.getsizeof(nivel) + sum(sys.getsizeof(address) for address in nivel)
+        return total
+
+
+class ListaEnlazadaLibres(ListaLibres):
+    """Backend de bloques libres con operaciones O(1) por nivel."""
+    nivel = NivelEnlazado
+
+    def huella_memoria(self):
+        """Bytes aproximados que ocupan las estructuras de bloques libres."""
+        total = sys.getsizeof(self.niveles)
+        for nivel in self.niveles:
+            total += sys.getsizeof(nivel) + sys.getsizeof(nivel._nodos)
+            for address, nodo in nivel._nodos.items():
+                total += sys.getsizeof(address) + sys.getsizeof(nodo)
+        return total
+
+
+# Mayor arena (2**MAX_LEVEL_ARBOL bloques) que se permite representar con el árbol
+# empaquetado: 2**32 bloques ya son 8 GiB de árbol.
+MAX_LEVEL_ARBOL = 32
+
+
+class ArbolBitsLibres:
+    """
+    Backend de bloques libres que guarda el árbol buddy completo en un bytearray.
+
+    El árbol se almacena como un heap: la raíz es el nodo 0 y los hijos del nodo n
+    son 2n+1 y 2n+2. Cada nodo guarda un byte con (orden libre más grande en su
+    subárbol + 1), o 0 si no queda nada libre debajo. Un nodo está libre completo
+    cuando su valor es su propio nivel + 1; en ese caso los valores de sus
+    descendientes no se consultan y se reinician al dividirlo.
+    """
+    def __init__(self, max_level):
+        if max_level > MAX_LEVEL_ARBOL:
+            raise ValueError(
+                f"El backend 'arbol' usa 2 bytes por bloque y admite como máximo 2**{MAX_LEVEL_ARBOL} bloques; "
+                "para arenas mayores use 'lista' o 'enlazada'."
+            )
+        self.max_level = max_level
+        try:
+            self.longest = bytearray(2 ** (max_level + 1) - 1)
+        except MemoryError:
+            raise MemoryError(
+                f"No hay memoria para el árbol de 2**{max_level} bloques ({2 ** (max_level + 1)} bytes); "
+                "use 'lista' o 'enlazada'."
+            ) from None
+        self.longest[0] = max_level + 1
+        # Bloques libres por nivel, mantenido en cada división y fusión.
+        self.conteo = [0] * (max_level + 1)
+        self.conteo[max_level] = 1
+        # Trabajo acumulado de divisiones y fusiones de bloques.
+        self.divisiones = 0
+        self.fusiones = 0
+
+    def __getitem__(self, level):
+        """Direcciones (en orden creciente) de los bloques libres de tamaño 2**level."""
+        if not 0 <= level <= self.max_level:
+            raise IndexError("nivel fuera de rango")
+        longest = self.longest
+        libres = []
+        pila = [(0, self.max_level, 0)]
+        while pila:
+            nodo, nivel, address = pila.pop()
+            valor = longest[nodo]
+            if valor <= level:
+                continue
+            if valor == nivel + 1:
+                if nivel == level:
+                    libres.append(address)
+                continue
+            hijo = nivel - 1
+            pila.append((2 * nodo + 2, hijo, address + 2**hijo))
+            pila.append((2 * nodo + 1, hijo, address))
+        return libres
+
+    def __len__(self):
+        return self.max_level + 1
+
+    def __iter__(self):
+        return (self[level] for level in range(self.max_level + 1))
+
+    def reservar_bloque(self, level_needed):
+        """
+        Desciende por el árbol en O(log N) hasta un nodo libre del nivel pedido.
+        En cada paso prefiere el hijo cuyo mayor bloque libre sea el más pequeño
+        que aún sirva, para no partir bloques grandes sin necesidad.
+        """
+        longest = self.longest
+        objetivo = level_needed + 1
+        if longest[0] < objetivo:
+            return None
+
+        nodo, nivel, address = 0, self.max_level, 0
+        while nivel > level_needed:
+            izq = 2 * nodo + 1
+            der = izq + 1
+            if longest[nodo] == nivel + 1:
+                # El nodo era un bloque libre completo: dividirlo en sus dos buddies.
+                longest[izq] = longest[der] = nivel
+                self.conteo[nivel] -= 1
+                self.conteo[nivel - 1] += 2
+                self.divisiones += 1
+            nivel -= 1
+            valor_izq, valor_der = longest[izq], longest[der]
+            if valor_izq >= objetivo and (valor_der < objetivo or valor_izq <= valor_der):
+                nodo = izq
+            else:
+                nodo = der
+                address += 2**nivel
+
+        longest[nodo] = 0
+        self.conteo[level_needed] -= 1
+        self._actualizar_ancestros(nodo)
+        return address
+
+    def liberar_bloque(self, address, level):
+        """Marca el bloque como libre y fusiona hacia arriba mientras ambos buddies estén libres."""
+        longest = self.longest
+        nodo = 2 ** (self.max_level - level) - 1 + (address >> level)
+        longest[nodo] = level + 1
+        self.conteo[level] += 1
+        while nodo:
+            nodo = (nodo - 1) // 2
+            level += 1
+            valor_izq, valor_der = longest[2 * nodo + 1], longest[2 * nodo + 2]
+            if valor_izq == level and valor_der == level:
+                longest[nodo] = level + 1 # Ambos buddies libres: fusionar.
+                self.conteo[level - 1] -= 2
+                self.conteo[level] += 1
+                self.fusiones += 1
+            else:
+                longest[nodo] = max(valor_izq, valor_der)
+
+    def crecer_bloque(self, address, level, nuevo_level):
+        """
+        Agranda en su lugar un bloque reservado hasta 2**nuevo_level si en cada nivel
+        es el hijo izquierdo y su hermano derecho está libre completo.
+        Devuelve True si creció.
+        """
+        longest = self.longest
+        nodo = 2 ** (self.max_level - level) - 1 + (address >> level)
+        for l in range(level, nuevo_level):
+            # Los hijos izquierdos tienen índice impar en el heap.
+            if nodo % 2 == 0 or longest[nodo + 1] != l + 1:
+                return False
+            nodo = (nodo - 1) // 2
+        # Los valores por debajo de un nodo reservado no se consultan.
+        longest[nodo] = 0
+        for l in range(level, nuevo_level):
+            self.conteo[l] -= 1
+        self.fusiones += nuevo_level - level
+        self._actualizar_ancestros(nodo)
+        return True
+
+    def encoger_bloque(self, address, level, nuevo_level):
+        """Reduce en su lugar un bloque reservado a 2**nuevo_level, liberando las mitades superiores."""
+        longest = self.longest
+        nodo = 2 ** (self.max_level - level) - 1 + (address >> level)
+        while level > nuevo_level:
+            level -= 1
+            izq = 2 * nodo + 1
+            longest[izq + 1] = level + 1
+            self.conteo[level] += 1
+            self.divisiones += 1
+            nodo = izq
+        longest[nodo] = 0
+        self._actualizar_ancestros(nodo)
+
+    def restaurar(self, niveles):
+        """
+        Reconstruye el árbol a partir de las direcciones libres de cada nivel.
+        Cada bloque libre se propaga hacia la raíz hasta encontrar un ancestro
+        que ya tenga un valor igual o mayor: O(libres * log N) en el peor caso.
+        """
+        longest = self.longest = bytearray(len(self.longest))
+        self.conteo = [0] * (self.max_level + 1)
+        for level, direcciones in enumerate(niveles):
+            base = 2 ** (self.max_level - level) - 1
+            valor = level + 1
+            for address in direcciones:
+                nodo = base + (address >> level)
+                longest[nodo] = valor
+                self.conteo[level] += 1
+                while nodo:
+                    nodo = (nodo - 1) // 2
+                    if longest[nodo] >= valor:
+                        break
+                    longest[nodo] = valor
+
+    def _actualizar_ancestros(self, nodo):
+        longest = self.longest
+        while nodo:
+            nodo = (nodo - 1) // 2
+            longest[nodo] = max(longest[2 * nodo + 1], longest[2 * nodo + 2])
+
+    def conteo_libres(self):
+        """Cantidad de bloques libres en cada nivel."""
+        return list(self.conteo)
+
+    def huella_memoria(self):
+        """Bytes que ocupa el árbol empaquetado."""
+        return sys.getsizeof(self.longest)
+
+
+# Códigos de resultado de las operaciones por lotes. Las direcciones válidas son >= 0.
+OK = 0
+ERROR_NOMBRE_EN_USO = -1
+ERROR_CANTIDAD_INVALIDA = -2
+ERROR_MEMORIA_INSUFICIENTE = -3
+ERROR_FRAGMENTACION = -4
+ERROR_NO_ENCONTRADO = -5
+
+# Estadísticas devueltas por BuddySystem.stats().
+# fragmentacion_interna = bloques reservados (redondeados a potencia de 2) - bloques pedidos.
+Estadisticas = namedtuple("Estadisticas", [
+    "total_bloques", "bloques_libres", "bloques_reservados", "bloques_solicitados",
+    "fragmentacion_interna", "reservas", "orden_libre_maximo", "libres_por_orden",
+    "divisiones", "fusiones",
+])
+
+# Formato binario de `save`/`load` (little-endian):
+#   cabecera: magia, versión, max_level, backend, nº libres, nº reservas,
+#             bytes de la tabla de nombres, CRC32 del resto del archivo y relleno a 48 bytes.
+#   cuerpo:   libres por nivel (Q * niveles), direcciones libres (Q), direcciones
+#             reservadas (Q), cantidades pedidas (Q), órdenes reservados (B) y los
+#             nombres en UTF-8 separados por b"\0".
+FORMATO_MAGIA = b"BDSN"
+FORMATO_VERSION = 1
+_CABECERA = struct.Struct("<4sHH8sQQQI4x")
+
+# Tipos de arena de memoria real que puede administrar el manejador.
+ARENAS = (None, "bytearray", "mmap")
+
+# Backends disponibles para la lista de bloques libres.
+BACKENDS = {
+    "lista": ListaLibres,
+    "enlazada": ListaEnlazadaLibres,
+    "arbol": ArbolBitsLibres,
+}
+
 
 class BuddySystem:
     """
     Simula un manejador de memoria que implementa el algoritmo buddy system.
+
+    El parámetro `backend` elige la estructura de bloques libres:
+    - "lista": listas de Python (implementación original).
+    - "enlazada": listas doblemente enlazadas por dirección, O(1) por nivel.
+    - "arbol": árbol buddy empaquetado en un bytearray, O(log N) por operación
+      y memoria fija de 2*total_blocks bytes, sin objetos por bloque libre.
+
+    Con `arena` ("bytearray" o "mmap") el manejador administra además una zona de
+    memoria real de total_blocks * block_size bytes, y cada reserva puede leerse y
+    escribirse sin copias a través de un memoryview (ver `reservar_vista`).
     """
-    def __init__(self, total_blocks):
+    def __init__(self, total_blocks, backend="lista", arena=None, block_size=1):
         # Valida que el tamaño sea una potencia de 2.
         if not (total_blocks > 0 and (total_blocks & (total_blocks - 1)) == 0):
             raise ValueError("La cantidad total de bloques debe ser una potencia de 2 positiva.")
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend '{backend}' desconocido. Opciones: {', '.join(BACKENDS)}.")
+        if arena not in ARENAS:
+            raise ValueError(f"Arena '{arena}' desconocida. Opciones: bytearray, mmap.")
+        if not (isinstance(block_size, int) and block_size > 0):
+            raise ValueError("El tamaño de bloque debe ser un entero positivo.")
 
         self.total_blocks = total_blocks
-        # El número de niveles en el árbol es log2(total_blocks) + 1
-        self.max_level = int(math.log2(total_blocks))
+        self.backend = backend
+        # El número de niveles en el árbol es log2(total_blocks) + 1 (exacto para cualquier tamaño)
+        self.max_level = total_blocks.bit_length() - 1
         
-        # Lista de listas para los bloques libres. free_list[i] contiene bloques de tamaño 2**i.
-        self.free_list = [[] for _ in range(self.max_level + 1)]
-        # El bloque inicial completo está en el nivel más alto.
-        self.free_list[self.max_level].append(0) 
+        # Bloques libres por nivel. free_list[i] contiene bloques de tamaño 2**i.
+        self.free_list = BACKENDS[backend](self.max_level)
         
         # Diccionario para rastrear los bloques reservados: {nombre: (dirección, tamaño)}
         self.allocated = {}
 
-    def _get_buddy_address(self, address, size):
-        """Calcula la dirección del bloque "buddy"."""
-        return address ^ size # Operación XOR
+        # Contadores incrementales para `stats`: {nombre: cantidad pedida} y totales.
+        self._solicitados = {}
+        self._bloques_reservados = 0
+        self._bloques_solicitados = 0
 
-    def reservar(self, nombre, cantidad):
-        """Reserva una cantidad de bloques de memoria para un proceso."""
+        # Memoria real opcional y vistas entregadas por reserva: {nombre: [weakref a memoryview]}
+        self.block_size = block_size
+        self.arena = None
+        self._memoria = None
+        self._vistas = {}
+        if arena == "bytearray":
+            self.arena = bytearray(total_blocks * block_size)
+        elif arena == "mmap":
+            self.arena = mmap.mmap(-1, total_blocks * block_size)
+        if self.arena is not None:
+            self._memoria = memoryview(self.arena)
+
+    def huella_memoria(self):
+        """Bytes aproximados usados por el backend de libres y el diccionario de reservas."""
+        total = self.free_list.huella_memoria() + sys.getsizeof(self.allocated)
+        for nombre, entrada in self.allocated.items():
+            total += sys.getsizeof(nombre) + sys.getsizeof(entrada)
+        return total
+
+    def _reservar(self, nombre, cantidad):
+        """
+        Núcleo de `reservar`: devuelve la dirección reservada (>= 0) o un código
+        de error negativo, sin construir mensajes.
+        """
         if nombre in self.allocated:
-            return f"Error: El nombre '{nombre}' ya está en uso."
+            return ERROR_NOMBRE_EN_USO
         
         if cantidad <= 0:
-            return "Error: La cantidad a reservar debe ser positiva."
+            return ERROR_CANTIDAD_INVALIDA
 
-        # Calcular el tamaño del bloque necesario (la potencia de 2 más cercana)
-        level_needed = math.ceil(math.log2(cantidad))
+        # Calcular el tamaño del bloque necesario (la potencia de 2 más cercana).
+        # Aritmética entera: exacta para cualquier tamaño, a diferencia de
+        # math.ceil(math.log2(cantidad)), que redondea mal a partir de 2**53.
+        level_needed = (cantidad - 1).bit_length()
         size_needed = 2**level_needed
 
         if size_needed > self.total_blocks:
-            return f"Error: No hay suficiente memoria para reservar {cantidad} bloques."
+            return ERROR_MEMORIA_INSUFICIENTE
 
-        # Buscar un bloque libre del tamaño adecuado, comenzando desde el nivel necesario.
-        level_found = -1
-        for i in range(level_needed, self.max_level + 1):
-            if self.free_list[i]:
-                level_found = i
-                break
+        block_address = self._tomar_bloque(level_needed)
+        if block_address is None:
+            return ERROR_FRAGMENTACION
         
-        if level_found == -1:
+        self._registrar_reserva(nombre, cantidad, block_address, size_needed)
+        return block_address
+
+    def _tomar_bloque(self, level):
+        """Obtiene del backend un bloque libre de tamaño 2**level, o None."""
+        return self.free_list.reservar_bloque(level)
+
+    def _devolver_bloque(self, address, level):
+        """Devuelve un bloque al backend, que lo fusiona con sus buddies libres."""
+        self.free_list.liberar_bloque(address, level)
+
+    def _registrar_reserva(self, nombre, cantidad, address, size):
+        """Anota una reserva y actualiza los contadores de `stats`."""
+        self.allocated[nombre] = (address, size)
+        self._solicitados[nombre] = cantidad
+        self._bloques_reservados += size
+        self._bloques_solicitados += cantidad
+
+    def _quitar_reserva(self, nombre):
+        """Quita una reserva (invalidando su vista) y actualiza los contadores. Devuelve (dirección, tamaño)."""
+        self._invalidar_vista(nombre)
+        address, size = self.allocated.pop(nombre)
+        self._bloques_reservados -= size
+        self._bloques_solicitados -= self._solicitados.pop(nombre)
+        return address, size
+
+    def _mensaje_error(self, codigo, nombre, cantidad=None):
+        """Mensaje de error de la interfaz correspondiente a un código ERROR_*."""
+        if codigo == ERROR_NOMBRE_EN_USO:
+            return f"Error: El nombre '{nombre}' ya está en uso."
+        if codigo == ERROR_CANTIDAD_INVALIDA:
+            return "Error: La cantidad a reservar debe ser positiva."
+        if codigo == ERROR_MEMORIA_INSUFICIENTE:
+            return f"Error: No hay suficiente memoria para reservar {cantidad} bloques."
+        if codigo == ERROR_FRAGMENTACION:
             return "Error: No hay bloques libres que puedan satisfacer la solicitud (memoria fragmentada)."
+        return f"Error: No se encontró ninguna reserva con el nombre '{nombre}'."
 
-        # Tomar el primer bloque disponible del nivel encontrado.
-        block_address = self.free_list[level_found].pop(0)
+    def reservar(self, nombre, cantidad):
+        """Reserva una cantidad de bloques de memoria para un proceso."""
+        resultado = self._reservar(nombre, cantidad)
+        if resultado < 0:
+            return self._mensaje_error(resultado, nombre, cantidad)
+        # El tamaño sale de la cantidad, no de `allocated`: otro hilo podría
+        # liberar la reserva antes de armar el mensaje.
+        size = 2**(cantidad - 1).bit_length()
+        return f"Éxito: Se reservaron {size} bloques para '{nombre}' en la dirección {resultado}."
 
-        # Si el bloque es más grande de lo necesario, dividirlo.
-        while level_found > level_needed:
-            level_found -= 1
-            block_size = 2**level_found
-            buddy_address = block_address + block_size
-            self.free_list[level_found].append(buddy_address)
+    def _liberar(self, nombre):
+        """Núcleo de `liberar`: devuelve OK o ERROR_NO_ENCONTRADO, sin construir mensajes."""
+        if nombre not in self.allocated:
+            return ERROR_NO_ENCONTRADO
+
+        address, size = self._quitar_reserva(nombre)
         
-        self.allocated[nombre] = (block_address, size_needed)
-        return f"Éxito: Se reservaron {size_needed} bloques para '{nombre}' en la dirección {block_address}."
+        level = size.bit_length() - 1
+
+        # Devolver el bloque a la lista de libres, fusionando con su buddy cuando esté libre.
+        self._devolver_bloque(address, level)
+        return OK
 
     def liberar(self, nombre):
         """Libera la memoria asignada a un proceso."""
+        if self._liberar(nombre) == ERROR_NO_ENCONTRADO:
+            return self._mensaje_error(ERROR_NO_ENCONTRADO, nombre)
+        return f"Éxito: Se liberó la memoria de '{nombre}'."
+
+    def _redimensionar(self, nombre, nueva_cantidad):
+        """
+        Núcleo de `redimensionar`: devuelve la dirección final del bloque (>= 0)
+        o un código de error negativo. Si falla, la reserva original no cambia.
+        """
+        entrada = self.allocated.get(nombre)
+        if entrada is None:
+            return ERROR_NO_ENCONTRADO
+        if nueva_cantidad <= 0:
+            return ERROR_CANTIDAD_INVALIDA
+        nuevo_level = (nueva_cantidad - 1).bit_length()
+        nuevo_size = 2**nuevo_level
+        if nuevo_size > self.total_blocks:
+            return ERROR_MEMORIA_INSUFICIENTE
+
+        address, size = entrada
+        level = size.bit_length() - 1
+        nueva_address = address
+        if nuevo_level < level:
+            self.free_list.encoger_bloque(address, level, nuevo_level)
+        elif nuevo_level > level and not self.free_list.crecer_bloque(address, level, nuevo_level):
+            # Mover: se reserva el bloque nuevo antes de soltar el viejo para no perder la reserva.
+            nueva_address = self._tomar_bloque(nuevo_level)
+            if nueva_address is None:
+                return ERROR_FRAGMENTACION
+            if self._memoria is not None:
+                inicio, destino = address * self.block_size, nueva_address * self.block_size
+                largo = size * self.block_size
+                self._memoria[destino:destino + largo] = self._memoria[inicio:inicio + largo]
+            self._devolver_bloque(address, level)
+
+        # La vista anterior queda invalidada: su tamaño o dirección ya no corresponden.
+        self._quitar_reserva(nombre)
+        self._registrar_reserva(nombre, nueva_cantidad, nueva_address, nuevo_size)
+        return nueva_address
+
+    def redimensionar(self, nombre, nueva_cantidad):
+        """
+        Cambia el tamaño de una reserva conservando sus datos. Al crecer absorbe en su
+        lugar los buddies libres; al encoger divide el bloque y libera las mitades
+        sobrantes. Solo si no puede crecer en su lugar mueve el bloque (copiando la
+        arena, si la hay). Devuelve (movido, mensaje).
+        """
+        anterior, resultado = self._redimensionar_con_anterior(nombre, nueva_cantidad)
+        if resultado < 0:
+            return False, self._mensaje_error(resultado, nombre, nueva_cantidad)
+        size = 2**(nueva_cantidad - 1).bit_length()
+        if resultado != anterior:
+            return True, (f"Éxito: '{nombre}' se movió de la dirección {anterior} a la {resultado} "
+                          f"y ahora ocupa {size} bloques.")
+        return False, f"Éxito: '{nombre}' ahora ocupa {size} bloques en la dirección {resultado}, sin moverse."
+
+    def _redimensionar_con_anterior(self, nombre, nueva_cantidad):
+        """
+        Devuelve (dirección anterior, resultado de _redimensionar), leídos juntos
+        (las subclases concurrentes los leen con los mismos locks).
+        """
+        entrada = self.allocated.get(nombre)
+        return entrada and entrada[0], self._redimensionar(nombre, nueva_cantidad)
+
+    def reservar_many(self, solicitudes):
+        """
+        Reserva en lote a partir de un iterable de pares (nombre, cantidad).
+        Devuelve una lista con la dirección de cada reserva o su código de error
+        (ERROR_*), en el mismo orden de las solicitudes.
+        """
+        return [self._reservar(nombre, cantidad) for nombre, cantidad in solicitudes]
+
+    def liberar_many(self, nombres):
+        """
+        Libera en lote las reservas indicadas. Devuelve una lista con OK o
+        ERROR_NO_ENCONTRADO por cada nombre, en el orden recibido.
+        Los bloques se devuelven ordenados por dirección, de modo que los
+        buddies liberados en el mismo lote se fusionan en cascada en una sola pasada.
+        """
+        resultados = []
+        bloques = []
+        for nombre in nombres:
+            if nombre not in self.allocated:
+                resultados.append(ERROR_NO_ENCONTRADO)
+                continue
+            resultados.append(OK)
+            bloques.append(self._quitar_reserva(nombre))
+
+        bloques.sort()
+        for address, size in bloques:
+            self._devolver_bloque(address, size.bit_length() - 1)
+        return resultados
+
+    def vista(self, nombre):
+        """
+        Devuelve un memoryview nuevo sobre los bytes del bloque reservado por
+        `nombre`, sin copiarlos. Cada llamada entrega su propia vista, así que
+        liberarla (o usarla en un `with`) no afecta a las demás. Al liberar o
+        redimensionar la reserva se liberan todas las vistas entregadas, pero no
+        los cortes que el llamador haya tomado de ellas (`vista[a:b]`,
+        `memoryview(vista)`): esos siguen apuntando a la arena y no deben usarse
+        después de liberar la reserva.
+        """
+        if self._memoria is None:
+            raise ValueError("El manejador no tiene una arena de memoria (use arena='bytearray' o 'mmap').")
         if nombre not in self.allocated:
-            return f"Error: No se encontró ninguna reserva con el nombre '{nombre}'."
+            raise KeyError(self._mensaje_error(ERROR_NO_ENCONTRADO, nombre))
+        address, size = self.allocated[nombre]
+        inicio = address * self.block_size
+        vista = self._memoria[inicio:inicio + size * self.block_size]
+        # Referencias débiles: las vistas que el llamador descarta no se acumulan.
+        vivas = [ref for ref in self._vistas.get(nombre, ()) if ref() is not None]
+        vivas.append(weakref.ref(vista))
+        self._vistas[nombre] = vivas
+        return vista
 
-        address, size = self.allocated.pop(nombre)
-        
-        level = int(math.log2(size))
+    def reservar_vista(self, nombre, cantidad):
+        """
+        Reserva como `reservar`, pero devuelve directamente el memoryview del bloque.
+        Lanza ValueError si el nombre o la cantidad no son válidos y MemoryError
+        si no hay un bloque libre suficiente.
+        """
+        if self._memoria is None:
+            raise ValueError("El manejador no tiene una arena de memoria (use arena='bytearray' o 'mmap').")
+        resultado = self._reservar(nombre, cantidad)
+        if resultado in (ERROR_NOMBRE_EN_USO, ERROR_CANTIDAD_INVALIDA):
+            raise ValueError(self._mensaje_error(resultado, nombre, cantidad))
+        if resultado < 0:
+            raise MemoryError(self._mensaje_error(resultado, nombre, cantidad))
+        return self.vista(nombre)
 
-        # Intentar fusionar el bloque liberado con su buddy.
-        while level < self.max_level:
-            buddy_address = self._get_buddy_address(address, size)
-            
-            # Verificar si el buddy está en la lista de libres.
+    def _invalidar_vista(self, nombre):
+        """
+        Libera los memoryview entregados para `nombre`; usarlos después lanza
+        ValueError. Una vista que otro objeto todavía exporta (por ejemplo, un
+        arreglo de numpy creado sobre ella) no se puede liberar y se deja tal cual.
+        """
+        for ref in self._vistas.pop(nombre, ()):
+            vista = ref()
+            if vista is not None:
+                try:
+                    vista.release()
+                except BufferError:
+                    pass
+
+    def cerrar(self):
+        """
+        Invalida todas las vistas y libera la arena de memoria (cierra el mmap).
+        Si el llamador conserva cortes o exportaciones de alguna vista, el mmap no
+        se puede cerrar: se lanza BufferError y el manejador sigue utilizable.
+        """
+        for nombre in list(self._vistas):
+            self._invalidar_vista(nombre)
+        if isinstance(self.arena, mmap.mmap) and not self.arena.closed:
+            self._memoria.release()
             try:
-                self.free_list[level].remove(buddy_address)
-                # Si se pudo remover, significa que el buddy estaba libre. Fusionar.
-                address = min(address, buddy_address) # La nueva dirección es la menor de las dos.
-                size *= 2
-                level += 1
-            except ValueError:
-                # El buddy no está libre, no se puede fusionar más.
-                break
-        
-        # Añadir el bloque (ya fusionado o no) a la lista de libres.
-        self.free_list[level].append(address)
-        return f"Éxito: Se liberó la memoria de '{nombre}'."
+                self.arena.close()
+            except BufferError:
+                self._memoria = memoryview(self.arena)
+                raise BufferError("No se puede cerrar la arena: todavía hay cortes de sus vistas en uso. "
+                                  "Libérelos (release() o del) antes de llamar a cerrar.") from None
+        if self._memoria is not None:
+            self._memoria.release()
+        self._memoria = None
+
+    def save(self, path):
+        """
+        Guarda el estado (bloques libres y reservas) en un archivo binario compacto
+        con cabecera versionada y suma de verificación CRC32. La arena de memoria
+        real, si la hay, no se guarda. Las direcciones y cantidades se guardan como
+        enteros de 64 bits, así que el formato admite arenas de hasta 2**63 bloques:
+        los espacios mayores que simulan "lista" y "enlazada" no se pueden guardar.
+        """
+        if self.max_level >= 64:
+            raise ValueError("El formato binario solo admite arenas de hasta 2**63 bloques.")
+        conteos = array("Q")
+        libres = array("Q")
+        for nivel in self.free_list:
+            conteos.append(len(nivel))
+            libres.extend(nivel)
+
+        direcciones = array("Q")
+        cantidades = array("Q")
+        ordenes = array("B")
+        nombres = []
+        for nombre, (address, size) in self.allocated.items():
+            if not isinstance(nombre, str) or "\0" in nombre:
+                raise ValueError(f"No se puede guardar el nombre {nombre!r}: debe ser un texto sin '\\0'.")
+            direcciones.append(address)
+            cantidades.append(self._solicitados[nombre])
+            ordenes.append(size.bit_length() - 1)
+            nombres.append(nombre)
+        tabla_nombres = "\0".join(nombres).encode("utf-8")
+
+        partes = [conteos, libres, direcciones, cantidades]
+        if sys.byteorder == "big":
+            for parte in partes:
+                parte.byteswap()
+        partes += [ordenes, tabla_nombres]
+        crc = 0
+        for parte in partes:
+            crc = zlib.crc32(parte, crc)
+
+        cabecera = _CABECERA.pack(
+            FORMATO_MAGIA, FORMATO_VERSION, self.max_level, self.backend.encode("ascii"),
+            len(libres), len(direcciones), len(tabla_nombres), crc,
+        )
+        with open(path, "wb") as archivo:
+            archivo.write(cabecera)
+            for parte in partes:
+                archivo.write(parte)
+
+    @classmethod
+    def load(cls, path, backend=None, **kwargs):
+        """
+        Restaura un estado guardado con `save`. El archivo se mapea en memoria y
+        los arreglos se leen directamente del mapa, sin reconstruir reserva por reserva.
+        `backend` permite cargar el estado con un backend distinto al guardado;
+        el resto de argumentos se pasan al constructor.
+        Lanza ValueError si el archivo no es válido o su suma de verificación no coincide.
+        """
+        with open(path, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if len(mapa) < _CABECERA.size:
+                raise ValueError("Archivo de estado truncado.")
+            magia, version, max_level, backend_guardado, n_libres, n_reservas, n_bytes_nombres, crc = \
+                _CABECERA.unpack_from(mapa)
+            if magia != FORMATO_MAGIA:
+                raise ValueError("El archivo no es un estado de BuddySystem.")
+            if version != FORMATO_VERSION:
+                raise ValueError(f"Versión de formato {version} no soportada.")
 
-    def mostrar(self):
-        """Muestra el estado actual de la memoria."""
-        print("-" * 40)
-        print("ESTADO DE LA MEMORIA")
-        print("-" * 40)
-        print("Bloques Reservados:")
+            niveles = max_level + 1
+            tamanos = [8 * niveles, 8 * n_libres, 8 * n_reservas, 8 * n_reservas, n_reservas, n_bytes_nombres]
+            if len(mapa) != _CABECERA.size + sum(tamanos):
+                raise ValueError("Archivo de estado truncado.")
+            datos = memoryview(mapa)[_CABECERA.size:]
+            try:
+                if zlib.crc32(datos) != crc:
+                    raise ValueError("La suma de verificación no coincide: archivo corrupto.")
+                secciones = []
+                inicio = 0
+                for tamano in tamanos:
+                    secciones.append(datos[inicio:inicio + tamano])
+                    inicio += tamano
+                conteos, libres, direcciones, cantidades = (
+                    cls._leer_enteros(seccion) for seccion in secciones[:4])
+                ordenes = secciones[4].tolist()
+                nombres = bytes(secciones[5]).decode("utf-8").split("\0") if n_reservas else []
+                for seccion in secciones:
+                    seccion.release()
+            finally:
+                datos.release()
+
+        if backend is None:
+            backend = backend_guardado.rstrip(b"\0").decode("ascii")
+        memoria = cls(2**max_level, backend, **kwargs)
+
+        por_nivel = []
+        inicio = 0
+        for conteo in conteos:
+            por_nivel.append(libres[inicio:inicio + conteo])
+            inicio += conteo
+        memoria.free_list.restaurar(por_nivel)
+
+        tamanos_reservados = [1 << orden for orden in ordenes]
+        memoria.allocated = dict(zip(nombres, zip(direcciones, tamanos_reservados)))
+        memoria._solicitados = dict(zip(nombres, cantidades))
+        memoria._bloques_reservados = sum(tamanos_reservados)
+        memoria._bloques_solicitados = sum(cantidades)
+        return memoria
+
+    @staticmethod
+    def _leer_enteros(seccion):
+        """Lista de enteros de 64 bits little-endian a partir de una vista del archivo."""
+        if sys.byteorder == "little":
+            vista = seccion.cast("Q")
+            try:
+                return vista.tolist()
+            finally:
+                vista.release()
+        enteros = array("Q")
+        enteros.frombytes(seccion)
+        enteros.byteswap()
+        return enteros.tolist()
+
+    def stats(self):
+        """
+        Devuelve las estadísticas actuales como un objeto Estadisticas, sin recorrer
+        las listas de libres: los totales se mantienen al reservar y liberar, y el
+        conteo por orden cuesta O(niveles).
+        """
+        libres_por_orden = tuple(self.free_list.conteo_libres())
+        orden_libre_maximo = -1
+        for orden, cantidad in enumerate(libres_por_orden):
+            if cantidad:
+                orden_libre_maximo = orden
+        return Estadisticas(
+            total_bloques=self.total_blocks,
+            bloques_libres=self.total_blocks - self._bloques_reservados,
+            bloques_reservados=self._bloques_reservados,
+            bloques_solicitados=self._bloques_solicitados,
+            fragmentacion_interna=self._bloques_reservados - self._bloques_solicitados,
+            reservas=len(self._solicitados),
+            orden_libre_maximo=orden_libre_maximo,
+            libres_por_orden=libres_por_orden,
+            divisiones=self.free_list.divisiones,
+            fusiones=self.free_list.fusiones,
+        )
+
+    def mostrar(self, archivo=None):
+        """Muestra el estado actual de la memoria en `archivo` (por defecto, la salida estándar)."""
+        print("-" * 40, file=archivo)
+        print("ESTADO DE LA MEMORIA", file=archivo)
+        print("-" * 40, file=archivo)
+        print("Bloques Reservados:", file=archivo)
         if not self.allocated:
-            print("  (Ninguno)")
+            print("  (Ninguno)", file=archivo)
         else:
             for nombre, (addr, size) in sorted(self.allocated.items()):
-                print(f"  - {nombre}: tamaño={size}, dirección={addr}")
+                print(f"  - {nombre}: tamaño={size}, dirección={addr}", file=archivo)
         
-        print("\nBloques Libres por Nivel (tamaño=2^nivel):")
+        print("\nBloques Libres por Nivel (tamaño=2^nivel):", file=archivo)
         for i in range(self.max_level + 1):
             size = 2**i
             blocks = sorted(self.free_list[i])
-            print(f"  Nivel {i} (tamaño {size}): {blocks if blocks else '(Ninguno)'}")
-        print("-" * 40)
+            print(f"  Nivel {i} (tamaño {size}): {blocks if blocks else '(Ninguno)'}", file=archivo)
+        print(f"\nMemoria del backend '{self.backend}': {self.free_list.huella_memoria()} bytes", file=archivo)
+        print("-" * 40, file=archivo)
+
+def ejecutar_lote(memoria, lineas, salida=None, resumen=False, tamano_buffer=4096):
+    """
+    Ejecuta un guion de comandos (RESERVAR, LIBERAR, MOSTRAR, SALIR) leído como flujo
+    de líneas, sin prompt. La salida se acumula y se escribe en bloques de
+    `tamano_buffer` líneas. Con `resumen=True` solo se escriben los errores, con su
+    número de línea, y el estado pedido con MOSTRAR; en ese modo las operaciones
+    exitosas no construyen mensajes.
+    Devuelve un dict con los contadores de la ejecución.
+    """
+    if salida is None:
+        salida = sys.stdout
+    buffer = []
+    contadores = {"comandos": 0, "reservas": 0, "liberaciones": 0, "errores": 0}
+
+    def emitir(texto):
+        buffer.append(texto)
+        if len(buffer) >= tamano_buffer:
+            salida.write("\n".join(buffer) + "\n")
+            buffer.clear()
+
+    def error(numero, texto):
+        contadores["errores"] += 1
+        emitir(f"Línea {numero}: {texto}" if resumen else texto)
+
+    for numero, linea in enumerate(lineas, 1):
+        partes = linea.split()
+        if not partes:
+            continue
+        contadores["comandos"] += 1
+        accion = partes[0].upper()
+
+        if accion == "RESERVAR":
+            if len(partes) != 3:
+                error(numero, "Error: Formato incorrecto. Uso: RESERVAR <cantidad> <nombre>")
+                continue
+            try:
+                cantidad = int(partes[1])
+            except ValueError:
+                error(numero, "Error: La cantidad debe ser un número entero.")
+                continue
+            nombre = partes[2].lower()
+            resultado = memoria._reservar(nombre, cantidad)
+            if resultado < 0:
+                error(numero, memoria._mensaje_error(resultado, nombre, cantidad))
+            else:
+                contadores["reservas"] += 1
+                if not resumen:
+                    size = memoria.allocated[nombre][1]
+                    emitir(f"Éxito: Se reservaron {size} bloques para '{nombre}' en la dirección {resultado}.")
+
+        elif accion == "LIBERAR":
+            if len(partes) != 2:
+                error(numero, "Error: Formato incorrecto. Uso: LIBERAR <nombre>")
+                continue
+            nombre = partes[1].lower()
+            if memoria._liberar(nombre) != OK:
+                error(numero, memoria._mensaje_error(ERROR_NO_ENCONTRADO, nombre))
+            else:
+                contadores["liberaciones"] += 1
+                if not resumen:
+                    emitir(f"Éxito: Se liberó la memoria de '{nombre}'.")
+
+        elif accion == "MOSTRAR":
+            salida.write("".join(texto + "\n" for texto in buffer))
+            buffer.clear()
+            memoria.mostrar(salida)
+
+        elif accion == "SALIR":
+            break
+
+        else:
+            error(numero, f"Error: Comando '{accion}' no reconocido.")
+
+    if buffer:
+        salida.write("\n".join(buffer) + "\n")
+    return contadores
+
+
+def _formatear_resumen(contadores, memoria, segundos):
+    """Texto con las estadísticas finales de una ejecución por lotes."""
+    estadisticas = memoria.stats()
+    return (
+        f"Resumen: {contadores['comandos']} comandos en {segundos:.3f} s "
+        f"({contadores['comandos'] / segundos if segundos else 0:,.0f} comandos/s), "
+        f"{contadores['reservas']} reservas, {contadores['liberaciones']} liberaciones, "
+        f"{contadores['errores']} errores.\n"
+        f"Memoria: {estadisticas.bloques_reservados} bloques reservados, "
+        f"{estadisticas.bloques_libres} libres, fragmentación interna "
+        f"{estadisticas.fragmentacion_interna} bloques, orden libre máximo {estadisticas.orden_libre_maximo}."
+    )
+
 
 def main():
     """Función principal que maneja la interacción con el usuario."""
-    if len(sys.argv) != 2:
-        print("Uso: python buddy_system.py <cantidad_de_bloques>")
+    uso = "Uso: python buddy_system.py <cantidad_de_bloques> [--batch <archivo>|-] [--resumen]"
+    argumentos = sys.argv[1:]
+    archivo_lote = None
+    resumen = False
+    if "--resumen" in argumentos:
+        argumentos.remove("--resumen")
+        resumen = True
+    if "--batch" in argumentos:
+        indice = argumentos.index("--batch")
+        if indice + 1 >= len(argumentos):
+            print(uso)
+            sys.exit(1)
+        archivo_lote = argumentos.pop(indice + 1)
+        argumentos.pop(indice)
+    if len(argumentos) != 1 or (resumen and archivo_lote is None):
+        print(uso)
         sys.exit(1)
     
     try:
-        total_blocks = int(sys.argv[1])
+        total_blocks = int(argumentos[0])
         memoria = BuddySystem(total_blocks)
     except ValueError as e:
         print(f"Error al inicializar: {e}")
         sys.exit(1)
 
+    if archivo_lote is not None:
+        inicio = time.perf_counter()
+        if archivo_lote == "-":
+            contadores = ejecutar_lote(memoria, sys.stdin, resumen=resumen)
+        else:
+            try:
+                with open(archivo_lote, encoding="utf-8") as lineas:
+                    contadores = ejecutar_lote(memoria, lineas, resumen=resumen)
+            except OSError as e:
+                print(f"Error: No se pudo leer el archivo de comandos: {e}")
+                sys.exit(1)
+        if resumen:
+            print(_formatear_resumen(contadores, memoria, time.perf_counter() - inicio))
+        return
+
     print(f"Manejador de memoria iniciado con {total_blocks} bloques.")
     print("Comandos disponibles: RESERVAR <cant> <nombre>, LIBERAR <nombre>, MOSTRAR, SALIR")
 
@@ -0,0 +1,119 @@
+import pytest
+from benchmark_buddy import (
+    generar_traza, cargar_traza, guardar_traza, reproducir, comparar,
+    fragmentacion_externa, medir_calculo_orden, main,
+)
+from buddy_system import BuddySystem
+
+# --- Pruebas de generación y carga de trazas ---
+
+@pytest.mark.parametrize("liberacion", ["lifo", "fifo", "aleatoria"])
+@pytest.mark.parametrize("tamanos", ["uniforme", "potencia"])
+def test_traza_sintetica_valida(tamanos, liberacion):
+    """Prueba que cada LIBERAR de la traza se refiere a un proceso vivo."""
+    traza = generar_traza(500, 256, tamanos, liberacion, semilla=1)
+    assert len(traza) == 500
+    vivos = set()
+    for operacion in traza:
+        if operacion[0] == "RESERVAR":
+            assert 1 <= operacion[2] <= 16
+            vivos.add(operacion[1])
+        else:
+            assert operacion[1] in vivos
+            vivos.remove(operacion[1])
+
+def test_traza_lifo_y_fifo():
+    """Prueba el orden de liberación de las políticas LIFO y FIFO."""
+    for liberacion, esperado in (("lifo", max), ("fifo", min)):
+        traza = generar_traza(300, 256, liberacion=liberacion, semilla=3)
+        vivos = []
+        for operacion in traza:
+            if operacion[0] == "RESERVAR":
+                vivos.append(int(operacion[1][1:]))
+            else:
+                indice = int(operacion[1][1:])
+                assert indice == esperado(vivos)
+                vivos.remove(indice)
+
+def test_traza_semilla_reproducible():
+    assert generar_traza(200, 64, "potencia", semilla=5) == generar_traza(200, 64, "potencia", semilla=5)
+
+def test_traza_tipo_desconocido():
+    with pytest.raises(ValueError, match="desconocida"):
+        generar_traza(10, 64, tamanos="normal")
+
+def test_guardar_y_cargar_traza(tmp_path):
+    """Prueba que una traza guardada se lee igual, con el formato de la interfaz."""
+    traza = generar_traza(100, 64, semilla=2)
+    path = tmp_path / "traza.txt"
+    guardar_traza(traza, path)
+    assert cargar_traza(path) == traza
+
+def test_cargar_traza_invalida(tmp_path):
+    path = tmp_path / "traza.txt"
+    path.write_text("# comentario\n\nreservar 4 a\nMOSTRAR\n")
+    with pytest.raises(ValueError, match="Línea 4 inválida"):
+        cargar_traza(path)
+
+# --- Pruebas de reproducción y métricas ---
+
+def test_fragmentacion_externa():
+    memoria = BuddySystem(16)
+    assert fragmentacion_externa(memoria) == 0.0
+    memoria.reservar_many([("a", 4), ("b", 4), ("c", 8)])
+    assert fragmentacion_externa(memoria) == 0.0
+    memoria.liberar_many(["a", "c"])
+    # Libres: 4 en 0 y 8 en 8 -> mayor 8 de 12
+    assert fragmentacion_externa(memoria) == pytest.approx(1 - 8 / 12)
+
+def test_reproducir_metricas():
+    """Prueba que la reproducción reporta métricas coherentes."""
+    traza = [("RESERVAR", "a", 8), ("RESERVAR", "b", 8), ("RESERVAR", "c", 1), ("LIBERAR", "a")]
+    resultado = reproducir(traza, 16, muestreo=1)
+    assert resultado.operaciones == 4
+    assert resultado.tasa_fallos == pytest.approx(1 / 3)
+    assert resultado.ops_por_segundo > 0
+    assert 0 < resultado.p50_us <= resultado.p99_us
+    assert resultado.fragmentacion_maxima == 0.0
+
+def test_comparar_backends_mismos_fallos():
+    """Prueba que los backends con listas ven exactamente los mismos fallos en una traza."""
+    trazas = {"t": generar_traza(2000, 128, "potencia", "aleatoria", semilla=9)}
+    resultados = comparar(trazas, 128, ("lista", "enlazada"))
+    assert [r.backend for r in resultados] == ["lista", "enlazada"]
+    assert resultados[0].tasa_fallos == resultados[1].tasa_fallos
+
+def test_main_tabla(capsys):
+    main(["--bloques", "64", "--operaciones", "200", "--tamanos", "uniforme", "--liberacion", "lifo"])
+    salida = capsys.readouterr().out
+    assert "ops/s" in salida
+    for backend in ("lista", "enlazada", "arbol"):
+        assert f"uniforme/lifo        {backend} " in salida
+
+def test_slab_reduce_divisiones_y_fusiones():
+    """Prueba que la capa de slabs ahorra trabajo de división/fusión en una traza de bloques pequeños."""
+    trazas = {"t": generar_traza(3000, 1024, "potencia", "lifo", semilla=4)}
+    simple, con_slab = comparar(trazas, 1024, ("lista",), slab={"orden_max_slab": 2})
+    assert con_slab.backend == "lista+slab"
+    assert simple.tasa_aciertos_slab is None
+    assert con_slab.tasa_aciertos_slab > 0.5
+    assert con_slab.divisiones + con_slab.fusiones < simple.divisiones + simple.fusiones
+    assert con_slab.tasa_fallos == simple.tasa_fallos == 0.0
+
+def test_main_con_slab(capsys):
+    main(["--bloques", "64", "--operaciones", "200", "--tamanos", "potencia",
+          "--liberacion", "fifo", "--backends", "enlazada", "--slab"])
+    assert "enlazada+slab" in capsys.readouterr().out
+
+def test_main_bloques_invalidos(capsys):
+    with pytest.raises(SystemExit):
+        main(["--bloques", "100", "--operaciones", "10"])
+    assert "potencia de 2" in capsys.readouterr().out
+
+def test_micro_orden(capsys):
+    """Prueba que el microbenchmark detecta los errores de redondeo de la fórmula con flotantes."""
+    medicion = medir_calculo_orden(repeticiones=1000)
+    assert medicion["flotante"] > 0 and medicion["entero"] > 0
+    assert medicion["errores_flotante"] > 0
+    main(["--micro-orden"])
+    assert "bit_length" in capsys.readouterr().out
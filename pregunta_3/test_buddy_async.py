@@ -0,0 +1,130 @@
+import asyncio
+import random
+import pytest
+from buddy_async import BuddySystemAsync
+from buddy_system import BACKENDS
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    return request.param
+
+async def ceder():
+    """Deja correr el bucle varias vueltas para que las tareas despertadas avancen."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+def test_reserva_inmediata_y_errores(backend):
+    """Prueba que sin fragmentación reservar_async responde como reservar, sin esperar."""
+    async def escenario():
+        memoria = BuddySystemAsync(16, backend)
+        assert await memoria.reservar_async("a", 3) == "Éxito: Se reservaron 4 bloques para 'a' en la dirección 0."
+        assert "ya está en uso" in await memoria.reservar_async("a", 1)
+        assert "debe ser positiva" in await memoria.reservar_async("b", 0)
+        assert "No hay suficiente memoria" in await memoria.reservar_async("b", 17)
+        return memoria.metricas_espera()
+
+    metricas = asyncio.run(escenario())
+    assert (metricas.inmediatas, metricas.atendidas, metricas.en_espera) == (1, 0, 0)
+
+def test_espera_hasta_liberar(backend):
+    """Prueba que una reserva que no cabe espera y se atiende al liberar un bloque del orden necesario."""
+    async def escenario():
+        memoria = BuddySystemAsync(16, backend)
+        memoria.reservar_many([("a", 8), ("b", 4), ("c", 4)])
+        tarea = asyncio.create_task(memoria.reservar_async("d", 8))
+        await ceder()
+        assert not tarea.done()
+        assert memoria.metricas_espera().en_espera == 1
+        memoria.liberar("b")  # solo queda un bloque de 4: sigue esperando
+        await ceder()
+        assert not tarea.done()
+        memoria.liberar("c")
+        assert await tarea == "Éxito: Se reservaron 8 bloques para 'd' en la dirección 8."
+        return memoria.metricas_espera()
+
+    metricas = asyncio.run(escenario())
+    assert (metricas.atendidas, metricas.en_espera, metricas.profundidad_maxima) == (1, 0, 1)
+    assert metricas.espera_maxima_s >= metricas.espera_media_s > 0
+
+def test_orden_fifo_estricto():
+    """Prueba que las esperas se atienden en orden de llegada y que una pequeña no adelanta a una grande."""
+    async def escenario():
+        memoria = BuddySystemAsync(16)
+        memoria.reservar_many([("a", 8), ("b", 8)])
+        atendidas = []
+
+        async def pedir(nombre, cantidad):
+            await memoria.reservar_async(nombre, cantidad)
+            atendidas.append(nombre)
+
+        tareas = [asyncio.create_task(pedir(n, c)) for n, c in (("grande", 16), ("chica", 1))]
+        await ceder()
+        memoria.liberar("a")  # "chica" cabría, pero "grande" va primero
+        await ceder()
+        assert atendidas == []
+        assert "ya está en uso" in await memoria.reservar_async("chica", 2)
+        memoria.liberar("b")
+        await ceder()
+        assert atendidas == ["grande"]
+        memoria.liberar("grande")
+        await asyncio.gather(*tareas)
+        assert atendidas == ["grande", "chica"]
+
+    asyncio.run(escenario())
+
+def test_timeout_retira_la_espera():
+    """Prueba que al vencer el plazo se lanza TimeoutError y se atiende a la siguiente de la cola."""
+    async def escenario():
+        memoria = BuddySystemAsync(16)
+        memoria.reservar_many([("a", 8), ("b", 4), ("c", 4)])
+        with pytest.raises(asyncio.TimeoutError):
+            await memoria.reservar_async("grande", 16, timeout=0.01)
+        tarea = asyncio.create_task(memoria.reservar_async("d", 8, timeout=1))
+        vencida = asyncio.create_task(memoria.reservar_async("e", 16, timeout=0.01))
+        await ceder()
+        memoria.liberar("a")
+        assert "dirección 0" in await tarea
+        with pytest.raises(asyncio.TimeoutError):
+            await vencida
+        assert "e" not in memoria.allocated and "grande" not in memoria.allocated
+        return memoria.metricas_espera()
+
+    metricas = asyncio.run(escenario())
+    assert (metricas.vencidas, metricas.atendidas, metricas.en_espera) == (2, 1, 0)
+
+def test_cancelar_no_deja_reserva():
+    async def escenario():
+        memoria = BuddySystemAsync(8)
+        memoria.reservar("a", 8)
+        tarea = asyncio.create_task(memoria.reservar_async("b", 8))
+        await ceder()
+        memoria.liberar("a")  # atiende a "b" justo antes de cancelar la tarea
+        tarea.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarea
+        assert "b" not in memoria.allocated
+        assert memoria.free_list[3] == [0]
+
+    asyncio.run(escenario())
+
+def test_productores_y_consumidores(backend):
+    """Prueba que muchas tareas que reservan y liberan terminan sin perder bloques."""
+    async def escenario():
+        memoria = BuddySystemAsync(64, backend)
+
+        async def trabajador(indice):
+            rng = random.Random(indice)
+            for i in range(30):
+                nombre = f"t{indice}_{i}"
+                mensaje = await memoria.reservar_async(nombre, rng.choice([1, 4, 8, 16, 32]), timeout=5)
+                assert mensaje.startswith("Éxito")
+                await asyncio.sleep(0)
+                memoria.liberar(nombre)
+
+        await asyncio.gather(*(trabajador(i) for i in range(10)))
+        return memoria
+
+    memoria = asyncio.run(escenario())
+    assert not memoria.allocated
+    assert memoria.free_list[6] == [0]
+    assert memoria.metricas_espera().profundidad_maxima > 1
@@ -0,0 +1,134 @@
+import random
+import threading
+import pytest
+from buddy_concurrente import BuddySystemConcurrente
+from buddy_system import BACKENDS, ERROR_NOMBRE_EN_USO, ERROR_FRAGMENTACION
+
+TOTAL = 1024
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    return request.param
+
+def test_reserva_y_liberacion_usan_cache_del_hilo(backend):
+    """Prueba que un bloque pequeño liberado queda en la caché del hilo y se reutiliza."""
+    memoria = BuddySystemConcurrente(16, backend)
+    assert "dirección 0" in memoria.reservar("a", 1)
+    memoria.liberar("a")
+    # El bloque quedó en la caché, no volvió al árbol.
+    assert memoria.free_list[0] == [1]
+    assert memoria._cache_hilo().niveles[0] == [0]
+    assert "dirección 0" in memoria.reservar("b", 1)
+    assert memoria.contar_bloques() == (15, 1)
+    estadisticas = memoria.stats()
+    assert estadisticas.bloques_libres == 15
+    assert estadisticas.libres_por_orden == (1, 1, 1, 1, 0)
+
+def test_errores_como_en_buddy_system(backend):
+    memoria = BuddySystemConcurrente(8, backend)
+    assert memoria._reservar("a", 8) == 0
+    assert memoria._reservar("a", 1) == ERROR_NOMBRE_EN_USO
+    assert memoria._reservar("b", 1) == ERROR_FRAGMENTACION
+    assert "Error: No se encontró" in memoria.liberar("c")
+    assert "b" not in memoria.allocated
+
+def test_fragmentacion_recupera_caches_de_otros_hilos(backend):
+    """Prueba que una reserva grande recupera los bloques guardados en cachés ajenas."""
+    memoria = BuddySystemConcurrente(8, backend, nivel_cache=1)
+
+    def trabajo():
+        memoria.reservar_many([("x", 2), ("y", 2)])
+        memoria.liberar("x")
+        memoria.liberar("y")
+
+    hilo = threading.Thread(target=trabajo)
+    hilo.start()
+    hilo.join()
+    assert memoria.contar_bloques() == (8, 0)
+    assert memoria._reservar("grande", 8) == 0
+
+def test_fragmentacion_recupera_cache_propia(backend):
+    """Prueba que una reserva grande recupera los bloques guardados en la caché del mismo hilo."""
+    memoria = BuddySystemConcurrente(16, backend)
+    for i in range(4):
+        memoria.reservar(f"p{i}", 4)
+    for i in range(4):
+        memoria.liberar(f"p{i}")
+    assert memoria.stats().libres_por_orden == (0, 0, 4, 0, 0)
+    assert memoria.reservar("big", 16) == "Éxito: Se reservaron 16 bloques para 'big' en la dirección 0."
+    assert memoria.contar_bloques() == (0, 16)
+
+def test_redimensionar_recupera_cache_propia(backend):
+    memoria = BuddySystemConcurrente(16, backend)
+    memoria.reservar_many([("a", 4), ("b", 4), ("c", 4), ("d", 4)])
+    memoria.liberar("a")
+    memoria.liberar("c")
+    memoria.liberar("d")
+    # Para crecer a 8, "b" se mueve a 8..15, que estaba en la caché del hilo.
+    assert memoria.redimensionar("b", 8) == (True, "Éxito: 'b' se movió de la dirección 4 a la 8 y ahora ocupa 8 bloques.")
+
+def test_redimensionar_con_locks(backend):
+    memoria = BuddySystemConcurrente(16, backend)
+    memoria.reservar_many([("a", 2), ("b", 2)])
+    assert memoria.redimensionar("a", 4)[0]
+    assert memoria.allocated["a"] == (4, 4)
+    assert memoria.redimensionar("b", 1) == (False, "Éxito: 'b' ahora ocupa 1 bloques en la dirección 2, sin moverse.")
+    assert memoria.contar_bloques() == (11, 5)
+
+def test_estres_invariante_bloques(backend):
+    """
+    Varios hilos reservan y liberan al azar mientras otro verifica que
+    bloques libres + reservados == total_blocks en todo momento.
+    """
+    memoria = BuddySystemConcurrente(TOTAL, backend, nivel_cache=2, limite_cache=4)
+    detener = threading.Event()
+    errores = []
+
+    def trabajador(indice):
+        rng = random.Random(indice)
+        vivos = []
+        try:
+            for i in range(1500):
+                if vivos and rng.random() < 0.5:
+                    nombre = vivos.pop(rng.randrange(len(vivos)))
+                    assert "Éxito" in memoria.liberar(nombre)
+                else:
+                    nombre = f"h{indice}_{i}"
+                    cantidad = rng.choice([1, 1, 2, 3, 4, 8, 30])
+                    if memoria._reservar(nombre, cantidad) >= 0:
+                        vivos.append(nombre)
+            memoria.liberar_many(vivos)
+        except Exception as e: # pragma: no cover - solo se registra para fallar la prueba
+            errores.append(e)
+
+    def verificador():
+        while not detener.is_set():
+            libres, reservados = memoria.contar_bloques()
+            if libres + reservados != TOTAL:
+                errores.append(AssertionError((libres, reservados)))
+
+    hilos = [threading.Thread(target=trabajador, args=(i,)) for i in range(8)]
+    control = threading.Thread(target=verificador)
+    control.start()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    detener.set()
+    control.join()
+
+    assert not errores
+    assert memoria.contar_bloques() == (TOTAL, 0)
+    assert memoria.stats().bloques_solicitados == 0
+    memoria.vaciar_caches()
+    assert memoria.free_list[memoria.max_level] == [0]
+
+def test_save_con_caches(tmp_path):
+    """Prueba que el guardado concurrente incluye los bloques en caché como libres."""
+    memoria = BuddySystemConcurrente(16)
+    memoria.reservar_many([("a", 1), ("b", 1)])
+    memoria.liberar("a")
+    memoria.save(tmp_path / "estado.bin")
+    restaurada = BuddySystemConcurrente.load(tmp_path / "estado.bin")
+    assert restaurada.contar_bloques() == (15, 1)
+    assert restaurada.allocated == {"b": (1, 1)}
@@ -0,0 +1,66 @@
+import pytest
+from buddy_slab import BuddySystemSlab
+from buddy_system import BuddySystem, BACKENDS, ERROR_FRAGMENTACION
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    return request.param
+
+def test_pool_se_rellena_y_acierta(backend):
+    """Prueba que un fallo rellena el pool con marca_baja bloques y los siguientes aciertan."""
+    memoria = BuddySystemSlab(32, backend, orden_max_slab=1, marca_baja=4, marca_alta=8)
+    assert memoria._reservar("a", 1) == 0
+    estadisticas = memoria.estadisticas_slab()
+    assert (estadisticas.aciertos, estadisticas.fallos, estadisticas.bloques_en_pool) == (0, 1, 3)
+    assert [memoria._reservar(n, 1) for n in "bcd"] == [1, 2, 3]
+    assert memoria.estadisticas_slab().aciertos == 3
+    assert memoria.estadisticas_slab().tasa_aciertos == pytest.approx(0.75)
+
+def test_liberar_no_fusiona_hasta_marca_alta(backend):
+    """Prueba que los bloques liberados se quedan en el pool hasta superar la marca alta."""
+    memoria = BuddySystemSlab(16, backend, orden_max_slab=0, marca_baja=2, marca_alta=4)
+    memoria.reservar_many((f"p{i}", 1) for i in range(8))
+    fusiones = memoria.free_list.fusiones
+    memoria.liberar_many([f"p{i}" for i in range(4)])
+    assert memoria.free_list.fusiones == fusiones
+    assert memoria.estadisticas_slab().bloques_en_pool == 4
+    memoria.liberar("p4") # el pool pasa de la marca alta: se devuelven 3 bloques
+    assert memoria.estadisticas_slab().bloques_en_pool == 2
+    assert memoria.free_list.fusiones > fusiones
+
+def test_stats_cuenta_pools_como_libres(backend):
+    memoria = BuddySystemSlab(16, backend, orden_max_slab=1, marca_baja=4)
+    memoria.reservar("a", 2)
+    estadisticas = memoria.stats()
+    assert estadisticas.bloques_libres == 14
+    assert sum(c * 2**i for i, c in enumerate(estadisticas.libres_por_orden)) == 14
+
+def test_vaciar_pools_ante_fragmentacion(backend):
+    """Prueba que una reserva grande recupera los bloques retenidos en los pools."""
+    memoria = BuddySystemSlab(8, backend, orden_max_slab=0, marca_baja=4, marca_alta=8)
+    memoria.reservar("a", 1)
+    memoria.liberar("a")
+    assert memoria.estadisticas_slab().bloques_en_pool == 4
+    assert memoria._reservar("grande", 8) == 0
+    assert memoria._reservar("otro", 1) == ERROR_FRAGMENTACION
+
+def test_misma_ocupacion_que_buddy_simple(backend):
+    """Prueba que las reservas grandes se comportan igual que sin capa de slabs."""
+    simple = BuddySystem(64, backend)
+    slab = BuddySystemSlab(64, backend)
+    for memoria in (simple, slab):
+        memoria.reservar_many([("a", 16), ("b", 32), ("c", 9)])
+    assert simple.allocated == slab.allocated
+
+def test_marcas_invalidas():
+    with pytest.raises(ValueError, match="marca_baja <= marca_alta"):
+        BuddySystemSlab(16, marca_baja=8, marca_alta=2)
+
+def test_save_devuelve_pools(tmp_path):
+    """Prueba que al guardar, los bloques de los pools constan como libres en el archivo."""
+    memoria = BuddySystemSlab(16, orden_max_slab=0, marca_baja=4)
+    memoria.reservar("a", 1)
+    memoria.save(tmp_path / "estado.bin")
+    restaurada = BuddySystem.load(tmp_path / "estado.bin")
+    assert restaurada.stats().bloques_libres == 15
+    assert restaurada.allocated == {"a": (0, 1)}
@@ -1,42 +1,53 @@
+import io
+import random
 import pytest
 from unittest.mock import patch
-from buddy_system import BuddySystem, main
+from buddy_system import (
+    BuddySystem, BACKENDS, NivelEnlazado, main, ejecutar_lote,
+    OK, ERROR_NOMBRE_EN_USO, ERROR_CANTIDAD_INVALIDA, ERROR_MEMORIA_INSUFICIENTE,
+    ERROR_FRAGMENTACION, ERROR_NO_ENCONTRADO,
+)
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    """Ejecuta cada prueba de lógica con todos los backends de bloques libres."""
+    return request.param
 
 # --- Pruebas para la Lógica de la Clase BuddySystem ---
 
-def test_inicializacion_potencia_de_dos():
+def test_inicializacion_potencia_de_dos(backend):
     """Prueba que el sistema se inicializa correctamente con una potencia de 2."""
-    memoria = BuddySystem(128)
+    memoria = BuddySystem(128, backend)
     assert memoria.total_blocks == 128
     assert memoria.max_level == 7
     # El bloque inicial completo debe estar libre
     assert memoria.free_list[7] == [0]
 
-def test_inicializacion_no_potencia_de_dos():
+def test_inicializacion_no_potencia_de_dos(backend):
     """Prueba que falla la inicialización si el tamaño no es potencia de 2."""
     with pytest.raises(ValueError, match="debe ser una potencia de 2 positiva"):
-        BuddySystem(100)
+        BuddySystem(100, backend)
 
-def test_reserva_simple_exitosa():
+def test_reserva_simple_exitosa(backend):
     """Prueba una reserva básica que no requiere división."""
-    memoria = BuddySystem(64)
+    memoria = BuddySystem(64, backend)
     resultado = memoria.reservar("proceso_a", 64)
     assert "Éxito" in resultado
     assert memoria.allocated["proceso_a"] == (0, 64)
     assert not memoria.free_list[6] # La lista de bloques de 64 debe estar vacía
 
-def test_reserva_con_division():
+def test_reserva_con_division(backend):
     """Prueba una reserva que requiere dividir un bloque más grande."""
-    memoria = BuddySystem(32)
+    memoria = BuddySystem(32, backend)
     memoria.reservar("proceso_b", 10) # Necesita un bloque de 16 (2^4)
     assert memoria.allocated["proceso_b"] == (0, 16)
     # Debería quedar un buddy libre de tamaño 16 en la dirección 16
     assert memoria.free_list[4] == [16]
     assert not memoria.free_list[5]
 
-def test_liberar_y_fusion_simple():
+def test_liberar_y_fusion_simple(backend):
     """Prueba que al liberar dos buddies, estos se fusionan."""
-    memoria = BuddySystem(16)
+    memoria = BuddySystem(16, backend)
     memoria.reservar("p1", 8) # Ocupa de 0 a 7
     memoria.reservar("p2", 8) # Ocupa de 8 a 15
     
@@ -48,9 +59,9 @@ def test_liberar_y_fusion_simple():
     assert not memoria.free_list[3]
     assert memoria.free_list[4] == [0] # Bloque completo de 16 libre en 0
 
-def test_liberar_sin_fusion():
+def test_liberar_sin_fusion(backend):
     """Prueba que al liberar un bloque sin su buddy libre, no hay fusión."""
-    memoria = BuddySystem(32)
+    memoria = BuddySystem(32, backend)
     memoria.reservar("p1", 8) # en 0
     memoria.reservar("p2", 8) # en 8
     memoria.reservar("p3", 16) # en 16
@@ -60,28 +71,28 @@ def test_liberar_sin_fusion():
     assert memoria.free_list[3] == [0]
     assert "p2" in memoria.allocated
 
-def test_error_nombre_duplicado():
+def test_error_nombre_duplicado(backend):
     """Prueba que no se puede reservar con un nombre ya en uso."""
-    memoria = BuddySystem(128)
+    memoria = BuddySystem(128, backend)
     memoria.reservar("proceso_unico", 20)
     resultado = memoria.reservar("proceso_unico", 10)
     assert "Error: El nombre 'proceso_unico' ya está en uso" in resultado
 
-def test_error_liberar_nombre_inexistente():
+def test_error_liberar_nombre_inexistente(backend):
     """Prueba que no se puede liberar un proceso que no existe."""
-    memoria = BuddySystem(32)
+    memoria = BuddySystem(32, backend)
     resultado = memoria.liberar("proceso_fantasma")
     assert "Error: No se encontró ninguna reserva" in resultado
 
-def test_error_memoria_insuficiente():
+def test_error_memoria_insuficiente(backend):
     """Prueba que falla si se solicita más memoria de la total."""
-    memoria = BuddySystem(16)
+    memoria = BuddySystem(16, backend)
     resultado = memoria.reservar("proceso_grande", 20)
     assert "Error: No hay suficiente memoria" in resultado
 
-def test_error_fragmentacion():
+def test_error_fragmentacion(backend):
     """Prueba el fallo por no encontrar un bloque contiguo lo suficientemente grande."""
-    memoria = BuddySystem(16)
+    memoria = BuddySystem(16, backend)
     memoria.reservar("p1", 4) # ocupa 0-3
     memoria.reservar("p2", 4) # ocupa 4-7
     memoria.reservar("p3", 8) # ocupa 8-15
@@ -90,6 +101,418 @@ def test_error_fragmentacion():
     resultado = memoria.reservar("p4", 8)
     assert "Error: No hay bloques libres que puedan satisfacer la solicitud" in resultado
 
+def test_backend_desconocido():
+    """Prueba que falla la inicialización con un backend inexistente."""
+    with pytest.raises(ValueError, match="Backend 'pila' desconocido"):
+        BuddySystem(16, "pila")
+
+def test_nivel_enlazado_conserva_orden():
+    """Prueba que el nivel enlazado se comporta como una lista FIFO con borrado O(1)."""
+    nivel = NivelEnlazado()
+    for address in (8, 0, 24, 16):
+        nivel.agregar(address)
+    assert nivel.quitar(24)
+    assert not nivel.quitar(24)
+    assert nivel == [8, 0, 16]
+    assert nivel.tomar() == 8
+    assert nivel.quitar(16)
+    assert nivel == [0] and len(nivel) == 1 and 0 in nivel
+    assert nivel.tomar() == 0
+    assert not nivel
+    with pytest.raises(IndexError):
+        nivel.tomar()
+
+def test_backends_equivalentes():
+    """Prueba que los backends de listas producen las mismas direcciones para una secuencia mixta."""
+    resultados = []
+    for backend in ("lista", "enlazada"):
+        memoria = BuddySystem(64, backend)
+        salida = []
+        for i, cantidad in enumerate([3, 8, 1, 16, 2, 4]):
+            salida.append(memoria.reservar(f"p{i}", cantidad))
+        for i in (1, 4, 0):
+            salida.append(memoria.liberar(f"p{i}"))
+        salida.append(memoria.reservar("q", 8))
+        resultados.append((salida, [sorted(nivel) for nivel in memoria.free_list]))
+    assert all(r == resultados[0] for r in resultados)
+
+def test_invariantes_secuencia_aleatoria(backend):
+    """Prueba que libres + reservados cubren la memoria sin solaparse tras muchas operaciones."""
+    rng = random.Random(7)
+    memoria = BuddySystem(256, backend)
+    vivos = []
+    for i in range(2000):
+        if vivos and rng.random() < 0.45:
+            memoria.liberar(vivos.pop(rng.randrange(len(vivos))))
+        elif "Éxito" in memoria.reservar(f"p{i}", rng.randint(1, 40)):
+            vivos.append(f"p{i}")
+        intervalos = [(addr, size) for addr, size in memoria.allocated.values()]
+        for level, nivel in enumerate(memoria.free_list):
+            intervalos.extend((addr, 2**level) for addr in nivel)
+        intervalos.sort()
+        assert sum(size for _, size in intervalos) == 256
+        estadisticas = memoria.stats()
+        assert list(estadisticas.libres_por_orden) == [len(nivel) for nivel in memoria.free_list]
+        assert estadisticas.bloques_reservados == sum(size for _, size in memoria.allocated.values())
+        assert all(a + s == b for (a, s), (b, _) in zip(intervalos, intervalos[1:]))
+    for nombre in vivos:
+        memoria.liberar(nombre)
+    assert memoria.free_list[8] == [0]
+
+def test_arbol_huella_memoria_menor_que_lista():
+    """Prueba que el árbol empaquetado ocupa menos que las listas con la memoria fragmentada."""
+    huellas = {}
+    for backend in ("lista", "arbol"):
+        memoria = BuddySystem(2**12, backend)
+        for i in range(2**12):
+            memoria.reservar(f"p{i}", 1)
+        for i in range(0, 2**12, 2):
+            memoria.liberar(f"p{i}")
+        assert len(memoria.free_list[0]) == 2**11
+        huellas[backend] = memoria.free_list.huella_memoria()
+    assert huellas["arbol"] < huellas["lista"]
+
+def test_reservar_many_direcciones_y_codigos(backend):
+    """Prueba que la reserva en lote devuelve direcciones o códigos de error por solicitud."""
+    memoria = BuddySystem(16, backend)
+    resultados = memoria.reservar_many([
+        ("a", 4), ("b", 4), ("a", 1), ("c", 0), ("d", 32), ("e", 8), ("f", 8),
+    ])
+    assert resultados == [
+        0, 4, ERROR_NOMBRE_EN_USO, ERROR_CANTIDAD_INVALIDA,
+        ERROR_MEMORIA_INSUFICIENTE, 8, ERROR_FRAGMENTACION,
+    ]
+    assert memoria.allocated["e"] == (8, 8)
+
+def test_liberar_many_fusiona_en_cascada(backend):
+    """Prueba que la liberación en lote fusiona todos los buddies hasta el bloque completo."""
+    memoria = BuddySystem(32, backend)
+    nombres = [f"p{i}" for i in range(8)]
+    assert memoria.reservar_many((nombre, 4) for nombre in nombres) == list(range(0, 32, 4))
+    resultados = memoria.liberar_many(list(reversed(nombres)) + ["p0", "fantasma"])
+    assert resultados == [OK] * 8 + [ERROR_NO_ENCONTRADO, ERROR_NO_ENCONTRADO]
+    assert not memoria.allocated
+    assert memoria.free_list[5] == [0]
+    assert all(not memoria.free_list[i] for i in range(5))
+
+def test_stats_contadores(backend):
+    """Prueba que stats refleja reservas, fragmentación interna y libres por orden."""
+    memoria = BuddySystem(32, backend)
+    estadisticas = memoria.stats()
+    assert estadisticas.bloques_libres == 32 and estadisticas.reservas == 0
+    assert estadisticas.orden_libre_maximo == 5
+    assert estadisticas.libres_por_orden == (0, 0, 0, 0, 0, 1)
+
+    memoria.reservar("a", 3)   # bloque de 4 en 0
+    memoria.reservar("b", 10)  # bloque de 16 en 16
+    estadisticas = memoria.stats()
+    assert estadisticas.bloques_reservados == 20
+    assert estadisticas.bloques_solicitados == 13
+    assert estadisticas.fragmentacion_interna == 7
+    assert estadisticas.bloques_libres == 12
+    assert estadisticas.reservas == 2
+    assert estadisticas.libres_por_orden == (0, 0, 1, 1, 0, 0)
+    assert estadisticas.orden_libre_maximo == 3
+
+    memoria.liberar_many(["a", "b"])
+    memoria.reservar("c", 32)
+    estadisticas = memoria.stats()
+    assert estadisticas.fragmentacion_interna == 0
+    assert estadisticas.bloques_libres == 0
+    assert estadisticas.orden_libre_maximo == -1
+
+# --- Pruebas de redimensionar ---
+
+def _intervalos_cubren(memoria):
+    """True si libres + reservados cubren la memoria sin huecos ni solapamientos."""
+    intervalos = [(addr, size) for addr, size in memoria.allocated.values()]
+    for level, nivel in enumerate(memoria.free_list):
+        intervalos.extend((addr, 2**level) for addr in nivel)
+    intervalos.sort()
+    return (sum(size for _, size in intervalos) == memoria.total_blocks
+            and all(a + s == b for (a, s), (b, _) in zip(intervalos, intervalos[1:])))
+
+def test_redimensionar_crece_en_su_lugar(backend):
+    """Prueba que al crecer se absorben los buddies libres sin mover el bloque."""
+    memoria = BuddySystem(32, backend)
+    memoria.reservar("a", 3)  # bloque de 4 en 0; libres 4, 8 y 16
+    movido, mensaje = memoria.redimensionar("a", 13)
+    assert not movido and "sin moverse" in mensaje
+    assert memoria.allocated["a"] == (0, 16)
+    assert memoria.free_list[4] == [16]
+    assert all(not memoria.free_list[i] for i in range(4))
+    estadisticas = memoria.stats()
+    assert estadisticas.bloques_solicitados == 13 and estadisticas.fusiones == 2
+    assert _intervalos_cubren(memoria)
+
+def test_redimensionar_encoge_y_libera_mitades(backend):
+    """Prueba que al encoger el bloque se divide y las mitades sobrantes vuelven a las listas de libres."""
+    memoria = BuddySystem(32, backend)
+    memoria.reservar("a", 16)
+    assert memoria.redimensionar("a", 2) == (False, "Éxito: 'a' ahora ocupa 2 bloques en la dirección 0, sin moverse.")
+    assert memoria.allocated["a"] == (0, 2)
+    assert [sorted(memoria.free_list[i]) for i in range(5)] == [[], [2], [4], [8], [16]]
+    assert _intervalos_cubren(memoria)
+    memoria.liberar("a")
+    assert memoria.free_list[5] == [0]
+
+def test_redimensionar_mueve_si_no_puede_crecer(backend):
+    """Prueba que un buddy superior ocupado obliga a mover el bloque."""
+    memoria = BuddySystem(32, backend)
+    memoria.reservar_many([("a", 4), ("b", 4)])
+    movido, mensaje = memoria.redimensionar("a", 8)
+    assert movido
+    assert mensaje == "Éxito: 'a' se movió de la dirección 0 a la 8 y ahora ocupa 8 bloques."
+    assert memoria.allocated["a"] == (8, 8)
+    assert _intervalos_cubren(memoria)
+    # "b" está en el buddy superior de su nivel: no puede crecer en su lugar.
+    assert memoria.redimensionar("b", 8)[0]
+
+def test_redimensionar_errores_conservan_la_reserva(backend):
+    memoria = BuddySystem(16, backend)
+    memoria.reservar_many([("a", 4), ("b", 4), ("c", 8)])
+    assert memoria._redimensionar("x", 2) == ERROR_NO_ENCONTRADO
+    assert memoria._redimensionar("a", 0) == ERROR_CANTIDAD_INVALIDA
+    assert memoria._redimensionar("a", 17) == ERROR_MEMORIA_INSUFICIENTE
+    assert memoria.redimensionar("a", 8) == (
+        False, "Error: No hay bloques libres que puedan satisfacer la solicitud (memoria fragmentada).")
+    assert memoria.allocated["a"] == (0, 4)
+    assert memoria.stats().bloques_solicitados == 16
+    assert _intervalos_cubren(memoria)
+
+def test_redimensionar_secuencia_aleatoria(backend):
+    """Prueba que las invariantes se mantienen mezclando reservas, liberaciones y redimensiones."""
+    rng = random.Random(11)
+    memoria = BuddySystem(256, backend)
+    vivos = []
+    for i in range(1500):
+        opcion = rng.random()
+        if vivos and opcion < 0.3:
+            memoria.liberar(vivos.pop(rng.randrange(len(vivos))))
+        elif vivos and opcion < 0.7:
+            nombre = rng.choice(vivos)
+            anterior = memoria.allocated[nombre][0]
+            movido, _ = memoria.redimensionar(nombre, rng.randint(1, 64))
+            assert movido == (memoria.allocated[nombre][0] != anterior)
+        elif "Éxito" in memoria.reservar(f"p{i}", rng.randint(1, 40)):
+            vivos.append(f"p{i}")
+        assert _intervalos_cubren(memoria)
+        assert list(memoria.stats().libres_por_orden) == [len(nivel) for nivel in memoria.free_list]
+    memoria.liberar_many(vivos)
+    assert memoria.free_list[8] == [0]
+
+# --- Pruebas con espacios de direcciones enormes ---
+
+@pytest.mark.parametrize("backend_disperso", ["lista", "enlazada"])
+def test_espacio_de_2_a_la_64(backend_disperso):
+    """Prueba órdenes exactos donde math.log2 con flotantes redondea mal (2**53 + 1)."""
+    memoria = BuddySystem(2**64, backend_disperso)
+    assert memoria.max_level == 64
+    memoria.reservar("a", 2**53 + 1)
+    assert memoria.allocated["a"] == (0, 2**54)
+    memoria.reservar("b", 1)
+    assert memoria.allocated["b"] == (2**54, 1)
+    memoria.reservar("c", 2**63)
+    assert memoria.allocated["c"] == (2**63, 2**63)
+    # Solo existen los buddies libres de las divisiones, no 2**64 entradas.
+    assert sum(memoria.stats().libres_por_orden) == 9 + 54 - 1
+    assert memoria.stats().fragmentacion_interna == 2**54 - 2**53 - 1
+    memoria.liberar_many(["a", "b", "c"])
+    assert memoria.free_list[64] == [0]
+    assert sum(len(nivel) for nivel in memoria.free_list) == 1
+
+def test_espacio_de_2_a_la_200():
+    memoria = BuddySystem(2**200, "enlazada")
+    assert memoria.reservar("todo", 2**200 - 5).startswith(f"Éxito: Se reservaron {2**200}")
+    assert "No hay suficiente memoria" in memoria.reservar("mas", 2**200 + 1)
+    memoria.liberar("todo")
+    for i in range(100):
+        memoria.reservar(f"p{i}", 3 * 2**i + 1)
+    assert memoria.stats().bloques_reservados == sum(2**(i + 2) for i in range(100))
+
+def test_arbol_rechaza_arenas_enormes():
+    with pytest.raises(ValueError, match="use 'lista' o 'enlazada'"):
+        BuddySystem(2**64, "arbol")
+    with pytest.raises(ValueError, match="como máximo 2\\*\\*32 bloques"):
+        BuddySystem(2**33, "arbol")
+
+def test_save_rechaza_arenas_de_2_a_la_64(tmp_path):
+    """Prueba el límite documentado del formato binario: direcciones de 64 bits."""
+    with pytest.raises(ValueError, match="hasta 2\\*\\*63 bloques"):
+        BuddySystem(2**64, "enlazada").save(tmp_path / "estado.bin")
+    memoria = BuddySystem(2**63, "enlazada")
+    memoria.reservar("a", 2**62 + 1)
+    memoria.save(tmp_path / "estado.bin")
+    assert _estado(BuddySystem.load(tmp_path / "estado.bin")) == _estado(memoria)
+
+# --- Pruebas de guardado y restauración binaria ---
+
+def _estado(memoria):
+    return memoria.allocated, [list(nivel) for nivel in memoria.free_list], memoria.stats()[:8]
+
+def test_save_load_ida_y_vuelta(backend, tmp_path):
+    """Prueba que el estado restaurado es idéntico y se comporta igual que el original."""
+    rng = random.Random(11)
+    memoria = BuddySystem(512, backend)
+    vivos = []
+    for i in range(600):
+        if vivos and rng.random() < 0.4:
+            memoria.liberar(vivos.pop(rng.randrange(len(vivos))))
+        elif memoria._reservar(f"proc_ñ{i}", rng.randint(1, 20)) >= 0:
+            vivos.append(f"proc_ñ{i}")
+    path = tmp_path / "estado.bin"
+    memoria.save(path)
+    restaurada = BuddySystem.load(path)
+    assert restaurada.backend == backend
+    assert _estado(restaurada) == _estado(memoria)
+    for m in (memoria, restaurada):
+        m.reservar_many((f"nuevo{i}", i % 7 + 1) for i in range(40))
+        m.liberar_many(vivos[:30])
+    assert _estado(restaurada) == _estado(memoria)
+
+def test_load_con_otro_backend(tmp_path):
+    """Prueba que un estado guardado con listas puede cargarse en el árbol empaquetado."""
+    memoria = BuddySystem(64)
+    memoria.reservar_many([("a", 3), ("b", 16), ("c", 1)])
+    memoria.liberar("a")
+    memoria.save(tmp_path / "estado.bin")
+    arbol = BuddySystem.load(tmp_path / "estado.bin", backend="arbol")
+    assert arbol.allocated == memoria.allocated
+    assert [sorted(nivel) for nivel in arbol.free_list] == [sorted(nivel) for nivel in memoria.free_list]
+    assert arbol.stats().libres_por_orden == memoria.stats().libres_por_orden
+    arbol.liberar_many(["b", "c"])
+    assert arbol.free_list[6] == [0]
+
+def test_load_estado_vacio_y_errores(tmp_path):
+    """Prueba la validación de cabecera, versión y suma de verificación."""
+    path = tmp_path / "estado.bin"
+    BuddySystem(8).save(path)
+    assert BuddySystem.load(path).free_list[3] == [0]
+
+    datos = bytearray(path.read_bytes())
+    datos[-1] ^= 0xFF
+    path.write_bytes(bytes(datos))
+    with pytest.raises(ValueError, match="suma de verificación"):
+        BuddySystem.load(path)
+
+    path.write_bytes(b"XXXX" + bytes(datos[4:]))
+    with pytest.raises(ValueError, match="no es un estado"):
+        BuddySystem.load(path)
+
+    datos[4] = 99 # versión
+    path.write_bytes(bytes(datos))
+    with pytest.raises(ValueError, match="Versión de formato 99"):
+        BuddySystem.load(path)
+
+    path.write_bytes(bytes(datos[:20]))
+    with pytest.raises(ValueError, match="truncado"):
+        BuddySystem.load(path)
+
+def test_save_nombre_invalido(tmp_path):
+    memoria = BuddySystem(8)
+    memoria.reservar(42, 1)
+    with pytest.raises(ValueError, match="No se puede guardar el nombre 42"):
+        memoria.save(tmp_path / "estado.bin")
+
+# --- Pruebas de la arena de memoria real ---
+
+@pytest.mark.parametrize("arena", ["bytearray", "mmap"])
+def test_arena_vistas_sin_copia(arena):
+    """Prueba que las vistas escriben directamente sobre la arena y no se solapan."""
+    memoria = BuddySystem(16, arena=arena, block_size=4)
+    a = memoria.reservar_vista("a", 3) # bloque de 4 en la dirección 0
+    b = memoria.reservar_vista("b", 2) # bloque de 2 en la dirección 4
+    assert len(a) == 16 and len(b) == 8
+    a[:] = b"A" * 16
+    b[:] = b"B" * 8
+    assert bytes(memoria.arena[:24]) == b"A" * 16 + b"B" * 8
+    otra = memoria.vista("a")
+    assert otra is not a and otra == a
+    memoria.cerrar()
+
+def test_arena_vista_invalida_al_liberar():
+    """Prueba que liberar la reserva invalida el memoryview entregado."""
+    memoria = BuddySystem(16, arena="bytearray")
+    vista = memoria.reservar_vista("a", 4)
+    vista[0] = 7
+    memoria.liberar("a")
+    with pytest.raises(ValueError):
+        vista[0]
+    otra = memoria.reservar_vista("b", 4)
+    assert otra[0] == 7 # la memoria no se limpia, solo se reutiliza
+    memoria.liberar_many(["b"])
+    with pytest.raises(ValueError):
+        otra[0] = 1
+
+def test_arena_vista_nueva_por_llamada():
+    """Prueba que liberar la vista de un llamador no afecta a las de los demás."""
+    memoria = BuddySystem(8, arena="bytearray")
+    with memoria.reservar_vista("a", 4) as vista:
+        vista[0] = 1
+    memoria.vista("a").release()
+    segunda = memoria.vista("a")
+    assert segunda[0] == 1
+    memoria.liberar("a")
+    with pytest.raises(ValueError):
+        segunda[0]
+
+def test_arena_cerrar_con_cortes_vivos():
+    """
+    Prueba que los cortes tomados de una vista no se revocan al liberar y que
+    `cerrar` sobre un mmap falla con un error claro mientras existan.
+    """
+    memoria = BuddySystem(8, arena="mmap")
+    corte = memoria.reservar_vista("a", 4)[1:3]
+    memoria.liberar("a")
+    corte[0] = 9 # el corte sigue apuntando a la arena
+    assert memoria.arena[1] == 9
+    with pytest.raises(BufferError, match="cortes de sus vistas en uso"):
+        memoria.cerrar()
+    assert bytes(memoria.reservar_vista("b", 2)) == b"\0\t"
+    corte.release()
+    memoria.cerrar()
+    assert memoria.arena.closed
+    memoria.cerrar()
+
+def test_arena_vista_de_reserva_normal():
+    """Prueba que una reserva hecha con `reservar` también expone su vista."""
+    memoria = BuddySystem(8, arena="bytearray", block_size=2)
+    memoria.reservar("a", 3)
+    assert len(memoria.vista("a")) == 8
+    with pytest.raises(KeyError):
+        memoria.vista("fantasma")
+
+def test_arena_errores():
+    """Prueba los errores de configuración y de reserva con vistas."""
+    with pytest.raises(ValueError, match="Arena 'disco' desconocida"):
+        BuddySystem(8, arena="disco")
+    with pytest.raises(ValueError, match="tamaño de bloque"):
+        BuddySystem(8, arena="bytearray", block_size=0)
+    with pytest.raises(ValueError, match="no tiene una arena"):
+        BuddySystem(8).reservar_vista("a", 1)
+    memoria = BuddySystem(8, arena="bytearray")
+    memoria.reservar_vista("a", 8)
+    with pytest.raises(ValueError, match="ya está en uso"):
+        memoria.reservar_vista("a", 1)
+    with pytest.raises(MemoryError, match="memoria fragmentada"):
+        memoria.reservar_vista("b", 1)
+
+def test_arena_redimensionar_conserva_datos():
+    """Prueba que los datos sobreviven a crecer en su lugar, encoger y mover el bloque."""
+    memoria = BuddySystem(16, arena="bytearray", block_size=2)
+    vista = memoria.reservar_vista("a", 2)
+    vista[:] = b"abcd"
+    memoria.redimensionar("a", 4)
+    with pytest.raises(ValueError):
+        vista[0]
+    assert bytes(memoria.vista("a")) == b"abcd\0\0\0\0"
+    memoria.reservar("b", 4)
+    assert memoria.redimensionar("a", 8)[0]
+    assert memoria.allocated["a"] == (8, 8)
+    assert bytes(memoria.vista("a")[:4]) == b"abcd"
+    memoria.redimensionar("a", 1)
+    assert bytes(memoria.vista("a")) == b"ab"
+
 # --- Pruebas para la Interfaz de Usuario (función main) ---
 
 def test_main_argumento_faltante(capsys):
@@ -134,9 +557,112 @@ def test_main_flujo_completo_simulado(capsys):
     assert "Manejador de memoria iniciado con 32 bloques" in captured.out
     assert "Éxito: Se reservaron 16 bloques para 'p1'" in captured.out
     assert "ESTADO DE LA MEMORIA" in captured.out
+    assert "Memoria del backend 'lista'" in captured.out
     assert "Éxito: Se liberó la memoria de 'p1'" in captured.out
     assert "Error: Comando 'COMANDO_INVALIDO' no reconocido" in captured.out
     assert "Error: La cantidad debe ser un número entero." in captured.out
     assert "Error: Formato incorrecto. Uso: RESERVAR <cantidad> <nombre>" in captured.out
     assert "Error: Formato incorrecto. Uso: LIBERAR <nombre>" in captured.out
-    assert "Saliendo del programa." in captured.out
\ No newline at end of file
+    assert "Saliendo del programa." in captured.out
+
+# --- Pruebas del modo por lotes ---
+
+GUION = """RESERVAR 10 p1
+reservar 4 P2
+
+LIBERAR p1
+RESERVAR 64 grande
+LIBERAR fantasma
+RESERVAR x p3
+BORRAR p2
+MOSTRAR
+SALIR
+RESERVAR 1 despues_de_salir
+"""
+
+def test_ejecutar_lote_salida_completa(capsys):
+    """Prueba que el modo por lotes produce los mismos mensajes que el interactivo."""
+    memoria = BuddySystem(32)
+    contadores = ejecutar_lote(memoria, GUION.splitlines(), tamano_buffer=2)
+    salida = capsys.readouterr().out
+    assert contadores == {"comandos": 9, "reservas": 2, "liberaciones": 1, "errores": 4}
+    lineas = salida.splitlines()
+    assert lineas[:2] == [
+        "Éxito: Se reservaron 16 bloques para 'p1' en la dirección 0.",
+        "Éxito: Se reservaron 4 bloques para 'p2' en la dirección 16.",
+    ]
+    assert "Error: No hay suficiente memoria para reservar 64 bloques." in lineas
+    assert "Error: No se encontró ninguna reserva con el nombre 'fantasma'." in lineas
+    assert "Error: La cantidad debe ser un número entero." in lineas
+    assert "Error: Comando 'BORRAR' no reconocido." in lineas
+    # Lo acumulado se escribe antes del estado de MOSTRAR.
+    assert salida.index("no reconocido") < salida.index("ESTADO DE LA MEMORIA")
+    assert "despues_de_salir" not in memoria.allocated
+
+def test_ejecutar_lote_resumen_solo_errores():
+    """Prueba que el modo resumen solo escribe los errores con su número de línea."""
+    salida = io.StringIO()
+    memoria = BuddySystem(32)
+    ejecutar_lote(memoria, GUION.splitlines(), salida=salida, resumen=True)
+    lineas = salida.getvalue().splitlines()
+    assert lineas[:4] == [
+        "Línea 5: Error: No hay suficiente memoria para reservar 64 bloques.",
+        "Línea 6: Error: No se encontró ninguna reserva con el nombre 'fantasma'.",
+        "Línea 7: Error: La cantidad debe ser un número entero.",
+        "Línea 8: Error: Comando 'BORRAR' no reconocido.",
+    ]
+    # MOSTRAR es una petición explícita: también se escribe en modo resumen.
+    assert lineas[5] == "ESTADO DE LA MEMORIA"
+
+def test_ejecutar_lote_mostrar_en_salida(capsys):
+    """Prueba que MOSTRAR escribe el estado en `salida`, en orden con el resto, y no en stdout."""
+    salida = io.StringIO()
+    memoria = BuddySystem(8, backend="arbol")
+    ejecutar_lote(memoria, ["RESERVAR 3 a", "MOSTRAR", "LIBERAR a"], salida=salida, tamano_buffer=10)
+    assert capsys.readouterr().out == ""
+    esperado = io.StringIO()
+    esperado.write("Éxito: Se reservaron 4 bloques para 'a' en la dirección 0.\n")
+    memoria_esperada = BuddySystem(8, backend="arbol")
+    memoria_esperada.reservar("a", 3)
+    memoria_esperada.mostrar(esperado)
+    esperado.write("Éxito: Se liberó la memoria de 'a'.\n")
+    assert salida.getvalue() == esperado.getvalue()
+    assert "  - a: tamaño=4, dirección=0" in salida.getvalue()
+
+def test_main_batch_archivo_resumen(tmp_path, capsys):
+    path = tmp_path / "guion.txt"
+    path.write_text("".join(f"RESERVAR 1 p{i}\n" for i in range(20)) + "LIBERAR p3\nLIBERAR p3\n")
+    with patch('sys.argv', ['buddy_system.py', '32', '--batch', str(path), '--resumen']):
+        main()
+    salida = capsys.readouterr().out
+    assert "Línea 22: Error: No se encontró ninguna reserva con el nombre 'p3'." in salida
+    assert "Resumen: 22 comandos" in salida
+    assert "20 reservas, 1 liberaciones, 1 errores" in salida
+    assert "19 bloques reservados, 13 libres" in salida
+    assert "Manejador de memoria iniciado" not in salida
+
+def test_main_batch_stdin(capsys):
+    with patch('sys.argv', ['buddy_system.py', '16', '--batch', '-']):
+        with patch('sys.stdin', io.StringIO("RESERVAR 3 a\nLIBERAR a\n")):
+            main()
+    assert capsys.readouterr().out.splitlines() == [
+        "Éxito: Se reservaron 4 bloques para 'a' en la dirección 0.",
+        "Éxito: Se liberó la memoria de 'a'.",
+    ]
+
+@pytest.mark.parametrize("argv", [
+    ['buddy_system.py', '16', '--resumen'],
+    ['buddy_system.py', '16', '--batch'],
+    ['buddy_system.py', '16', '--otro'],
+])
+def test_main_batch_argumentos_invalidos(argv, capsys):
+    with pytest.raises(SystemExit):
+        with patch('sys.argv', argv):
+            main()
+    assert "Uso: python buddy_system.py <cantidad_de_bloques> [--batch" in capsys.readouterr().out
+
+def test_main_batch_archivo_inexistente(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        with patch('sys.argv', ['buddy_system.py', '16', '--batch', str(tmp_path / "no.txt")]):
+            main()
+    assert "No se pudo leer el archivo de comandos" in capsys.readouterr().out
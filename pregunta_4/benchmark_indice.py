@@ -0,0 +1,96 @@
+# benchmark_indice.py
+import argparse
+import random
+import sys
+import time
+from collections import namedtuple
+
+from vector import Vector3D
+from indice_espacial import ArbolKD, vecinos_fuerza_bruta, radio_fuerza_bruta, caja_fuerza_bruta
+
+# Tiempos en milisegundos por consulta; `aceleracion` = fuerza bruta / árbol.
+Resultado = namedtuple("Resultado", [
+    "puntos", "consulta", "construccion_s", "arbol_ms", "fuerza_bruta_ms", "aceleracion",
+])
+
+
+def generar_puntos(cantidad, semilla=0):
+    """Nube de puntos uniforme en el cubo [0, 1000)^3."""
+    rng = random.Random(semilla)
+    escala = 1000.0
+    return [Vector3D(rng.random() * escala, rng.random() * escala, rng.random() * escala) for _ in range(cantidad)]
+
+
+def _ms_por_consulta(funcion, consultas):
+    inicio = time.perf_counter()
+    for consulta in consultas:
+        funcion(consulta)
+    return (time.perf_counter() - inicio) / len(consultas) * 1000
+
+
+def comparar(cantidad, consultas=200, consultas_fuerza_bruta=5, k=10, semilla=0):
+    """
+    Construye un ArbolKD con `cantidad` puntos y mide k vecinos, radio y caja
+    contra la fuerza bruta. La fuerza bruta usa menos consultas (es O(N) cada una).
+    Los radios y cajas se ajustan para contener ~k puntos en promedio.
+    """
+    puntos = generar_puntos(cantidad, semilla)
+    rng = random.Random(semilla + 1)
+    centros = [Vector3D(rng.random() * 1000, rng.random() * 1000, rng.random() * 1000) for _ in range(consultas)]
+    # Volumen que contiene ~k puntos: lado de la caja y radio de la esfera equivalentes.
+    volumen = k / cantidad * 1000.0**3
+    lado = volumen ** (1 / 3)
+    radio = (3 * volumen / (4 * 3.141592653589793)) ** (1 / 3)
+
+    inicio = time.perf_counter()
+    arbol = ArbolKD(puntos)
+    construccion = time.perf_counter() - inicio
+
+    mediciones = {
+        "knn": (lambda c: arbol.vecinos_cercanos(c, k), lambda c: vecinos_fuerza_bruta(puntos, c, k)),
+        "radio": (lambda c: arbol.en_radio(c, radio), lambda c: radio_fuerza_bruta(puntos, c, radio)),
+        "caja": (lambda c: arbol.en_caja(c, c + lado), lambda c: caja_fuerza_bruta(puntos, c, c + lado)),
+    }
+    resultados = []
+    for nombre, (con_arbol, fuerza_bruta) in mediciones.items():
+        arbol_ms = _ms_por_consulta(con_arbol, centros)
+        bruta_ms = _ms_por_consulta(fuerza_bruta, centros[:consultas_fuerza_bruta])
+        resultados.append(Resultado(cantidad, nombre, construccion, arbol_ms, bruta_ms, bruta_ms / arbol_ms))
+    return resultados
+
+
+def formatear_tabla(resultados):
+    """Tabla de texto con una fila por (cantidad de puntos, consulta)."""
+    encabezado = (
+        f"{'puntos':>9} {'consulta':<8} {'carga s':>8} {'arbol ms':>10} {'bruta ms':>10} {'aceleracion':>12}"
+    )
+    filas = [encabezado, "-" * len(encabezado)]
+    for r in resultados:
+        filas.append(
+            f"{r.puntos:>9} {r.consulta:<8} {r.construccion_s:>8.2f} {r.arbol_ms:>10.3f} "
+            f"{r.fuerza_bruta_ms:>10.2f} {r.aceleracion:>11.0f}x"
+        )
+    return "\n".join(filas)
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos del benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark del índice espacial contra la fuerza bruta.")
+    parser.add_argument("--puntos", type=int, nargs="+", default=[10**4, 10**5, 10**6])
+    parser.add_argument("--consultas", type=int, default=200, help="consultas por medición con el árbol")
+    parser.add_argument("--consultas-bruta", type=int, default=5, help="consultas por medición con fuerza bruta")
+    parser.add_argument("-k", type=int, default=10, help="vecinos por consulta (y puntos esperados en radio/caja)")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if min(args.puntos) <= 0 or args.consultas <= 0 or args.consultas_bruta <= 0 or args.k <= 0:
+        print("Error: Las cantidades de puntos, consultas y k deben ser positivas.")
+        sys.exit(1)
+    resultados = []
+    for cantidad in args.puntos:
+        resultados += comparar(cantidad, args.consultas, min(args.consultas_bruta, args.consultas), args.k, args.semilla)
+    print(formatear_tabla(resultados))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmark_reducciones.py
+import argparse
+import os
+import random
+import sys
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from reducciones import VectoresCompartidos, sumar_vectores, normas, productos_punto
+
+# `aceleracion` = tiempo con la menor cantidad de trabajadores medida (normalmente 1) / tiempo con
+# `trabajadores`; `eficiencia` = aceleracion dividida por cuántas veces más trabajadores hay que en esa base.
+Resultado = namedtuple("Resultado", ["operacion", "trabajadores", "segundos", "aceleracion", "eficiencia"])
+
+OPERACIONES = {
+    "suma": lambda a, b, pool: sumar_vectores(a, pool=pool),
+    "normas": lambda a, b, pool: normas(a, pool=pool),
+    "punto": lambda a, b, pool: productos_punto(a, b, pool=pool),
+}
+
+
+def generar_compartidos(cantidad, semilla=0):
+    """Bloque compartido con `cantidad` vectores aleatorios en [-1, 1)^3."""
+    rng = random.Random(semilla)
+    return VectoresCompartidos.desde_buffer(array("d", [rng.random() * 2 - 1 for _ in range(3 * cantidad)]))
+
+
+def medir(cantidad, trabajadores, operaciones=tuple(OPERACIONES), repeticiones=3, semilla=0):
+    """
+    Mide cada operación sobre `cantidad` vectores con cada cantidad de trabajadores
+    (la mejor de `repeticiones`). El pool se crea antes de medir, así que el
+    arranque de los procesos no entra en el tiempo.
+    """
+    resultados = []
+    with generar_compartidos(cantidad, semilla) as a, generar_compartidos(cantidad, semilla + 1) as b:
+        for operacion in operaciones:
+            funcion = OPERACIONES[operacion]
+            base = None
+            for n in trabajadores:
+                with ProcessPoolExecutor(max_workers=n) as pool:
+                    funcion(a, b, pool) # calentamiento: arranca los procesos
+                    mejor = float("inf")
+                    for _ in range(repeticiones):
+                        inicio = time.perf_counter()
+                        funcion(a, b, pool)
+                        mejor = min(mejor, time.perf_counter() - inicio)
+                if base is None:
+                    base = mejor
+                aceleracion = base / mejor
+                resultados.append(Resultado(operacion, n, mejor, aceleracion, aceleracion * trabajadores[0] / n))
+    return resultados
+
+
+def formatear_tabla(resultados):
+    """Tabla de texto con una fila por (operación, trabajadores)."""
+    encabezado = f"{'operacion':<10} {'trabajadores':>12} {'segundos':>10} {'aceleracion':>12} {'eficiencia':>11}"
+    filas = [encabezado, "-" * len(encabezado)]
+    for r in resultados:
+        filas.append(
+            f"{r.operacion:<10} {r.trabajadores:>12} {r.segundos:>10.3f} {r.aceleracion:>11.2f}x {r.eficiencia:>10.0%}"
+        )
+    return "\n".join(filas)
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos del benchmark."""
+    nucleos = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Aceleración de las reducciones paralelas según los trabajadores.")
+    parser.add_argument("--vectores", type=int, default=10**7)
+    parser.add_argument("--trabajadores", type=int, nargs="+",
+                        default=sorted({1, 2, 4, 8, nucleos} & set(range(1, nucleos + 1))))
+    parser.add_argument("--operaciones", nargs="+", choices=list(OPERACIONES), default=list(OPERACIONES))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.vectores <= 0 or min(args.trabajadores) <= 0 or args.repeticiones <= 0:
+        print("Error: Las cantidades de vectores, trabajadores y repeticiones deben ser positivas.")
+        sys.exit(1)
+    print(f"{args.vectores} vectores, {nucleos} núcleos disponibles")
+    if max(args.trabajadores) > nucleos:
+        print(f"Aviso: hay más trabajadores ({max(args.trabajadores)}) que núcleos ({nucleos}); "
+              "la aceleración medida con más trabajadores que núcleos no refleja el escalado.")
+    resultados = medir(args.vectores, sorted(set(args.trabajadores)), args.operaciones, args.repeticiones, args.semilla)
+    print(formatear_tabla(resultados))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# benchmark_vector.py
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from collections import namedtuple
+
+from vector import Vector3D
+from vector_fusionado import fusionar
+
+# Operaciones medidas: nombre -> sentencia que deja el resultado en `r`.
+# En cada iteración `a` y `b` son vectores distintos y `s` un escalar float.
+OPERACIONES = {
+    "construccion": "r = Vector3D(s, s, s)",
+    "suma_vector": "r = a + b",
+    "suma_escalar": "r = a + s",
+    "resta_vector": "r = a - b",
+    "resta_escalar": "r = a - s",
+    "producto_cruz": "r = a * b",
+    "producto_escalar": "r = a * s",
+    "producto_punto": "r = a % b",
+    "norma": "r = abs(a)",
+    "radd": "r = s + a",
+    "rsub": "r = s - a",
+    "rmul": "r = s * a",
+    "suma_en_su_lugar": "a += b; r = a",
+    # La misma expresión en modo normal y compilada con `fusionar`.
+    "expr": "r = (a + b) * a % b - s",
+    "expr_fusionada": "r = expr_fusionada(a, b, s)",
+}
+
+# Nombres disponibles para las sentencias.
+_ENTORNO = {
+    "Vector3D": Vector3D,
+    "expr_fusionada": fusionar(lambda a, b, s: (a + b) * a % b - s, escalares=("s",)),
+}
+
+# Costo del propio bucle, que se descuenta del tiempo de cada operación.
+_BASE = "r = a"
+
+Resultado = namedtuple("Resultado", ["operacion", "tamano_lote", "ns_por_op", "asignaciones_por_op"])
+
+
+def generar_datos(tamano, semilla=0):
+    """Lista de `tamano` tuplas (a, b, s) con vectores y escalares aleatorios."""
+    rng = random.Random(semilla)
+    coordenada = rng.random
+    return [
+        (Vector3D(coordenada(), coordenada(), coordenada()),
+         Vector3D(coordenada(), coordenada(), coordenada()),
+         coordenada())
+        for _ in range(tamano)
+    ]
+
+
+def _tiempo(sentencia, datos, numero, repeticiones):
+    """Mejor tiempo en segundos de recorrer `datos` ejecutando la sentencia, `numero` veces."""
+    temporizador = timeit.Timer(
+        f"for a, b, s in datos:\n    {sentencia}",
+        globals={"datos": datos, **_ENTORNO},
+    )
+    return min(temporizador.repeat(repeticiones, numero))
+
+
+def contar_asignaciones(sentencia, datos):
+    """
+    Asignaciones netas por operación: bloques de memoria que quedan vivos por
+    cada resultado cuando se conservan todos (el vector y sus coordenadas).
+    Un operador en su lugar que no crea objetos nuevos da ~0.
+    """
+    resultados = [None] * len(datos)
+    codigo = compile(
+        f"for i, (a, b, s) in enumerate(datos):\n    {sentencia}\n    resultados[i] = r",
+        "<benchmark>", "exec",
+    )
+    entorno = {"datos": datos, "resultados": resultados, **_ENTORNO}
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.take_snapshot()
+        exec(codigo, entorno)
+        despues = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    bloques = sum(estadistica.count_diff for estadistica in despues.compare_to(antes, "filename"))
+    return max(0.0, bloques / len(datos))
+
+
+def medir(operacion, tamano_lote, repeticiones=5, operaciones_minimas=200000, semilla=0):
+    """Mide una operación sobre un lote de vectores y devuelve un Resultado."""
+    sentencia = OPERACIONES[operacion]
+    numero = max(1, operaciones_minimas // tamano_lote)
+    datos = generar_datos(tamano_lote, semilla)
+    total = _tiempo(sentencia, datos, numero, repeticiones)
+    base = _tiempo(_BASE, datos, numero, repeticiones)
+    ns_por_op = max(0.0, total - base) / (numero * tamano_lote) * 1e9
+    asignaciones = contar_asignaciones(sentencia, generar_datos(tamano_lote, semilla))
+    return Resultado(operacion, tamano_lote, ns_por_op, asignaciones)
+
+
+def ejecutar(operaciones=tuple(OPERACIONES), tamanos=(10, 1000, 100000), repeticiones=5,
+             operaciones_minimas=200000, semilla=0):
+    """Mide cada operación con cada tamaño de lote y devuelve la lista de Resultados."""
+    return [
+        medir(operacion, tamano, repeticiones, operaciones_minimas, semilla)
+        for operacion in operaciones
+        for tamano in tamanos
+    ]
+
+
+def guardar_json(resultados, path):
+    """Guarda los resultados junto con la versión de Python y la plataforma."""
+    documento = {
+        "python": platform.python_version(),
+        "implementacion": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "resultados": [resultado._asdict() for resultado in resultados],
+    }
+    with open(path, "w", encoding="utf-8") as archivo:
+        json.dump(documento, archivo, indent=2)
+
+
+def cargar_json(path):
+    """Lee resultados guardados con `guardar_json`."""
+    with open(path, encoding="utf-8") as archivo:
+        documento = json.load(archivo)
+    return [Resultado(**resultado) for resultado in documento["resultados"]]
+
+
+def formatear_tabla(resultados, base=None):
+    """
+    Tabla de texto con una fila por (operación, tamaño de lote). Con `base`
+    (resultados anteriores) se agrega la razón ns/op actual / ns/op anterior.
+    """
+    anteriores = {(r.operacion, r.tamano_lote): r for r in base or ()}
+    encabezado = f"{'operacion':<18} {'lote':>8} {'ns/op':>9} {'asig/op':>8}"
+    if base is not None:
+        encabezado += f" {'vs base':>8}"
+    filas = [encabezado, "-" * len(encabezado)]
+    for r in resultados:
+        fila = f"{r.operacion:<18} {r.tamano_lote:>8} {r.ns_por_op:>9.1f} {r.asignaciones_por_op:>8.2f}"
+        if base is not None:
+            anterior = anteriores.get((r.operacion, r.tamano_lote))
+            razon = f"{r.ns_por_op / anterior.ns_por_op:.2f}x" if anterior and anterior.ns_por_op else "-"
+            fila += f" {razon:>8}"
+        filas.append(fila)
+    return "\n".join(filas)
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos del benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark de las operaciones de Vector3D.")
+    parser.add_argument("--operaciones", nargs="+", choices=list(OPERACIONES), default=list(OPERACIONES))
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10, 1000, 100000], help="tamaños de lote")
+    parser.add_argument("--repeticiones", type=int, default=5, help="se toma el mejor de N tiempos")
+    parser.add_argument("--minimo", type=int, default=200000, help="operaciones mínimas por medición")
+    parser.add_argument("--json", help="guardar los resultados en este archivo JSON")
+    parser.add_argument("--comparar", help="archivo JSON de una ejecución anterior para comparar")
+    args = parser.parse_args(argv)
+
+    if any(tamano <= 0 for tamano in args.tamanos):
+        print("Error: Los tamaños de lote deben ser positivos.")
+        sys.exit(1)
+    base = None
+    if args.comparar:
+        try:
+            base = cargar_json(args.comparar)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error: No se pudo leer el archivo de comparación: {e}")
+            sys.exit(1)
+
+    resultados = ejecutar(args.operaciones, args.tamanos, args.repeticiones, args.minimo)
+    print(formatear_tabla(resultados, base))
+    if args.json:
+        guardar_json(resultados, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# indice_espacial.py
+import heapq
+import itertools
+import math
+from operator import itemgetter
+
+_COORDENADA = (itemgetter(0), itemgetter(1), itemgetter(2))
+
+
+class _Nodo:
+    """
+    Nodo del árbol kd. Una hoja guarda en `puntos` una lista de tuplas
+    (x, y, z, Vector3D); un nodo interno tiene `puntos` en None y separa por
+    el eje `eje`: a la izquierda quedan coordenadas <= corte y a la derecha >= corte.
+    """
+    __slots__ = ("eje", "corte", "izq", "der", "puntos")
+
+    def __init__(self, puntos):
+        self.eje = self.corte = self.izq = self.der = None
+        self.puntos = puntos
+
+
+class ArbolKD:
+    """
+    Índice espacial (árbol kd con hojas de hasta `tamano_hoja` puntos) sobre Vector3D.
+
+    - Carga masiva en O(N log² N): cada nivel divide por la mediana del eje de mayor extensión.
+    - `vecinos_cercanos(punto, k)`: los k puntos más cercanos, como (distancia, vector).
+    - `en_radio(centro, radio)` y `en_caja(minimo, maximo)`: puntos dentro de una esfera o caja.
+    - `insertar` y `eliminar` incrementales: una hoja que crece de más se divide en dos.
+
+    Las distancias se calculan con la misma fórmula que abs(a - b), así que los
+    resultados coinciden exactamente con una búsqueda por fuerza bruta. Muchas
+    inserciones en una misma zona pueden desbalancear el árbol; `reconstruir()`
+    vuelve a cargarlo de forma balanceada.
+    """
+    def __init__(self, puntos=(), tamano_hoja=16):
+        if tamano_hoja < 1:
+            raise ValueError("El tamaño de hoja debe ser positivo.")
+        self.tamano_hoja = tamano_hoja
+        self._cantidad = 0
+        self._raiz = None
+        self._cargar([(p.x, p.y, p.z, p) for p in puntos])
+
+    def _cargar(self, tuplas):
+        self._cantidad = len(tuplas)
+        self._raiz = self._construir(tuplas)
+
+    def _construir(self, tuplas):
+        nodo = _Nodo(tuplas)
+        if len(tuplas) > self.tamano_hoja:
+            self._dividir(nodo)
+        return nodo
+
+    def _dividir(self, nodo):
+        """Convierte una hoja en nodo interno partiendo por la mediana del eje más extenso."""
+        tuplas = nodo.puntos
+        # La extensión de cada eje se estima con una muestra de ~256 puntos para no recorrer todos.
+        muestra = tuplas[::max(1, len(tuplas) // 256)]
+        extensiones = []
+        for coordenada in _COORDENADA:
+            coordenadas = list(map(coordenada, muestra))
+            extensiones.append(max(coordenadas) - min(coordenadas))
+        eje = extensiones.index(max(extensiones))
+        tuplas.sort(key=_COORDENADA[eje])
+        mitad = len(tuplas) // 2
+        nodo.eje = eje
+        nodo.corte = tuplas[mitad][eje]
+        nodo.izq = self._construir(tuplas[:mitad])
+        nodo.der = self._construir(tuplas[mitad:])
+        nodo.puntos = None
+
+    def reconstruir(self):
+        """Vuelve a cargar todos los puntos en un árbol balanceado."""
+        self._cargar(list(self._tuplas()))
+
+    def __len__(self):
+        return self._cantidad
+
+    def _tuplas(self):
+        pila = [self._raiz]
+        while pila:
+            nodo = pila.pop()
+            if nodo.puntos is None:
+                pila.append(nodo.der)
+                pila.append(nodo.izq)
+            else:
+                yield from nodo.puntos
+
+    def __iter__(self):
+        return (tupla[3] for tupla in self._tuplas())
+
+    def insertar(self, punto):
+        """Agrega un punto al índice."""
+        tupla = (punto.x, punto.y, punto.z, punto)
+        nodo = self._raiz
+        while nodo.puntos is None:
+            nodo = nodo.izq if tupla[nodo.eje] < nodo.corte else nodo.der
+        nodo.puntos.append(tupla)
+        self._cantidad += 1
+        # Dividir con el doble del tamaño evita redividir en cada inserción.
+        if len(nodo.puntos) > 2 * self.tamano_hoja:
+            self._dividir(nodo)
+
+    def eliminar(self, punto):
+        """Quita una aparición del punto. Devuelve False si no estaba en el índice."""
+        coordenadas = (punto.x, punto.y, punto.z)
+        pila = [self._raiz]
+        while pila:
+            nodo = pila.pop()
+            if nodo.puntos is None:
+                valor = coordenadas[nodo.eje]
+                # Los puntos iguales al corte pueden estar a ambos lados.
+                if valor <= nodo.corte:
+                    pila.append(nodo.izq)
+                if valor >= nodo.corte:
+                    pila.append(nodo.der)
+                continue
+            for i, tupla in enumerate(nodo.puntos):
+                if tupla[3] == punto:
+                    del nodo.puntos[i]
+                    self._cantidad -= 1
+                    return True
+        return False
+
+    def vecinos_cercanos(self, punto, k=1):
+        """
+        Devuelve los k puntos más cercanos a `punto` como una lista de
+        (distancia, vector) ordenada por distancia (menos si el índice tiene menos de k).
+        """
+        if k <= 0:
+            return []
+        qx, qy, qz = consulta = (punto.x, punto.y, punto.z)
+        # Montículo de máximos (distancias² negadas) con los k mejores hasta ahora.
+        mejores = []
+        desempate = itertools.count()
+        pila = [(self._raiz, 0.0)]
+        while pila:
+            nodo, cota = pila.pop()
+            if len(mejores) == k and cota > -mejores[0][0]:
+                continue
+            if nodo.puntos is None:
+                diferencia = consulta[nodo.eje] - nodo.corte
+                cercano, lejano = (nodo.izq, nodo.der) if diferencia < 0 else (nodo.der, nodo.izq)
+                # El lado lejano está al menos a |diferencia| en el eje de corte.
+                pila.append((lejano, max(cota, diferencia * diferencia)))
+                pila.append((cercano, cota))
+                continue
+            for x, y, z, vector in nodo.puntos:
+                dx = qx - x
+                dy = qy - y
+                dz = qz - z
+                d2 = dx * dx + dy * dy + dz * dz
+                if len(mejores) < k:
+                    heapq.heappush(mejores, (-d2, next(desempate), vector))
+                elif d2 < -mejores[0][0]:
+                    heapq.heapreplace(mejores, (-d2, next(desempate), vector))
+        mejores.sort(key=lambda entrada: (-entrada[0], entrada[1]))
+        return [(math.sqrt(-d2), vector) for d2, _, vector in mejores]
+
+    def en_radio(self, centro, radio):
+        """Puntos a distancia <= radio de `centro` (en el orden del árbol)."""
+        qx, qy, qz = consulta = (centro.x, centro.y, centro.z)
+        sqrt = math.sqrt
+        encontrados = []
+        pila = [self._raiz]
+        while pila:
+            nodo = pila.pop()
+            if nodo.puntos is None:
+                diferencia = consulta[nodo.eje] - nodo.corte
+                if diferencia <= radio:
+                    pila.append(nodo.izq)
+                if diferencia >= -radio:
+                    pila.append(nodo.der)
+                continue
+            for x, y, z, vector in nodo.puntos:
+                dx = qx - x
+                dy = qy - y
+                dz = qz - z
+                if sqrt(dx * dx + dy * dy + dz * dz) <= radio:
+                    encontrados.append(vector)
+        return encontrados
+
+    def en_caja(self, minimo, maximo):
+        """Puntos con minimo.c <= c <= maximo.c en cada coordenada (en el orden del árbol)."""
+        x0, y0, z0 = inferior = (minimo.x, minimo.y, minimo.z)
+        x1, y1, z1 = superior = (maximo.x, maximo.y, maximo.z)
+        encontrados = []
+        pila = [self._raiz]
+        while pila:
+            nodo = pila.pop()
+            if nodo.puntos is None:
+                if inferior[nodo.eje] <= nodo.corte:
+                    pila.append(nodo.izq)
+                if superior[nodo.eje] >= nodo.corte:
+                    pila.append(nodo.der)
+                continue
+            for x, y, z, vector in nodo.puntos:
+                if x0 <= x <= x1 and y0 <= y <= y1 and z0 <= z <= z1:
+                    encontrados.append(vector)
+        return encontrados
+
+
+def vecinos_fuerza_bruta(puntos, punto, k=1):
+    """k vecinos más cercanos recorriendo todos los puntos con abs(p - punto)."""
+    return heapq.nsmallest(k, ((abs(p - punto), p) for p in puntos), key=itemgetter(0))
+
+
+def radio_fuerza_bruta(puntos, centro, radio):
+    """Puntos a distancia <= radio de `centro` recorriendo todos los puntos."""
+    return [p for p in puntos if abs(p - centro) <= radio]
+
+
+def caja_fuerza_bruta(puntos, minimo, maximo):
+    """Puntos dentro de la caja [minimo, maximo] recorriendo todos los puntos."""
+    return [
+        p for p in puntos
+        if minimo.x <= p.x <= maximo.x and minimo.y <= p.y <= maximo.y and minimo.z <= p.z <= maximo.z
+    ]
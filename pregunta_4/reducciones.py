@@ -0,0 +1,316 @@
+# reducciones.py
+import math
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from vector import _crear
+
+# Vectores por tramo. El reparto en tramos no depende de la cantidad de trabajadores,
+# y los resultados parciales se combinan siempre en el mismo orden: el resultado es
+# idéntico con 1 o con N procesos.
+TAMANO_TRAMO = 65536
+
+_BYTES_TERNA = 24
+# Formatos de buffer que `desde_buffer` acepta: float64 nativos o bytes sueltos.
+_FORMATOS_DOBLES = ("d", "=d", "<d" if sys.byteorder == "little" else ">d")
+_FORMATOS_BYTES = ("B", "b", "c")
+
+
+class VectoresCompartidos:
+    """
+    N vectores guardados como ternas de float64 (x, y, z) en un bloque de
+    `multiprocessing.shared_memory`. Los procesos del pool se conectan al bloque
+    por nombre y leen los datos sin que se serialice ningún vector.
+
+    El proceso que crea el bloque es su dueño: `cerrar()` (o salir del bloque
+    `with`) lo libera del sistema.
+    """
+    def __init__(self, cantidad):
+        if cantidad < 0:
+            raise ValueError("La cantidad de vectores no puede ser negativa.")
+        self._cantidad = cantidad
+        # shared_memory no admite bloques de tamaño 0: un bloque vacío reserva una terna.
+        self._memoria = shared_memory.SharedMemory(create=True, size=max(1, cantidad) * _BYTES_TERNA)
+        self._dobles = self._memoria.buf.cast("d")
+
+    @classmethod
+    def desde_vectores(cls, vectores):
+        """
+        Copia un iterable (con len) de Vector3D a un bloque compartido nuevo. Para
+        datos que ya están en un ndarray o un buffer use `desde_buffer`, que los
+        copia sin recorrerlos en Python.
+        """
+        compartidos = cls(len(vectores))
+        dobles = compartidos._dobles
+        j = 0
+        for vector in vectores:
+            dobles[j] = vector.x
+            dobles[j + 1] = vector.y
+            dobles[j + 2] = vector.z
+            j += 3
+        return compartidos
+
+    @classmethod
+    def desde_buffer(cls, buffer):
+        """
+        Copia a un bloque compartido nuevo un buffer contiguo de ternas de float64:
+        bytes little-endian (el formato de vector_io), un array('d') o un ndarray
+        de float64 de forma (N, 3). Los datos se copian con una sola asignación
+        de rebanada, sin convertirlos elemento por elemento.
+        """
+        vista = memoryview(buffer)
+        try:
+            if vista.format not in _FORMATOS_DOBLES and vista.format not in _FORMATOS_BYTES:
+                raise ValueError(f"El buffer debe contener float64 o bytes, no el formato '{vista.format}'.")
+            if not vista.c_contiguous:
+                raise ValueError("El buffer debe ser contiguo.")
+            if vista.nbytes % _BYTES_TERNA:
+                raise ValueError("El buffer no contiene una cantidad entera de ternas de float64.")
+            compartidos = cls(vista.nbytes // _BYTES_TERNA)
+            if sys.byteorder == "big" and vista.format in _FORMATOS_BYTES:
+                # Los bytes vienen en little-endian: hay que invertirlos antes de copiar.
+                datos = array("d")
+                datos.frombytes(vista)
+                datos.byteswap()
+                compartidos._dobles[:len(datos)] = datos
+            else:
+                with vista.cast("B") as octetos:
+                    compartidos._memoria.buf[:vista.nbytes] = octetos
+            return compartidos
+        finally:
+            vista.release()
+
+    @property
+    def nombre(self):
+        return self._memoria.name
+
+    def __len__(self):
+        return self._cantidad
+
+    def __getitem__(self, indice):
+        j = range(self._cantidad)[indice] * 3
+        dobles = self._dobles
+        return _crear(dobles[j], dobles[j + 1], dobles[j + 2])
+
+    def cerrar(self):
+        """Libera la vista, cierra el bloque y lo elimina del sistema."""
+        if self._memoria is None:
+            return
+        self._dobles.release()
+        self._memoria.close()
+        self._memoria.unlink()
+        self._memoria = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+# --- Trabajo de cada tramo (se ejecuta en los procesos del pool) ---
+
+def _conectar(nombre):
+    """Abre un bloque compartido existente por nombre (el dueño es quien lo creó)."""
+    memoria = shared_memory.SharedMemory(name=nombre)
+    return memoria, memoria.buf.cast("d")
+
+def _suma_tramo(nombre, inicio, fin):
+    """Sumas (x, y, z) de los vectores [inicio, fin) con math.fsum (correctamente redondeadas)."""
+    memoria, dobles = _conectar(nombre)
+    try:
+        tramo = dobles[3 * inicio:3 * fin]
+        try:
+            return math.fsum(tramo[0::3]), math.fsum(tramo[1::3]), math.fsum(tramo[2::3])
+        finally:
+            tramo.release()
+    finally:
+        dobles.release()
+        memoria.close()
+
+def _normas_tramo(nombre, destino, inicio, fin):
+    """Escribe en `destino` la norma de cada vector [inicio, fin), con la fórmula de abs(Vector3D)."""
+    memoria, dobles = _conectar(nombre)
+    salida, valores = _conectar(destino)
+    sqrt = math.sqrt
+    try:
+        tramo = dobles[3 * inicio:3 * fin]
+        try:
+            valores[inicio:fin] = array("d", [
+                sqrt(x * x + y * y + z * z) for x, y, z in zip(tramo[0::3], tramo[1::3], tramo[2::3])
+            ])
+        finally:
+            tramo.release()
+    finally:
+        valores.release()
+        salida.close()
+        dobles.release()
+        memoria.close()
+
+def _punto_tramo(nombre_a, nombre_b, destino, inicio, fin):
+    """Escribe en `destino` a[i] % b[i] para i en [inicio, fin), con la fórmula de Vector3D.__mod__."""
+    memoria_a, a = _conectar(nombre_a)
+    memoria_b, b = _conectar(nombre_b)
+    salida, productos = _conectar(destino)
+    try:
+        tramo_a = a[3 * inicio:3 * fin]
+        tramo_b = b[3 * inicio:3 * fin]
+        try:
+            productos[inicio:fin] = array("d", [
+                ax * bx + ay * by + az * bz
+                for ax, ay, az, bx, by, bz in zip(
+                    tramo_a[0::3], tramo_a[1::3], tramo_a[2::3], tramo_b[0::3], tramo_b[1::3], tramo_b[2::3])
+            ])
+        finally:
+            tramo_a.release()
+            tramo_b.release()
+    finally:
+        productos.release()
+        salida.close()
+        a.release()
+        b.release()
+        memoria_a.close()
+        memoria_b.close()
+
+def _cruz_tramo(nombre_a, nombre_b, destino, inicio, fin):
+    """Escribe en `destino` las ternas de a[i] * b[i] para i en [inicio, fin), con la fórmula de Vector3D.__mul__."""
+    memoria_a, a = _conectar(nombre_a)
+    memoria_b, b = _conectar(nombre_b)
+    salida, cruces = _conectar(destino)
+    try:
+        tramo_a = a[3 * inicio:3 * fin]
+        tramo_b = b[3 * inicio:3 * fin]
+        try:
+            resultado = array("d")
+            agregar = resultado.extend
+            for ax, ay, az, bx, by, bz in zip(
+                    tramo_a[0::3], tramo_a[1::3], tramo_a[2::3], tramo_b[0::3], tramo_b[1::3], tramo_b[2::3]):
+                agregar((ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx))
+            cruces[3 * inicio:3 * fin] = resultado
+        finally:
+            tramo_a.release()
+            tramo_b.release()
+    finally:
+        cruces.release()
+        salida.close()
+        a.release()
+        b.release()
+        memoria_a.close()
+        memoria_b.close()
+
+
+# --- Reparto de los tramos ---
+
+def _tramos(cantidad):
+    return [(inicio, min(inicio + TAMANO_TRAMO, cantidad)) for inicio in range(0, cantidad, TAMANO_TRAMO)]
+
+def _ejecutar(funcion, argumentos, tramos, trabajadores, pool):
+    """
+    Aplica `funcion(*argumentos, inicio, fin)` a cada tramo y devuelve los
+    resultados en el orden de los tramos. Con un solo trabajador (o un solo tramo)
+    se calcula en este proceso; si no se pasa `pool`, se crea uno temporal.
+    """
+    if trabajadores is not None and trabajadores < 1:
+        raise ValueError("La cantidad de trabajadores debe ser positiva.")
+    if not tramos:
+        return []
+    if pool is None and (trabajadores == 1 or len(tramos) == 1):
+        return [funcion(*argumentos, inicio, fin) for inicio, fin in tramos]
+    # pool.map recibe una columna por parámetro y entrega los resultados en orden.
+    columnas = list(zip(*[(*argumentos, inicio, fin) for inicio, fin in tramos]))
+    if pool is not None:
+        return list(pool.map(funcion, *columnas))
+    with ProcessPoolExecutor(max_workers=min(trabajadores or os.cpu_count() or 1, len(tramos))) as temporal:
+        return list(temporal.map(funcion, *columnas))
+
+def _compartir(vectores):
+    """Devuelve (VectoresCompartidos, propio): propio indica si hay que cerrarlo al terminar."""
+    if isinstance(vectores, VectoresCompartidos):
+        return vectores, False
+    return VectoresCompartidos.desde_vectores(vectores), True
+
+
+# --- API pública ---
+
+def sumar_vectores(vectores, trabajadores=None, pool=None):
+    """
+    Suma de todos los vectores como Vector3D. `vectores` puede ser un
+    VectoresCompartidos o una secuencia de Vector3D (que se copia a memoria
+    compartida). `trabajadores` limita los procesos (por defecto, uno por CPU)
+    y `pool` permite reutilizar un ProcessPoolExecutor entre llamadas.
+    El resultado no depende de la cantidad de trabajadores.
+    """
+    compartidos, propio = _compartir(vectores)
+    try:
+        parciales = _ejecutar(_suma_tramo, (compartidos.nombre,), _tramos(len(compartidos)), trabajadores, pool)
+    finally:
+        if propio:
+            compartidos.cerrar()
+    return _crear(*(math.fsum(componente) for componente in zip(*parciales))) if parciales else _crear(0.0, 0.0, 0.0)
+
+def centroide(vectores, trabajadores=None, pool=None):
+    """Promedio de los vectores (ver `sumar_vectores`). Lanza ValueError si no hay vectores."""
+    cantidad = len(vectores)
+    if not cantidad:
+        raise ValueError("No se puede calcular el centroide de un conjunto vacío.")
+    suma = sumar_vectores(vectores, trabajadores, pool)
+    return _crear(suma.x / cantidad, suma.y / cantidad, suma.z / cantidad)
+
+def normas(vectores, trabajadores=None, pool=None):
+    """Norma de cada vector, como array('d'); cada valor es idéntico a abs(vector)."""
+    compartidos, propio = _compartir(vectores)
+    try:
+        # La salida son N floats: alcanza con un bloque de ceil(N / 3) ternas.
+        with VectoresCompartidos((len(compartidos) + 2) // 3) as salida:
+            _ejecutar(_normas_tramo, (compartidos.nombre, salida.nombre), _tramos(len(compartidos)), trabajadores, pool)
+            return array("d", salida._dobles[:len(compartidos)])
+    finally:
+        if propio:
+            compartidos.cerrar()
+
+def suma_normas(vectores, trabajadores=None, pool=None):
+    """Suma de las normas de todos los vectores (correctamente redondeada con math.fsum)."""
+    return math.fsum(normas(vectores, trabajadores, pool))
+
+def productos_punto(a, b, trabajadores=None, pool=None):
+    """Producto punto a[i] % b[i] de cada par, como array('d'). Ambas colecciones deben tener la misma longitud."""
+    if len(a) != len(b):
+        raise ValueError(f"Las colecciones tienen longitudes distintas: {len(a)} y {len(b)}.")
+    compartidos_a, propio_a = _compartir(a)
+    compartidos_b, propio_b = _compartir(b)
+    try:
+        with VectoresCompartidos((len(a) + 2) // 3) as salida:
+            _ejecutar(_punto_tramo, (compartidos_a.nombre, compartidos_b.nombre, salida.nombre),
+                      _tramos(len(a)), trabajadores, pool)
+            return array("d", salida._dobles[:len(a)])
+    finally:
+        if propio_a:
+            compartidos_a.cerrar()
+        if propio_b:
+            compartidos_b.cerrar()
+
+def productos_cruz(a, b, trabajadores=None, pool=None):
+    """
+    Producto cruz a[i] * b[i] de cada par. Devuelve un VectoresCompartidos nuevo
+    (que el llamador debe cerrar), listo para encadenar otra reducción sin copias.
+    """
+    if len(a) != len(b):
+        raise ValueError(f"Las colecciones tienen longitudes distintas: {len(a)} y {len(b)}.")
+    compartidos_a, propio_a = _compartir(a)
+    compartidos_b, propio_b = _compartir(b)
+    salida = VectoresCompartidos(len(a))
+    try:
+        _ejecutar(_cruz_tramo, (compartidos_a.nombre, compartidos_b.nombre, salida.nombre),
+                  _tramos(len(a)), trabajadores, pool)
+    except BaseException:
+        salida.cerrar()
+        raise
+    finally:
+        if propio_a:
+            compartidos_a.cerrar()
+        if propio_b:
+            compartidos_b.cerrar()
+    return salida
@@ -0,0 +1,26 @@
+# test_benchmark_indice.py
+import pytest
+from benchmark_indice import generar_puntos, comparar, formatear_tabla, main
+
+def test_generar_puntos_reproducible():
+    puntos = generar_puntos(100, semilla=2)
+    assert len(puntos) == 100
+    assert all(0 <= p.x < 1000 and 0 <= p.y < 1000 and 0 <= p.z < 1000 for p in puntos)
+    assert puntos == generar_puntos(100, semilla=2)
+
+def test_comparar_reporta_cada_consulta():
+    resultados = comparar(2000, consultas=20, consultas_fuerza_bruta=2, k=5)
+    assert [r.consulta for r in resultados] == ["knn", "radio", "caja"]
+    for r in resultados:
+        assert r.puntos == 2000 and r.construccion_s > 0
+        assert r.arbol_ms > 0 and r.fuerza_bruta_ms > 0
+        assert r.aceleracion == pytest.approx(r.fuerza_bruta_ms / r.arbol_ms)
+    assert "aceleracion" in formatear_tabla(resultados)
+
+def test_main(capsys):
+    main(["--puntos", "500", "--consultas", "10", "--consultas-bruta", "2", "-k", "3"])
+    salida = capsys.readouterr().out
+    assert "knn" in salida and "caja" in salida
+    with pytest.raises(SystemExit):
+        main(["--puntos", "0"])
+    assert "positivas" in capsys.readouterr().out
@@ -0,0 +1,32 @@
+# test_benchmark_reducciones.py
+import os
+import pytest
+import reducciones
+from benchmark_reducciones import generar_compartidos, medir, formatear_tabla, main
+
+@pytest.fixture(autouse=True)
+def tramos_chicos(monkeypatch):
+    monkeypatch.setattr(reducciones, "TAMANO_TRAMO", 500)
+
+def test_generar_compartidos_reproducible():
+    with generar_compartidos(50, semilla=1) as a, generar_compartidos(50, semilla=1) as b:
+        assert [a[i] for i in range(50)] == [b[i] for i in range(50)]
+        assert all(-1 <= c < 1 for i in range(50) for c in (a[i].x, a[i].y, a[i].z))
+
+def test_medir_reporta_cada_trabajador():
+    resultados = medir(2000, [1, 2], operaciones=["suma", "punto"], repeticiones=1)
+    assert [(r.operacion, r.trabajadores) for r in resultados] == [("suma", 1), ("suma", 2), ("punto", 1), ("punto", 2)]
+    for r in resultados:
+        assert r.segundos > 0
+        assert r.eficiencia == pytest.approx(r.aceleracion / r.trabajadores)
+    assert resultados[0].aceleracion == 1.0
+    assert "aceleracion" in formatear_tabla(resultados)
+
+def test_main(capsys):
+    main(["--vectores", "1000", "--trabajadores", "1", "2", "--operaciones", "normas", "--repeticiones", "1"])
+    salida = capsys.readouterr().out
+    assert "normas" in salida and "núcleos" in salida
+    assert ("Aviso: hay más trabajadores" in salida) == ((os.cpu_count() or 1) < 2)
+    with pytest.raises(SystemExit):
+        main(["--vectores", "0"])
+    assert "positivas" in capsys.readouterr().out
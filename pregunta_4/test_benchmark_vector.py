@@ -0,0 +1,64 @@
+# test_benchmark_vector.py
+import json
+import pytest
+from benchmark_vector import (
+    OPERACIONES, generar_datos, contar_asignaciones, medir, ejecutar,
+    cargar_json, guardar_json, formatear_tabla, main,
+)
+from vector import Vector3D
+
+def test_generar_datos_reproducible():
+    datos = generar_datos(5, semilla=3)
+    assert len(datos) == 5
+    assert all(isinstance(a, Vector3D) and isinstance(b, Vector3D) and isinstance(s, float) for a, b, s in datos)
+    assert [(a.x, b.z, s) for a, b, s in datos] == [(a.x, b.z, s) for a, b, s in generar_datos(5, semilla=3)]
+
+def test_asignaciones_por_operacion():
+    """Prueba que se cuentan el vector y sus tres coordenadas, y nada en los operadores en su lugar."""
+    datos = generar_datos(2000)
+    assert contar_asignaciones(OPERACIONES["suma_vector"], datos) == pytest.approx(4, abs=0.1)
+    assert contar_asignaciones(OPERACIONES["producto_punto"], datos) == pytest.approx(1, abs=0.1)
+    assert contar_asignaciones(OPERACIONES["suma_en_su_lugar"], datos) < 0.1
+
+def test_medir_resultado():
+    resultado = medir("producto_cruz", 100, repeticiones=1, operaciones_minimas=1000)
+    assert resultado.operacion == "producto_cruz" and resultado.tamano_lote == 100
+    assert resultado.ns_por_op > 0
+    assert resultado.asignaciones_por_op == pytest.approx(4, abs=0.2)
+
+def test_json_ida_y_vuelta(tmp_path):
+    resultados = ejecutar(("norma", "rsub"), (10, 50), repeticiones=1, operaciones_minimas=100)
+    assert [(r.operacion, r.tamano_lote) for r in resultados] == [("norma", 10), ("norma", 50), ("rsub", 10), ("rsub", 50)]
+    path = tmp_path / "base.json"
+    guardar_json(resultados, path)
+    assert json.loads(path.read_text())["python"]
+    assert cargar_json(path) == resultados
+    tabla = formatear_tabla(resultados, base=resultados)
+    assert "vs base" in tabla and "1.00x" in tabla
+
+def test_main_guarda_y_compara(tmp_path, capsys):
+    path = tmp_path / "resultados.json"
+    argumentos = ["--operaciones", "suma_vector", "radd", "--tamanos", "20", "--repeticiones", "1", "--minimo", "100"]
+    main(argumentos + ["--json", str(path)])
+    assert "suma_vector" in capsys.readouterr().out
+    main(argumentos + ["--comparar", str(path)])
+    assert "vs base" in capsys.readouterr().out
+
+def test_main_errores(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main(["--tamanos", "0"])
+    assert "positivos" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        main(["--comparar", str(tmp_path / "no_existe.json")])
+    assert "No se pudo leer" in capsys.readouterr().out
+
+def test_expresiones_equivalentes():
+    """Prueba que las dos variantes de la expresión calculan exactamente lo mismo."""
+    from benchmark_vector import _ENTORNO
+    a, b, s = generar_datos(1)[0]
+    resultados = []
+    for operacion in ("expr", "expr_fusionada"):
+        entorno = dict(_ENTORNO, a=a, b=b, s=s)
+        exec(OPERACIONES[operacion], entorno)
+        resultados.append(entorno["r"])
+    assert resultados[0] == resultados[1]
@@ -0,0 +1,92 @@
+# test_indice_espacial.py
+import random
+import pytest
+from vector import Vector3D
+from indice_espacial import ArbolKD, vecinos_fuerza_bruta, radio_fuerza_bruta, caja_fuerza_bruta
+
+# --- Fixtures con nubes de puntos ---
+@pytest.fixture
+def puntos():
+    rng = random.Random(3)
+    nube = [Vector3D(rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-5, 5)) for _ in range(2000)]
+    # Puntos repetidos y sobre una malla entera para forzar empates en los cortes.
+    nube += [Vector3D(float(i % 5), float(i % 3), 0.0) for i in range(200)]
+    return nube
+
+@pytest.fixture
+def consultas():
+    rng = random.Random(4)
+    return [Vector3D(rng.uniform(-60, 60), rng.uniform(-60, 60), rng.uniform(-8, 8)) for _ in range(40)]
+
+def _clave(vector):
+    return (vector.x, vector.y, vector.z)
+
+# --- Pruebas contra la búsqueda por fuerza bruta ---
+@pytest.mark.parametrize("k", [1, 7, 50])
+def test_vecinos_cercanos_como_fuerza_bruta(puntos, consultas, k):
+    arbol = ArbolKD(puntos, tamano_hoja=8)
+    for consulta in consultas + [Vector3D(2, 1, 0)]:
+        resultado = arbol.vecinos_cercanos(consulta, k)
+        esperado = vecinos_fuerza_bruta(puntos, consulta, k)
+        assert [distancia for distancia, _ in resultado] == [distancia for distancia, _ in esperado]
+        assert all(abs(vector - consulta) == distancia for distancia, vector in resultado)
+
+def test_en_radio_como_fuerza_bruta(puntos, consultas):
+    arbol = ArbolKD(puntos)
+    for consulta in consultas:
+        for radio in (0.0, 3.5, 20.0):
+            assert sorted(map(_clave, arbol.en_radio(consulta, radio))) == \
+                sorted(map(_clave, radio_fuerza_bruta(puntos, consulta, radio)))
+
+def test_en_caja_como_fuerza_bruta(puntos, consultas):
+    arbol = ArbolKD(puntos)
+    for consulta in consultas:
+        minimo, maximo = consulta - 10, consulta + Vector3D(15, 5, 3)
+        assert sorted(map(_clave, arbol.en_caja(minimo, maximo))) == \
+            sorted(map(_clave, caja_fuerza_bruta(puntos, minimo, maximo)))
+    # Caja que toca exactamente los puntos de la malla (límites inclusivos).
+    assert len(arbol.en_caja(Vector3D(0, 0, 0), Vector3D(4, 0, 0))) == len(
+        caja_fuerza_bruta(puntos, Vector3D(0, 0, 0), Vector3D(4, 0, 0)))
+
+# --- Pruebas de inserción y eliminación ---
+def test_insertar_y_eliminar(puntos, consultas):
+    """Prueba que el índice incremental responde igual que la fuerza bruta sobre los puntos vivos."""
+    rng = random.Random(5)
+    arbol = ArbolKD(tamano_hoja=4)
+    vivos = []
+    for punto in puntos:
+        arbol.insertar(punto)
+        vivos.append(punto)
+        if rng.random() < 0.3:
+            quitado = vivos.pop(rng.randrange(len(vivos)))
+            assert arbol.eliminar(quitado)
+    assert len(arbol) == len(vivos)
+    assert sorted(map(_clave, arbol)) == sorted(map(_clave, vivos))
+    for consulta in consultas[:10]:
+        assert [d for d, _ in arbol.vecinos_cercanos(consulta, 5)] == \
+            [d for d, _ in vecinos_fuerza_bruta(vivos, consulta, 5)]
+    arbol.reconstruir()
+    assert len(arbol) == len(vivos)
+    assert sorted(map(_clave, arbol.en_radio(consultas[0], 30))) == \
+        sorted(map(_clave, radio_fuerza_bruta(vivos, consultas[0], 30)))
+
+def test_eliminar_duplicados_y_ausentes():
+    arbol = ArbolKD([Vector3D(1, 1, 1)] * 40 + [Vector3D(2, 2, 2)], tamano_hoja=2)
+    assert not arbol.eliminar(Vector3D(3, 3, 3))
+    for _ in range(40):
+        assert arbol.eliminar(Vector3D(1, 1, 1))
+    assert not arbol.eliminar(Vector3D(1, 1, 1))
+    assert list(arbol) == [Vector3D(2, 2, 2)]
+
+def test_arbol_vacio_y_k_grande():
+    arbol = ArbolKD()
+    assert len(arbol) == 0
+    assert arbol.vecinos_cercanos(Vector3D(0, 0, 0), 3) == []
+    assert arbol.en_radio(Vector3D(0, 0, 0), 10) == []
+    arbol.insertar(Vector3D(1, 0, 0))
+    assert arbol.vecinos_cercanos(Vector3D(0, 0, 0), 3) == [(1.0, Vector3D(1, 0, 0))]
+    assert arbol.vecinos_cercanos(Vector3D(0, 0, 0), 0) == []
+
+def test_tamano_hoja_invalido():
+    with pytest.raises(ValueError):
+        ArbolKD(tamano_hoja=0)
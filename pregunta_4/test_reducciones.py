@@ -0,0 +1,107 @@
+# test_reducciones.py
+import math
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from vector import Vector3D
+from vector_io import TERNA
+import reducciones
+from reducciones import (
+    VectoresCompartidos, sumar_vectores, centroide, normas, suma_normas, productos_punto, productos_cruz,
+)
+
+# --- Fixtures: tramos chicos para que pocos vectores ya se repartan en varios procesos ---
+@pytest.fixture(autouse=True)
+def tramos_chicos(monkeypatch):
+    monkeypatch.setattr(reducciones, "TAMANO_TRAMO", 100)
+
+@pytest.fixture
+def vectores():
+    rng = random.Random(7)
+    # Magnitudes muy distintas: una suma ingenua depende del orden, fsum no.
+    return [Vector3D(rng.uniform(-1, 1) * 10 ** rng.randint(-8, 8), rng.uniform(-1, 1), rng.gauss(0, 1e6))
+            for _ in range(1050)]
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as ejecutor:
+        yield ejecutor
+
+# --- Pruebas de VectoresCompartidos ---
+def test_compartidos_guarda_los_vectores(vectores):
+    with VectoresCompartidos.desde_vectores(vectores) as compartidos:
+        assert len(compartidos) == len(vectores)
+        assert compartidos[0] == vectores[0] and compartidos[-1] == vectores[-1]
+        with pytest.raises(IndexError):
+            compartidos[len(vectores)]
+
+def test_compartidos_desde_buffer(vectores):
+    buffer = b"".join(TERNA.pack(v.x, v.y, v.z) for v in vectores[:10])
+    with VectoresCompartidos.desde_buffer(buffer) as compartidos:
+        assert [compartidos[i] for i in range(10)] == vectores[:10]
+    with pytest.raises(ValueError):
+        VectoresCompartidos.desde_buffer(buffer[:-8])
+
+def test_compartidos_desde_array_y_ndarray(vectores):
+    """Prueba que array('d') y ndarray (N, 3) se copian tal cual, y que se rechazan formatos ajenos."""
+    dobles = array("d", [c for v in vectores for c in (v.x, v.y, v.z)])
+    with VectoresCompartidos.desde_buffer(dobles) as compartidos:
+        assert len(compartidos) == len(vectores) and compartidos[-1] == vectores[-1]
+    with pytest.raises(ValueError, match="formato 'f'"):
+        VectoresCompartidos.desde_buffer(array("f", [1.0, 2.0, 3.0]))
+    np = pytest.importorskip("numpy")
+    datos = np.array(dobles).reshape(-1, 3)
+    with VectoresCompartidos.desde_buffer(datos) as compartidos:
+        assert [compartidos[i] for i in range(len(vectores))] == vectores
+        assert sumar_vectores(compartidos) == sumar_vectores(vectores)
+    with pytest.raises(ValueError, match="contiguo"):
+        VectoresCompartidos.desde_buffer(datos[::2])
+
+def test_compartidos_vacio_y_cantidad_negativa():
+    with VectoresCompartidos(0) as vacio:
+        assert len(vacio) == 0
+        assert sumar_vectores(vacio) == Vector3D(0, 0, 0)
+        assert len(normas(vacio)) == 0
+    with pytest.raises(ValueError):
+        VectoresCompartidos(-1)
+
+# --- Pruebas de las reducciones ---
+def test_suma_correctamente_redondeada(vectores):
+    suma = sumar_vectores(vectores, trabajadores=1)
+    assert suma.x == math.fsum(v.x for v in vectores)
+    assert suma.y == math.fsum(v.y for v in vectores)
+    assert suma.z == math.fsum(v.z for v in vectores)
+
+@pytest.mark.parametrize("trabajadores", [2, 3])
+def test_resultados_deterministas(vectores, trabajadores):
+    """Prueba que el resultado es idéntico (bit a bit) con cualquier cantidad de procesos."""
+    otros = vectores[::-1]
+    assert sumar_vectores(vectores, trabajadores) == sumar_vectores(vectores, 1)
+    assert centroide(vectores, trabajadores) == centroide(vectores, 1)
+    assert normas(vectores, trabajadores) == normas(vectores, 1)
+    assert suma_normas(vectores, trabajadores) == suma_normas(vectores, 1)
+    assert productos_punto(vectores, otros, trabajadores) == productos_punto(vectores, otros, 1)
+
+def test_por_elemento_como_vector3d(vectores, pool):
+    otros = vectores[::-1]
+    assert list(normas(vectores, pool=pool)) == [abs(v) for v in vectores]
+    assert list(productos_punto(vectores, otros, pool=pool)) == [a % b for a, b in zip(vectores, otros)]
+    with productos_cruz(vectores, otros, pool=pool) as cruces:
+        assert [cruces[i] for i in range(len(cruces))] == [a * b for a, b in zip(vectores, otros)]
+
+def test_acepta_compartidos_sin_cerrarlos(vectores, pool):
+    with VectoresCompartidos.desde_vectores(vectores) as compartidos:
+        assert centroide(compartidos, pool=pool) == centroide(vectores, 1)
+        assert suma_normas(compartidos, pool=pool) == math.fsum(abs(v) for v in vectores)
+        assert compartidos[5] == vectores[5]
+
+def test_errores(vectores):
+    with pytest.raises(ValueError):
+        centroide([])
+    with pytest.raises(ValueError):
+        productos_punto(vectores, vectores[1:])
+    with pytest.raises(ValueError):
+        productos_cruz(vectores, vectores[1:])
+    with pytest.raises(ValueError):
+        sumar_vectores(vectores, trabajadores=0)
@@ -58,6 +58,46 @@ def test_multiplicacion_escalar(v1):
     assert v1 * 3.0 == Vector3D(3.0, 6.0, 9.0)
     assert 3.0 * v1 == Vector3D(3.0, 6.0, 9.0) # Conmutativa
 
+# --- Pruebas de operadores en su lugar ---
+def test_suma_y_resta_en_su_lugar(v1, v2):
+    acumulado = Vector3D(0, 0, 0)
+    original = acumulado
+    acumulado += v1
+    acumulado += 1
+    assert acumulado is original # No se creó un vector nuevo
+    assert acumulado == Vector3D(2, 3, 4)
+    acumulado -= v2
+    acumulado -= 0.5
+    assert acumulado is original
+    assert acumulado == Vector3D(-2.5, -2.5, -2.5)
+    assert v1 == Vector3D(1, 2, 3) and v2 == Vector3D(4, 5, 6) # Los operandos no cambian
+
+def test_multiplicacion_en_su_lugar(v1, v2):
+    cruz = Vector3D(1, 2, 3)
+    original = cruz
+    cruz *= v2
+    assert cruz is original and cruz == v1 * v2
+    cruz *= 2
+    assert cruz == Vector3D(-6, 12, -6)
+    propio = Vector3D(1, 2, 3)
+    propio *= propio # Usa los valores anteriores: v x v = 0
+    assert propio == Vector3D(0, 0, 0)
+
+def test_en_su_lugar_not_implemented(v1):
+    with pytest.raises(TypeError):
+        v1 += "hola"
+    with pytest.raises(TypeError):
+        v1 *= None
+
+def test_slots_sin_dict(v1):
+    assert not hasattr(v1, "__dict__")
+    with pytest.raises(AttributeError):
+        v1.w = 4
+
+def test_resultados_son_vector3d(v1, v2):
+    for resultado in (v1 + v2, v1 - 1, 2 - v1, v1 * v2, 3 * v1):
+        assert type(resultado) is Vector3D
+
 # --- Pruebas de expresiones compuestas ---
 def test_expresiones_compuestas(v1, v2):
     a = Vector3D(1, 0, 0)
@@ -0,0 +1,107 @@
+# test_vector_array.py
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from vector import Vector3D
+from vector_array import Vector3DArray
+
+# --- Fixtures con vectores aleatorios y su versión escalar ---
+@pytest.fixture
+def vectores():
+    rng = random.Random(1)
+    return [Vector3D(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(50)]
+
+@pytest.fixture
+def otros():
+    rng = random.Random(2)
+    return [Vector3D(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(50)]
+
+@pytest.fixture
+def v():
+    return Vector3D(1.5, -2.0, 3.25)
+
+# --- Pruebas de construcción e indexado ---
+def test_creacion_e_indexado(vectores):
+    arreglo = Vector3DArray.desde_vectores(vectores)
+    assert len(arreglo) == 50
+    assert arreglo.datos.shape == (50, 3) and arreglo.datos.dtype == np.float64
+    assert isinstance(arreglo[3], Vector3D)
+    assert arreglo[3] == vectores[3]
+    assert arreglo[-1] == vectores[-1]
+    assert list(arreglo) == vectores
+    assert list(arreglo.y) == [vector.y for vector in vectores]
+
+def test_slice_comparte_memoria():
+    arreglo = Vector3DArray([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    parte = arreglo[1:]
+    assert isinstance(parte, Vector3DArray) and len(parte) == 2
+    parte[0] = Vector3D(0, 0, 0)
+    assert arreglo[1] == Vector3D(0, 0, 0)
+
+def test_creacion_invalida():
+    with pytest.raises(TypeError):
+        Vector3DArray([["a", 2, 3]])
+    with pytest.raises(ValueError):
+        Vector3DArray([[1, 2], [3, 4]])
+    assert len(Vector3DArray([])) == 0
+
+def test_igualdad_por_vector():
+    arreglo = Vector3DArray([[1, 2, 3], [3, 2, 1]])
+    assert list(arreglo == Vector3D(1, 2, 3)) == [True, False]
+    assert list(arreglo != Vector3D(1, 2, 3)) == [False, True]
+
+# --- Pruebas de que cada elemento coincide con la clase escalar ---
+def test_operaciones_entre_arreglos(vectores, otros):
+    a = Vector3DArray.desde_vectores(vectores)
+    b = Vector3DArray.desde_vectores(otros)
+    assert list(a + b) == [p + q for p, q in zip(vectores, otros)]
+    assert list(a - b) == [p - q for p, q in zip(vectores, otros)]
+    assert list(a * b) == [p * q for p, q in zip(vectores, otros)]
+    assert (a % b).tolist() == [p % q for p, q in zip(vectores, otros)]
+    assert abs(a).tolist() == [abs(p) for p in vectores]
+
+def test_broadcasting_con_vector(vectores, v):
+    a = Vector3DArray.desde_vectores(vectores)
+    assert list(a + v) == [p + v for p in vectores]
+    assert list(v + a) == [v + p for p in vectores]
+    assert list(a - v) == [p - v for p in vectores]
+    assert list(v - a) == [v - p for p in vectores]
+    assert list(a * v) == [p * v for p in vectores]
+    assert list(v * a) == [v * p for p in vectores] # El producto cruz no es conmutativo
+    assert (a % v).tolist() == [p % v for p in vectores]
+    assert (v % a).tolist() == [v % p for p in vectores]
+
+@pytest.mark.parametrize("escalar", [3, -2.5])
+def test_broadcasting_con_escalar(vectores, escalar):
+    a = Vector3DArray.desde_vectores(vectores)
+    assert list(a + escalar) == [p + escalar for p in vectores]
+    assert list(escalar + a) == [escalar + p for p in vectores]
+    assert list(a - escalar) == [p - escalar for p in vectores]
+    assert list(escalar - a) == [escalar - p for p in vectores]
+    assert list(a * escalar) == [p * escalar for p in vectores]
+    assert list(escalar * a) == [escalar * p for p in vectores]
+
+def test_escalar_por_vector(vectores, v):
+    """Prueba que un ndarray de N escalares escala cada vector por su propio escalar."""
+    a = Vector3DArray.desde_vectores(vectores)
+    proyecciones = a % v
+    assert list(a * proyecciones) == [p * (p % v) for p in vectores]
+    assert list(proyecciones * a) == [(p % v) * p for p in vectores]
+
+def test_expresiones_compuestas(vectores, otros, v):
+    a = Vector3DArray.desde_vectores(vectores)
+    b = Vector3DArray.desde_vectores(otros)
+    esperado = [(p + q) * (v - p) for p, q in zip(vectores, otros)]
+    assert list((a + b) * (v - a)) == esperado
+
+# --- Pruebas de operaciones no implementadas ---
+def test_operaciones_not_implemented(v):
+    a = Vector3DArray([[1, 2, 3]])
+    with pytest.raises(TypeError):
+        a % 5
+    with pytest.raises(TypeError):
+        a + "hola"
+    with pytest.raises(ValueError):
+        a + Vector3DArray([[1, 2, 3], [4, 5, 6]])
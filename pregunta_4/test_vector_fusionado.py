@@ -0,0 +1,120 @@
+# test_vector_fusionado.py
+import math
+import random
+import threading
+import pytest
+from vector import Vector3D
+from vector_fusionado import fusionar
+
+# --- Fixtures ---
+@pytest.fixture
+def vectores():
+    rng = random.Random(11)
+    return [Vector3D(rng.uniform(-1e3, 1e3), rng.uniform(-1, 1), rng.gauss(0, 1e-3)) for _ in range(4)]
+
+def _iguales(a, b):
+    """Igualdad exacta, bit a bit, de vectores o escalares."""
+    if isinstance(a, Vector3D):
+        return (a.x, a.y, a.z) == (b.x, b.y, b.z)
+    return a == b and type(a) is type(b)
+
+# Expresiones evaluadas en modo normal y fusionadas.
+EXPRESIONES = [
+    lambda a, b, c, d: (a + b) * c % d - 2,
+    lambda a, b, c, d: abs(a * 2.5 - b + c * d),
+    lambda a, b, c, d: 3 - (a - 1.5) * b,
+    lambda a, b, c, d: 0.1 + 7 * a + b,
+    lambda a, b, c, d: d % (a + b * 3),
+    lambda a, b, c, d: (c - a) * (b + d) % (a * b),
+    lambda a, b, c, d: (a + 1) * 2,
+]
+
+# --- Pruebas de fusionar ---
+@pytest.mark.parametrize("expresion", EXPRESIONES)
+def test_fusionar_como_vector3d(vectores, expresion):
+    fusionada = fusionar(expresion)
+    for _ in range(3):
+        assert _iguales(fusionada(*vectores), expresion(*vectores))
+        vectores = vectores[1:] + vectores[:1]
+
+def test_fusionar_con_escalares_y_constantes(vectores):
+    origen = Vector3D(0.5, -2, 1e3)
+
+    def proyeccion(a, b, k):
+        """Proyección de a - origen sobre b, escalada por k, menos la norma de a."""
+        return b * ((a - origen) % b / (b % b) * k) - abs(a) + a.x
+
+    fusionada = fusionar(proyeccion, escalares=("k",))
+    a, b = vectores[:2]
+    assert _iguales(fusionada(a, b, 3.0), proyeccion(a, b, 3.0))
+    assert fusionada.__name__ == "proyeccion" and fusionada.__doc__.startswith("Proyección")
+    normalizar = fusionar(lambda a: a * (1 / abs(a)))
+    assert _iguales(normalizar(b), b * (1 / abs(b)))
+    assert _iguales(fusionar(lambda a, b: math.pi * (a % b))(a, b), math.pi * (a % b))
+
+def test_fusionar_expresion_profunda(vectores):
+    def acumular(a, b, k):
+        total = a
+        for _ in range(3000):
+            total = total * k + b
+        return total % b
+
+    fusionada = fusionar(acumular, escalares=("k",))
+    a, b = vectores[:2]
+    assert _iguales(fusionada(a, b, 0.5), acumular(a, b, 0.5))
+
+def test_fusionar_lee_parametros_al_llamar_y_copia_constantes(vectores):
+    """
+    Prueba la semántica al modificar vectores entre la fusión y la llamada: los
+    parámetros se leen en cada llamada y los Vector3D capturados quedan fijos,
+    también los que la función combina entre sí al registrarse.
+    """
+    a, b = vectores[:2]
+    origen = Vector3D(1.5, -2, 0.25)
+    original = Vector3D(1.5, -2, 0.25)
+    fusionada = fusionar(lambda p: (p - origen) % (origen * 2) + abs(p))
+    antes = fusionada(a)
+    a += b
+    origen += Vector3D(10, 10, 10)
+    assert not _iguales(fusionada(a), antes)
+    assert _iguales(fusionada(a), (a - original) % (original * 2) + abs(a))
+
+def test_fusionar_desde_varios_hilos(vectores):
+    """La fusión no usa estado global: se puede fusionar a la vez desde varios hilos."""
+    errores = []
+
+    def trabajo(expresion):
+        try:
+            for _ in range(20):
+                fusionada = fusionar(expresion)
+                if not _iguales(fusionada(*vectores), expresion(*vectores)):
+                    errores.append(expresion)
+        except Exception as e:
+            errores.append(e)
+
+    hilos = [threading.Thread(target=trabajo, args=(expresion,)) for expresion in EXPRESIONES]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert not errores
+
+def test_repr_simbolico():
+    vistos = []
+
+    def registrar(a, k):
+        vistos.append(repr(abs(a - 1) * k))
+        return a
+
+    fusionar(registrar, escalares=("k",))
+    assert vistos == ["EscalarSimbolico((abs((? - ?)) * ?))"]
+
+def test_fusionar_errores():
+    with pytest.raises(ValueError):
+        fusionar(lambda a: a, escalares=("k",))
+    with pytest.raises(TypeError):
+        fusionar(lambda a: "vector")
+    with pytest.raises(TypeError):
+        fusionar(lambda a, b: (a + b) % 2)
+    with pytest.raises(TypeError):
+        fusionar(lambda a, k: a * k + "x", escalares=("k",))
@@ -0,0 +1,120 @@
+# test_vector_io.py
+import io
+import struct
+import pytest
+from vector import Vector3D
+from vector_io import (
+    VectoresEmpaquetados, abrir_vectores, iterar_bloques, iterar_vectores,
+    escribir_vectores, TAMANO_TERNA,
+)
+
+# --- Fixtures con vectores de prueba ---
+@pytest.fixture
+def vectores():
+    return [Vector3D(i, -i / 2, i * 0.25) for i in range(10)]
+
+@pytest.fixture
+def archivo(tmp_path, vectores):
+    path = tmp_path / "puntos.bin"
+    escribir_vectores(path, vectores)
+    return path
+
+# --- Pruebas de la secuencia perezosa ---
+def test_formato_ternas_little_endian():
+    buffer = io.BytesIO()
+    assert escribir_vectores(buffer, [Vector3D(1, 2, 3)]) == 1
+    assert buffer.getvalue() == struct.pack("<ddd", 1.0, 2.0, 3.0)
+
+def test_secuencia_sobre_buffer(vectores):
+    buffer = io.BytesIO()
+    escribir_vectores(buffer, vectores)
+    secuencia = VectoresEmpaquetados(buffer.getvalue())
+    assert len(secuencia) == 10
+    assert secuencia[3] == vectores[3]
+    assert secuencia[-1] == vectores[-1]
+    assert list(secuencia) == vectores
+    with pytest.raises(IndexError):
+        secuencia[10]
+
+def test_slices_sin_copia(vectores):
+    """Prueba que los slices y la secuencia leen el buffer original, sin copiarlo."""
+    datos = bytearray(len(vectores) * TAMANO_TERNA)
+    escribir_vectores(io.BytesIO(), vectores) # no afecta a `datos`
+    secuencia = VectoresEmpaquetados(datos)
+    parte = secuencia[2:8:2]
+    assert len(parte) == 3
+    struct.pack_into("<ddd", datos, 4 * TAMANO_TERNA, 7, 8, 9)
+    assert secuencia[4] == Vector3D(7, 8, 9)
+    assert parte[1] == Vector3D(7, 8, 9)
+    assert list(parte)[1] == Vector3D(7, 8, 9)
+    assert list(secuencia[3:5]) == [Vector3D(0, 0, 0), Vector3D(7, 8, 9)]
+
+def test_buffer_invalido():
+    with pytest.raises(ValueError, match="múltiplo de 24"):
+        VectoresEmpaquetados(b"\0" * 25)
+
+# --- Pruebas con archivos mapeados en memoria ---
+def test_abrir_con_mmap(archivo, vectores):
+    with abrir_vectores(archivo) as secuencia:
+        parte = secuencia[5:]
+        assert list(parte) == vectores[5:]
+        assert secuencia[0] == vectores[0]
+    assert secuencia._mapa is None
+    with pytest.raises(ValueError):
+        parte[0] # La vista se liberó al cerrar
+
+def test_abrir_archivo_vacio(tmp_path):
+    path = tmp_path / "vacio.bin"
+    path.write_bytes(b"")
+    with abrir_vectores(path) as secuencia:
+        assert len(secuencia) == 0 and list(secuencia) == []
+
+def test_abrir_archivo_truncado(tmp_path):
+    path = tmp_path / "truncado.bin"
+    path.write_bytes(b"\0" * 30)
+    with pytest.raises(ValueError):
+        abrir_vectores(path)
+
+# --- Pruebas de lectura y escritura por bloques ---
+def test_iterar_por_bloques(archivo, vectores):
+    bloques = list(iterar_bloques(archivo, vectores_por_bloque=4))
+    assert [len(bloque) for bloque in bloques] == [4, 4, 2]
+    assert list(iterar_vectores(archivo, vectores_por_bloque=3)) == vectores
+    with open(archivo, "rb") as abierto:
+        assert list(iterar_vectores(abierto)) == vectores
+
+class _LecturaParcial(io.RawIOBase):
+    """Archivo que devuelve como mucho 7 bytes por lectura, como una tubería."""
+    def __init__(self, datos):
+        self._datos = io.BytesIO(datos)
+
+    def read(self, n=-1):
+        return self._datos.read(min(n, 7))
+
+def test_iterar_con_lecturas_parciales(vectores):
+    buffer = io.BytesIO()
+    escribir_vectores(buffer, vectores)
+    assert list(iterar_vectores(_LecturaParcial(buffer.getvalue()), vectores_por_bloque=4)) == vectores
+    with pytest.raises(ValueError, match="incompleta"):
+        list(iterar_vectores(_LecturaParcial(buffer.getvalue()[:-5])))
+
+class _ContarEscrituras(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.escrituras = 0
+
+    def write(self, datos):
+        self.escrituras += 1
+        return super().write(datos)
+
+def test_escritura_una_por_bloque(vectores):
+    destino = _ContarEscrituras()
+    assert escribir_vectores(destino, iter(vectores), vectores_por_bloque=4) == 10
+    assert destino.escrituras == 3
+    assert list(VectoresEmpaquetados(destino.getvalue())) == vectores
+
+def test_bloques_invalidos(archivo):
+    with pytest.raises(ValueError):
+        escribir_vectores(io.BytesIO(), [], vectores_por_bloque=0)
+    with pytest.raises(ValueError):
+        list(iterar_bloques(archivo, vectores_por_bloque=0))
@@ -1,6 +1,9 @@
 # vector.py
 import math
 
+# Tipos aceptados como coordenadas y como escalares.
+_NUMERICOS = (int, float)
+
 class Vector3D:
     """
     Una clase para representar vectores tridimensionales y operar con ellos.
@@ -12,9 +15,15 @@ class Vector3D:
     - Multiplicación Escalar (*): Vector * Escalar
     - Producto Punto (%): Vector % Vector
     - Norma (abs()): abs(Vector)
+    - Operadores en su lugar (+=, -=, *=): modifican el vector sin crear otro
+
+    Usa __slots__ (sin __dict__ por instancia) y los resultados de las operaciones
+    se construyen con `_crear`, que omite la validación de las coordenadas.
     """
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x, y, z):
-        if not all(isinstance(i, (int, float)) for i in [x, y, z]):
+        if not (isinstance(x, _NUMERICOS) and isinstance(y, _NUMERICOS) and isinstance(z, _NUMERICOS)):
             raise TypeError("Las coordenadas del vector deben ser numéricas.")
         self.x = x
         self.y = y
@@ -32,29 +41,57 @@ class Vector3D:
     def __add__(self, other):
         """Sobrecarga del operador +. Suma con otro vector o un escalar."""
         if isinstance(other, Vector3D):
-            return Vector3D(self.x + other.x, self.y + other.y, self.z + other.z)
-        if isinstance(other, (int, float)):
-            return Vector3D(self.x + other, self.y + other, self.z + other)
+            return _crear(self.x + other.x, self.y + other.y, self.z + other.z)
+        if isinstance(other, _NUMERICOS):
+            return _crear(self.x + other, self.y + other, self.z + other)
         return NotImplemented
 
     def __radd__(self, other):
         """Permite la suma conmutativa (ej. 3 + vector)."""
         return self.__add__(other)
 
+    def __iadd__(self, other):
+        """Sobrecarga del operador +=. Suma en su lugar, sin crear un vector nuevo."""
+        if isinstance(other, Vector3D):
+            self.x += other.x
+            self.y += other.y
+            self.z += other.z
+        elif isinstance(other, _NUMERICOS):
+            self.x += other
+            self.y += other
+            self.z += other
+        else:
+            return NotImplemented
+        return self
+
     # Operación de Resta (-)
     def __sub__(self, other):
         """Sobrecarga del operador -. Resta con otro vector o un escalar."""
         if isinstance(other, Vector3D):
-            return Vector3D(self.x - other.x, self.y - other.y, self.z - other.z)
-        if isinstance(other, (int, float)):
-            return Vector3D(self.x - other, self.y - other, self.z - other)
+            return _crear(self.x - other.x, self.y - other.y, self.z - other.z)
+        if isinstance(other, _NUMERICOS):
+            return _crear(self.x - other, self.y - other, self.z - other)
         return NotImplemented
 
     def __rsub__(self, other):
         """Permite la resta por la izquierda (ej. 3 - vector)."""
-        if isinstance(other, (int, float)):
-            return Vector3D(other - self.x, other - self.y, other - self.z)
+        if isinstance(other, _NUMERICOS):
+            return _crear(other - self.x, other - self.y, other - self.z)
         return NotImplemented
+
+    def __isub__(self, other):
+        """Sobrecarga del operador -=. Resta en su lugar, sin crear un vector nuevo."""
+        if isinstance(other, Vector3D):
+            self.x -= other.x
+            self.y -= other.y
+            self.z -= other.z
+        elif isinstance(other, _NUMERICOS):
+            self.x -= other
+            self.y -= other
+            self.z -= other
+        else:
+            return NotImplemented
+        return self
         
     # Operación de Multiplicación (*): Producto Cruz o Multiplicación Escalar
     def __mul__(self, other):
@@ -67,15 +104,34 @@ class Vector3D:
             x = self.y * other.z - self.z * other.y
             y = self.z * other.x - self.x * other.z
             z = self.x * other.y - self.y * other.x
-            return Vector3D(x, y, z)
-        if isinstance(other, (int, float)): # Multiplicación Escalar
-            return Vector3D(self.x * other, self.y * other, self.z * other)
+            return _crear(x, y, z)
+        if isinstance(other, _NUMERICOS): # Multiplicación Escalar
+            return _crear(self.x * other, self.y * other, self.z * other)
         return NotImplemented
     
     def __rmul__(self, other):
         """Permite la multiplicación conmutativa (ej. 3 * vector)."""
         return self.__mul__(other)
 
+    def __imul__(self, other):
+        """
+        Sobrecarga del operador *=. Producto cruz o multiplicación escalar en su lugar.
+        El producto cruz se calcula con los valores anteriores, así que `v *= v` es válido.
+        """
+        if isinstance(other, Vector3D):
+            self.x, self.y, self.z = (
+                self.y * other.z - self.z * other.y,
+                self.z * other.x - self.x * other.z,
+                self.x * other.y - self.y * other.x,
+            )
+        elif isinstance(other, _NUMERICOS):
+            self.x *= other
+            self.y *= other
+            self.z *= other
+        else:
+            return NotImplemented
+        return self
+
     # Operación de Producto Punto (%)
     def __mod__(self, other):
         """Sobrecarga del operador % para el producto punto."""
@@ -86,4 +142,15 @@ class Vector3D:
     # Operación de Norma (usando abs())
     def __abs__(self):
         """Sobrecarga de la función abs() para calcular la norma (magnitud) del vector."""
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
\ No newline at end of file
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+
+_nuevo = object.__new__
+
+def _crear(x, y, z):
+    """Constructor interno para los resultados de las operaciones: no valida las coordenadas."""
+    vector = _nuevo(Vector3D)
+    vector.x = x
+    vector.y = y
+    vector.z = z
+    return vector
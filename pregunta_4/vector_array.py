@@ -0,0 +1,202 @@
+# vector_array.py
+import numpy as np
+
+from vector import Vector3D, _crear
+
+
+class Vector3DArray:
+    """
+    Arreglo de N vectores tridimensionales respaldado por un ndarray (N, 3) de float64.
+
+    Soporta los mismos operadores que Vector3D, vectorizados. El otro operando
+    puede ser otro Vector3DArray de la misma longitud, un Vector3D o un escalar
+    (que se aplican a todos los vectores), o un ndarray de N escalares (uno por vector):
+    - Suma (+) y Resta (-), también por la izquierda (ej. 3 - arreglo)
+    - Producto Cruz (*) con vectores y Multiplicación Escalar (*) con escalares
+    - Producto Punto (%): devuelve un ndarray de N escalares
+    - Norma (abs()): devuelve un ndarray de N normas
+
+    Cada componente se calcula con la misma fórmula que Vector3D, así que el
+    elemento i del resultado coincide con la operación escalar sobre el vector i.
+    Indexar con un entero devuelve un Vector3D; con un slice, un Vector3DArray
+    que comparte la memoria del original.
+    """
+    # Hace que numpy delegue en nuestros operadores reflejados (ej. ndarray + Vector3DArray).
+    __array_ufunc__ = None
+    __hash__ = None
+
+    def __init__(self, datos):
+        if isinstance(datos, Vector3DArray):
+            datos = datos.datos
+        try:
+            datos = np.array(datos, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise TypeError("Las coordenadas de los vectores deben ser numéricas.") from None
+        if datos.size == 0:
+            datos = datos.reshape(0, 3)
+        if datos.ndim != 2 or datos.shape[1] != 3:
+            raise ValueError(f"Se esperaba un arreglo de forma (N, 3), no {datos.shape}.")
+        self.datos = datos
+
+    @classmethod
+    def desde_vectores(cls, vectores):
+        """Construye el arreglo a partir de un iterable de Vector3D."""
+        return cls([(v.x, v.y, v.z) for v in vectores])
+
+    @classmethod
+    def _envolver(cls, datos):
+        """Crea un arreglo sobre `datos` (ya (N, 3) float64) sin copiarlo ni validarlo."""
+        arreglo = cls.__new__(cls)
+        arreglo.datos = datos
+        return arreglo
+
+    @property
+    def x(self):
+        return self.datos[:, 0]
+
+    @property
+    def y(self):
+        return self.datos[:, 1]
+
+    @property
+    def z(self):
+        return self.datos[:, 2]
+
+    def __len__(self):
+        return len(self.datos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, (int, np.integer)):
+            x, y, z = self.datos[indice].tolist()
+            return _crear(x, y, z)
+        return self._envolver(self.datos[indice])
+
+    def __setitem__(self, indice, valor):
+        if isinstance(valor, Vector3D):
+            valor = (valor.x, valor.y, valor.z)
+        elif isinstance(valor, Vector3DArray):
+            valor = valor.datos
+        self.datos[indice] = valor
+
+    def __iter__(self):
+        for x, y, z in self.datos.tolist():
+            yield _crear(x, y, z)
+
+    def __repr__(self):
+        """Representación del arreglo como string, útil para debugging."""
+        return f"Vector3DArray({self.datos.tolist()!r})"
+
+    def __eq__(self, other):
+        """Compara vector a vector; devuelve un ndarray de N booleanos."""
+        otro = self._operando(other)
+        if otro is NotImplemented:
+            return NotImplemented
+        return np.all(self.datos == otro, axis=-1)
+
+    def __ne__(self, other):
+        iguales = self.__eq__(other)
+        if iguales is NotImplemented:
+            return NotImplemented
+        return ~iguales
+
+    def _operando(self, other):
+        """
+        Adapta el otro operando para operar por columnas con broadcasting:
+        un ndarray (N, 3) o (3,) para vectores, un escalar, o un ndarray (N, 1)
+        para un escalar por vector. Devuelve NotImplemented si no es compatible.
+        """
+        if isinstance(other, Vector3DArray):
+            if len(other) != len(self):
+                raise ValueError(f"Los arreglos tienen longitudes distintas: {len(self)} y {len(other)}.")
+            return other.datos
+        if isinstance(other, Vector3D):
+            return np.array((other.x, other.y, other.z), dtype=np.float64)
+        if isinstance(other, (int, float)):
+            return other
+        if isinstance(other, np.ndarray) and other.shape == (len(self),):
+            return other.reshape(-1, 1)
+        return NotImplemented
+
+    @staticmethod
+    def _es_vectorial(operando):
+        """True si el operando adaptado son vectores y no escalares ((N, 1) tiene una sola columna)."""
+        return isinstance(operando, np.ndarray) and operando.shape[-1] == 3
+
+    # Operación de Suma (+)
+    def __add__(self, other):
+        """Suma con otro arreglo, un vector o escalares."""
+        otro = self._operando(other)
+        if otro is NotImplemented:
+            return NotImplemented
+        return self._envolver(self.datos + otro)
+
+    def __radd__(self, other):
+        """Permite la suma conmutativa (ej. vector + arreglo)."""
+        return self.__add__(other)
+
+    # Operación de Resta (-)
+    def __sub__(self, other):
+        """Resta otro arreglo, un vector o escalares."""
+        otro = self._operando(other)
+        if otro is NotImplemented:
+            return NotImplemented
+        return self._envolver(self.datos - otro)
+
+    def __rsub__(self, other):
+        """Permite la resta por la izquierda (ej. vector - arreglo o 3 - arreglo)."""
+        otro = self._operando(other)
+        if otro is NotImplemented:
+            return NotImplemented
+        return self._envolver(otro - self.datos)
+
+    # Operación de Multiplicación (*): Producto Cruz o Multiplicación Escalar
+    def __mul__(self, other):
+        """
+        - Con vectores (Vector3D o Vector3DArray), calcula el producto cruz de cada par.
+        - Con escalares, calcula la multiplicación escalar.
+        """
+        otro = self._operando(other)
+        if otro is NotImplemented:
+            return NotImplemented
+        if self._es_vectorial(otro):
+            return self._cruz(self.datos, otro)
+        return self._envolver(self.datos * otro)
+
+    def __rmul__(self, other):
+        """Multiplicación por la izquierda; con un vector el orden del producto cruz importa."""
+        otro = self._operando(other)
+        if otro is NotImplemented:
+            return NotImplemented
+        if self._es_vectorial(otro):
+            return self._cruz(otro, self.datos)
+        return self._envolver(otro * self.datos)
+
+    @classmethod
+    def _cruz(cls, a, b):
+        # Misma fórmula, componente a componente, que Vector3D.__mul__.
+        a = np.broadcast_to(a, np.broadcast_shapes(a.shape, b.shape))
+        b = np.broadcast_to(b, a.shape)
+        resultado = np.empty(a.shape, dtype=np.float64)
+        resultado[:, 0] = a[:, 1] * b[:, 2] - a[:, 2] * b[:, 1]
+        resultado[:, 1] = a[:, 2] * b[:, 0] - a[:, 0] * b[:, 2]
+        resultado[:, 2] = a[:, 0] * b[:, 1] - a[:, 1] * b[:, 0]
+        return cls._envolver(resultado)
+
+    # Operación de Producto Punto (%)
+    def __mod__(self, other):
+        """Producto punto de cada vector con otro arreglo o un vector. Devuelve un ndarray de N escalares."""
+        otro = self._operando(other)
+        if not self._es_vectorial(otro):
+            return NotImplemented
+        a, b = self.datos, otro
+        return a[:, 0] * b[..., 0] + a[:, 1] * b[..., 1] + a[:, 2] * b[..., 2]
+
+    def __rmod__(self, other):
+        """Permite el producto punto por la izquierda (ej. vector % arreglo)."""
+        return self.__mod__(other)
+
+    # Operación de Norma (usando abs())
+    def __abs__(self):
+        """Norma de cada vector; devuelve un ndarray de N normas."""
+        x, y, z = self.x, self.y, self.z
+        return np.sqrt(x * x + y * y + z * z)
@@ -0,0 +1,317 @@
+# vector_fusionado.py
+import inspect
+import math
+
+from vector import Vector3D, _crear, _NUMERICOS
+
+# Formas de las expresiones que registra `fusionar`. `op` e `hijos`:
+#   "V" / "S"                       hoja vectorial / escalar con un valor constante (`valor`)
+#   "P" / "Q"                       hoja vectorial / escalar parámetro (`valor` es su índice)
+#   op en + - * con (izq, der)      vector op vector, o vector op escalar (el escalar siempre a la derecha)
+#   "r-" con (escalar, vector)      escalar - vector
+#   "%" (izq, der), "abs" (v,), "x" (v,), "y" (v,), "z" (v,)    resultados escalares
+#   "s+" (izq, der) ... "s/" (izq, der)                         aritmética entre escalares
+_VECTORIALES = ("V", "P", "+", "-", "*", "r-")
+_OPERADOR = {"s+": "+", "s-": "-", "s*": "*", "s/": "/", "r-": "-"}
+
+_nuevo = object.__new__
+
+
+class _Forma:
+    """Un nodo del árbol de operaciones registrado por `fusionar`."""
+    __slots__ = ("op", "hijos", "valor")
+
+    def __init__(self, op, hijos=(), valor=None):
+        self.op = op
+        self.hijos = hijos
+        self.valor = valor
+
+
+def _simbolo(clase, forma):
+    simbolo = _nuevo(clase)
+    simbolo._forma = forma
+    return simbolo
+
+
+class VectorSimbolico:
+    """
+    Vector dentro de una función que se está fusionando (un parámetro, o un
+    resultado calculado a partir de ellos). Los operadores +, - y * (con
+    Vector3D, números, escalares simbólicos u otros vectores simbólicos) no
+    calculan nada: agregan un nodo al árbol que después compila `fusionar`.
+    `%`, `abs()` y `.x/.y/.z` dan escalares simbólicos.
+    """
+    __slots__ = ("_forma",)
+
+    def _binario(self, op, other, izquierda=True):
+        if isinstance(other, Vector3D):
+            forma = _Forma("V", valor=other)
+        elif isinstance(other, VectorSimbolico):
+            forma = other._forma
+        elif isinstance(other, _NUMERICOS):
+            # Como en Vector3D, el escalar queda siempre a la derecha (s + v calcula v.x + s).
+            return _simbolo(VectorSimbolico, _Forma(op, (self._forma, _Forma("S", valor=other))))
+        elif isinstance(other, EscalarSimbolico):
+            return _simbolo(VectorSimbolico, _Forma(op, (self._forma, other._forma)))
+        else:
+            return NotImplemented
+        hijos = (self._forma, forma) if izquierda else (forma, self._forma)
+        return _simbolo(VectorSimbolico, _Forma(op, hijos))
+
+    def __add__(self, other):
+        return self._binario("+", other)
+
+    def __radd__(self, other):
+        return self._binario("+", other, izquierda=False)
+
+    def __sub__(self, other):
+        return self._binario("-", other)
+
+    def __rsub__(self, other):
+        if isinstance(other, _NUMERICOS):
+            return _simbolo(VectorSimbolico, _Forma("r-", (_Forma("S", valor=other), self._forma)))
+        if isinstance(other, EscalarSimbolico):
+            return _simbolo(VectorSimbolico, _Forma("r-", (other._forma, self._forma)))
+        return self._binario("-", other, izquierda=False)
+
+    def __mul__(self, other):
+        return self._binario("*", other)
+
+    def __rmul__(self, other):
+        return self._binario("*", other, izquierda=False)
+
+    def __mod__(self, other):
+        if isinstance(other, Vector3D):
+            return _simbolo(EscalarSimbolico, _Forma("%", (self._forma, _Forma("V", valor=other))))
+        if isinstance(other, VectorSimbolico):
+            return _simbolo(EscalarSimbolico, _Forma("%", (self._forma, other._forma)))
+        return NotImplemented
+
+    def __rmod__(self, other):
+        if isinstance(other, Vector3D):
+            return _simbolo(EscalarSimbolico, _Forma("%", (_Forma("V", valor=other), self._forma)))
+        return NotImplemented
+
+    def __abs__(self):
+        return _simbolo(EscalarSimbolico, _Forma("abs", (self._forma,)))
+
+    @property
+    def x(self):
+        return _simbolo(EscalarSimbolico, _Forma("x", (self._forma,)))
+
+    @property
+    def y(self):
+        return _simbolo(EscalarSimbolico, _Forma("y", (self._forma,)))
+
+    @property
+    def z(self):
+        return _simbolo(EscalarSimbolico, _Forma("z", (self._forma,)))
+
+    def __repr__(self):
+        return f"VectorSimbolico({_texto(self._forma)})"
+
+
+class EscalarSimbolico:
+    """
+    Escalar dentro de una función que se está fusionando (un parámetro escalar,
+    o un producto punto, norma o coordenada de un vector simbólico). Admite
+    + - * / con números, con otros escalares y como escalar de un vector simbólico.
+    """
+    __slots__ = ("_forma",)
+
+    def _binario(self, op, other, izquierda=True):
+        if isinstance(other, EscalarSimbolico):
+            forma = other._forma
+        elif isinstance(other, _NUMERICOS):
+            forma = _Forma("S", valor=other)
+        else:
+            return NotImplemented
+        hijos = (self._forma, forma) if izquierda else (forma, self._forma)
+        return _simbolo(EscalarSimbolico, _Forma(op, hijos))
+
+    def __add__(self, other):
+        return self._binario("s+", other)
+
+    def __radd__(self, other):
+        return self._binario("s+", other, izquierda=False)
+
+    def __sub__(self, other):
+        return self._binario("s-", other)
+
+    def __rsub__(self, other):
+        return self._binario("s-", other, izquierda=False)
+
+    def __mul__(self, other):
+        return self._binario("s*", other)
+
+    def __rmul__(self, other):
+        return self._binario("s*", other, izquierda=False)
+
+    def __truediv__(self, other):
+        return self._binario("s/", other)
+
+    def __rtruediv__(self, other):
+        return self._binario("s/", other, izquierda=False)
+
+    def __repr__(self):
+        return f"EscalarSimbolico({_texto(self._forma)})"
+
+
+# --- Compilación ---
+# Los recorridos de las formas usan pilas, no recursión: las funciones fusionadas
+# pueden tener miles de operaciones encadenadas.
+
+def _texto(forma):
+    """Expresión legible de una forma, con ? en lugar de cada hoja."""
+    textos = []
+    pendientes = [(forma, False)]
+    while pendientes:
+        forma, listo = pendientes.pop()
+        op, hijos = forma.op, forma.hijos
+        if not hijos:
+            textos.append("?")
+        elif not listo:
+            pendientes.append((forma, True))
+            pendientes.extend((hijo, False) for hijo in reversed(hijos))
+        elif len(hijos) == 1:
+            v = textos.pop()
+            textos.append(f"abs({v})" if op == "abs" else f"{v}.{op}")
+        else:
+            der = textos.pop()
+            izq = textos.pop()
+            textos.append(f"({izq} {_OPERADOR.get(op, op)} {der})")
+    return textos[0]
+
+
+def _es_vector(forma):
+    return forma.op in _VECTORIALES
+
+
+def _hojas(forma):
+    """Hojas de la forma, de izquierda a derecha."""
+    hojas = []
+    pendientes = [forma]
+    while pendientes:
+        forma = pendientes.pop()
+        if forma.hijos:
+            pendientes.extend(reversed(forma.hijos))
+        else:
+            hojas.append(forma)
+    return hojas
+
+
+def _generar(forma, hojas):
+    """
+    Genera las líneas que calculan la forma y el nombre del resultado: `tN` para
+    un escalar, o `tN` con las coordenadas en tNx, tNy y tNz para un vector.
+    `hojas` son los textos de las hojas, de izquierda a derecha.
+    """
+    lineas = []
+    siguiente = iter(hojas)
+    contador = 0
+    # Recorrido en postorden: `nombres` guarda los resultados de los hijos ya generados.
+    nombres = []
+    pendientes = [(forma, False)]
+    while pendientes:
+        forma, listo = pendientes.pop()
+        op = forma.op
+        if op in ("S", "Q"):
+            nombres.append(next(siguiente))
+            continue
+        if not listo and forma.hijos:
+            pendientes.append((forma, True))
+            pendientes.extend((hijo, False) for hijo in reversed(forma.hijos))
+            continue
+        contador += 1
+        nombre = f"t{contador}"
+        if op in ("V", "P"):
+            hoja = next(siguiente)
+            lineas.append(f"{nombre}x = {hoja}.x; {nombre}y = {hoja}.y; {nombre}z = {hoja}.z")
+        elif op == "abs":
+            v = nombres.pop()
+            lineas.append(f"{nombre} = _sqrt({v}x * {v}x + {v}y * {v}y + {v}z * {v}z)")
+        elif op in ("x", "y", "z"):
+            lineas.append(f"{nombre} = {nombres.pop()}{op}")
+        else:
+            der = nombres.pop()
+            izq = nombres.pop()
+            # Las mismas fórmulas, en el mismo orden, que los operadores de Vector3D.
+            if op == "%":
+                lineas.append(f"{nombre} = {izq}x * {der}x + {izq}y * {der}y + {izq}z * {der}z")
+            elif op in ("s+", "s-", "s*", "s/"):
+                lineas.append(f"{nombre} = {izq} {_OPERADOR[op]} {der}")
+            elif op == "r-":
+                lineas.append(f"{nombre}x = {izq} - {der}x; {nombre}y = {izq} - {der}y; {nombre}z = {izq} - {der}z")
+            elif not _es_vector(forma.hijos[1]):
+                lineas.append(f"{nombre}x = {izq}x {op} {der}; {nombre}y = {izq}y {op} {der}; {nombre}z = {izq}z {op} {der}")
+            elif op == "*":
+                lineas.append(
+                    f"{nombre}x = {izq}y * {der}z - {izq}z * {der}y; "
+                    f"{nombre}y = {izq}z * {der}x - {izq}x * {der}z; "
+                    f"{nombre}z = {izq}x * {der}y - {izq}y * {der}x"
+                )
+            else:
+                lineas.append(f"{nombre}x = {izq}x {op} {der}x; {nombre}y = {izq}y {op} {der}y; {nombre}z = {izq}z {op} {der}z")
+        nombres.append(nombre)
+    return lineas, nombres[0]
+
+
+def _compilar(parametros, forma, hojas, constantes):
+    """Compila la forma como una función de `parametros`; el código generado queda en `.codigo`."""
+    lineas, resultado = _generar(forma, hojas)
+    retorno = f"_crear({resultado}x, {resultado}y, {resultado}z)" if _es_vector(forma) else resultado
+    codigo = "\n    ".join([f"def _expresion({', '.join(parametros)}):"] + lineas + [f"return {retorno}"])
+    espacio = {"_crear": _crear, "_sqrt": math.sqrt}
+    espacio.update(constantes)
+    exec(codigo, espacio)
+    funcion = espacio["_expresion"]
+    funcion.codigo = codigo
+    return funcion
+
+
+def fusionar(funcion, escalares=()):
+    """
+    Compila una función de vectores en una sola función fusionada. La función se
+    ejecuta una vez con argumentos simbólicos para registrar sus operaciones (por
+    eso solo puede usar +, -, *, %, abs(), .x/.y/.z y / entre escalares, sin
+    condicionales que dependan de los valores), y el resultado es una función
+    con los mismos parámetros que calcula todo en una sola pasada, sin crear
+    objetos intermedios.
+
+    Los parámetros se tratan como Vector3D, salvo los nombrados en `escalares`.
+    Los resultados son idénticos a los de ejecutar la función original con Vector3D.
+    Los parámetros se leen en cada llamada; los demás valores que use la función
+    (números o Vector3D capturados) se copian al fusionar, así que modificarlos
+    después no cambia la función fusionada.
+    """
+    nombres = list(inspect.signature(funcion).parameters)
+    desconocidos = set(escalares) - set(nombres)
+    if desconocidos:
+        raise ValueError(f"Parámetros escalares inexistentes: {', '.join(sorted(desconocidos))}.")
+    simbolos = []
+    for i, nombre in enumerate(nombres):
+        if nombre in escalares:
+            simbolos.append(_simbolo(EscalarSimbolico, _Forma("Q", valor=i)))
+        else:
+            simbolos.append(_simbolo(VectorSimbolico, _Forma("P", valor=i)))
+    resultado = funcion(*simbolos)
+    if isinstance(resultado, Vector3D):
+        resultado = _simbolo(VectorSimbolico, _Forma("V", valor=resultado))
+    if not isinstance(resultado, (VectorSimbolico, EscalarSimbolico)):
+        raise TypeError("La función debe devolver un vector o un escalar calculado a partir de sus parámetros.")
+
+    # Las hojas parámetro guardan su índice; las constantes se pasan por nombre, no
+    # como texto, y los Vector3D se copian para que no cambien después de fusionar.
+    parametros = [f"p{i}" for i in range(len(nombres))]
+    textos, constantes = [], {}
+    for i, hoja in enumerate(_hojas(resultado._forma)):
+        if hoja.op in ("P", "Q"):
+            textos.append(parametros[hoja.valor])
+        else:
+            textos.append(f"c{i}")
+            valor = hoja.valor
+            constantes[f"c{i}"] = _crear(valor.x, valor.y, valor.z) if hoja.op == "V" else valor
+    fusionada = _compilar(parametros, resultado._forma, textos, constantes)
+    fusionada.__name__ = fusionada.__qualname__ = funcion.__name__
+    fusionada.__doc__ = funcion.__doc__
+    return fusionada
@@ -0,0 +1,175 @@
+# vector_io.py
+import mmap
+import struct
+import sys
+
+from vector import _crear
+
+# Formato en disco: cada vector es una terna de float64 little-endian (x, y, z), sin cabecera.
+TERNA = struct.Struct("<3d")
+TAMANO_TERNA = TERNA.size
+
+# En una máquina little-endian los bytes del archivo ya son floats nativos y se leen sin desempaquetar.
+_NATIVO = sys.byteorder == "little"
+
+
+class VectoresEmpaquetados:
+    """
+    Secuencia perezosa de Vector3D sobre un buffer de ternas empaquetadas
+    (bytes, bytearray, memoryview o mmap), sin copiarlo: cada Vector3D se
+    construye recién al indexar o iterar, así que en memoria solo está el buffer.
+
+    Los slices devuelven otra VectoresEmpaquetados sobre el mismo buffer.
+    `cerrar()` (o salir del bloque `with`) libera la vista y, si la secuencia
+    se abrió con `abrir_vectores`, cierra el mmap; después ninguna secuencia
+    derivada puede usarse.
+    """
+    def __init__(self, buffer):
+        vista = memoryview(buffer).cast("B")
+        if len(vista) % TAMANO_TERNA:
+            largo = len(vista)
+            vista.release()
+            raise ValueError(
+                f"El buffer tiene {largo} bytes, que no es múltiplo de {TAMANO_TERNA} (una terna de float64)."
+            )
+        self._vista = vista
+        self._dobles = vista.cast("d") if _NATIVO else None
+        self._indices = range(len(vista) // TAMANO_TERNA)
+        self._mapa = None
+
+    def _derivar(self, indices):
+        """Secuencia sobre los mismos buffers con otro rango de índices."""
+        derivada = object.__new__(VectoresEmpaquetados)
+        derivada._vista = self._vista
+        derivada._dobles = self._dobles
+        derivada._indices = indices
+        derivada._mapa = None
+        return derivada
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return self._derivar(self._indices[indice])
+        j = self._indices[indice]
+        dobles = self._dobles
+        if dobles is not None:
+            j *= 3
+            return _crear(dobles[j], dobles[j + 1], dobles[j + 2])
+        return _crear(*TERNA.unpack_from(self._vista, j * TAMANO_TERNA))
+
+    def __iter__(self):
+        indices = self._indices
+        if indices.step == 1:
+            tramo = self._vista[indices.start * TAMANO_TERNA:indices.stop * TAMANO_TERNA]
+            try:
+                for x, y, z in TERNA.iter_unpack(tramo):
+                    yield _crear(x, y, z)
+            finally:
+                tramo.release()
+        else:
+            for j in indices:
+                yield _crear(*TERNA.unpack_from(self._vista, j * TAMANO_TERNA))
+
+    def __repr__(self):
+        return f"VectoresEmpaquetados({len(self)} vectores)"
+
+    def cerrar(self):
+        """Libera las vistas sobre el buffer y cierra el mmap si lo hay."""
+        if self._dobles is not None:
+            self._dobles.release()
+        self._vista.release()
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def abrir_vectores(path):
+    """
+    Abre un archivo de ternas empaquetadas como VectoresEmpaquetados respaldada
+    por un mmap de solo lectura: el sistema operativo carga las páginas a medida
+    que se accede a los vectores. Use `cerrar()` o un bloque `with` al terminar.
+    """
+    with open(path, "rb") as archivo:
+        if archivo.seek(0, 2) == 0:
+            return VectoresEmpaquetados(b"") # mmap no admite archivos vacíos
+        mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        vectores = VectoresEmpaquetados(mapa)
+    except ValueError:
+        mapa.close()
+        raise
+    vectores._mapa = mapa
+    return vectores
+
+
+def iterar_bloques(origen, vectores_por_bloque=65536):
+    """
+    Lee un archivo (ruta u objeto binario abierto) bloque por bloque y produce
+    una VectoresEmpaquetados por bloque. Solo un bloque está en memoria a la vez,
+    así que sirve para archivos más grandes que la RAM.
+    Lanza ValueError si el archivo termina con una terna incompleta.
+    """
+    if vectores_por_bloque <= 0:
+        raise ValueError("La cantidad de vectores por bloque debe ser positiva.")
+    if isinstance(origen, (str, bytes)) or hasattr(origen, "__fspath__"):
+        with open(origen, "rb") as archivo:
+            yield from iterar_bloques(archivo, vectores_por_bloque)
+        return
+    tamano = vectores_por_bloque * TAMANO_TERNA
+    while True:
+        bloque = origen.read(tamano)
+        if not bloque:
+            return
+        # Un read puede devolver menos bytes (tuberías, sockets): completar hasta una terna entera.
+        while len(bloque) % TAMANO_TERNA:
+            resto = origen.read(TAMANO_TERNA - len(bloque) % TAMANO_TERNA)
+            if not resto:
+                raise ValueError("El archivo termina con una terna incompleta.")
+            bloque += resto
+        yield VectoresEmpaquetados(bloque)
+
+
+def iterar_vectores(origen, vectores_por_bloque=65536):
+    """Itera los Vector3D de un archivo de ternas leyéndolo por bloques (ver `iterar_bloques`)."""
+    for bloque in iterar_bloques(origen, vectores_por_bloque):
+        yield from bloque
+
+
+def escribir_vectores(destino, vectores, vectores_por_bloque=65536):
+    """
+    Escribe un iterable de Vector3D como ternas empaquetadas en `destino` (ruta u
+    objeto binario abierto). Los vectores se empaquetan en un buffer reutilizado y
+    se hace una sola escritura por bloque. Devuelve la cantidad de vectores escritos.
+    """
+    if vectores_por_bloque <= 0:
+        raise ValueError("La cantidad de vectores por bloque debe ser positiva.")
+    if isinstance(destino, (str, bytes)) or hasattr(destino, "__fspath__"):
+        with open(destino, "wb") as archivo:
+            return escribir_vectores(archivo, vectores, vectores_por_bloque)
+
+    buffer = bytearray(vectores_por_bloque * TAMANO_TERNA)
+    vista = memoryview(buffer)
+    empaquetar = TERNA.pack_into
+    total = 0
+    desplazamiento = 0
+    try:
+        for vector in vectores:
+            empaquetar(buffer, desplazamiento, vector.x, vector.y, vector.z)
+            desplazamiento += TAMANO_TERNA
+            total += 1
+            if desplazamiento == len(buffer):
+                destino.write(vista)
+                desplazamiento = 0
+        if desplazamiento:
+            destino.write(vista[:desplazamiento])
+    finally:
+        vista.release()
+    return total
@@ -0,0 +1,194 @@
+# benchmark_tdiagram.py
+import argparse
+import random
+import sys
+import time
+from collections import namedtuple
+
+from tdiagram import TDiagramSimulator
+
+# Milisegundos por medición; `aceleracion` = sin índices (recorriendo todas las definiciones) / con índices.
+Resultado = namedtuple("Resultado", ["definiciones", "medicion", "recorrido_ms", "indices_ms", "aceleracion"])
+
+
+def generar_definiciones(cantidad, semilla=0):
+    """
+    Lista de `cantidad` definiciones aleatorias, intérpretes (base, destino) y
+    traductores (base, origen, destino), entre ~cantidad/4 lenguajes y LOCAL.
+    Un 1% tiene base LOCAL, así que buena parte de los lenguajes termina siendo
+    ejecutable y la propagación hace trabajo real.
+    """
+    rng = random.Random(semilla)
+    lenguajes = [f"L{i}" for i in range(max(2, cantidad // 4))]
+    definiciones = []
+    for _ in range(cantidad):
+        base = "LOCAL" if rng.random() < 0.01 else rng.choice(lenguajes)
+        if rng.random() < 0.5:
+            definiciones.append((base, rng.choice(lenguajes)))
+        else:
+            definiciones.append((base, rng.choice(lenguajes), rng.choice(lenguajes)))
+    return definiciones
+
+
+def definir_con_indices(definiciones):
+    """Carga las definiciones en un TDiagramSimulator (que propaga con sus índices) y lo devuelve."""
+    sim = TDiagramSimulator()
+    for definicion in definiciones:
+        if len(definicion) == 2:
+            sim.define_interpreter(*definicion)
+        else:
+            sim.define_translator(*definicion)
+    return sim
+
+
+def definir_con_recorrido(definiciones, local="LOCAL"):
+    """
+    La misma propagación incremental con lista de trabajo, pero sin índices: por
+    cada lenguaje que se vuelve ejecutable recorre todas las definiciones cargadas.
+    Devuelve el conjunto de lenguajes ejecutables.
+    """
+    interpretes, traductores = [], []
+    ejecutables = {local}
+
+    def agregar(lenguaje):
+        pendientes = [lenguaje]
+        while pendientes:
+            lenguaje = pendientes.pop()
+            if lenguaje in ejecutables:
+                continue
+            ejecutables.add(lenguaje)
+            for base, destino in interpretes:
+                if base == lenguaje:
+                    pendientes.append(destino)
+            for base, origen, destino in traductores:
+                if lenguaje in (base, destino) and base in ejecutables and destino in ejecutables:
+                    pendientes.append(origen)
+
+    for definicion in definiciones:
+        if len(definicion) == 2:
+            interpretes.append(definicion)
+            if definicion[0] in ejecutables:
+                agregar(definicion[1])
+        else:
+            traductores.append(definicion)
+            if definicion[0] in ejecutables and definicion[2] in ejecutables:
+                agregar(definicion[1])
+    return ejecutables
+
+
+def generar_simulador(definiciones, profundidad=20, semilla=0):
+    """
+    Simulador para medir la búsqueda de referencia `_can_run_language`:
+    - una cadena de `profundidad` lenguajes C* hasta LOCAL (intérpretes y traductores alternados al azar);
+    - una cadena igual de lenguajes X* que termina en un lenguaje sin definiciones (no ejecutable);
+    - `definiciones` definiciones más entre lenguajes R* ajenos a las dos cadenas.
+    Cada lenguaje de las cadenas tiene una sola definición, así que ambas
+    búsquedas recorren la cadena en pasos lineales (terminan siempre) y su costo
+    depende solo de cómo se encuentran las definiciones de cada paso.
+    Devuelve (simulador, final de la cadena ejecutable, final de la cadena rota).
+    """
+    rng = random.Random(semilla)
+    sim = TDiagramSimulator()
+    for prefijo, inicio in (("C", sim.LOCAL_LANGUAGE), ("X", "SIN_DEFINIR")):
+        cadena = [inicio] + [f"{prefijo}{i}" for i in range(profundidad)]
+        for anterior, lenguaje in zip(cadena, cadena[1:]):
+            if rng.random() < 0.5:
+                sim.define_interpreter(anterior, lenguaje)
+            else:
+                sim.define_translator(sim.LOCAL_LANGUAGE, lenguaje, anterior)
+    ajenos = [f"R{i}" for i in range(max(2, definiciones // 4))]
+    for _ in range(definiciones):
+        if rng.random() < 0.5:
+            sim.define_interpreter(rng.choice(ajenos), rng.choice(ajenos))
+        else:
+            sim.define_translator(rng.choice(ajenos), rng.choice(ajenos), rng.choice(ajenos))
+    return sim, f"C{profundidad - 1}", f"X{profundidad - 1}"
+
+
+def buscar_con_recorrido(sim, lang_to_run, machine_lang, visited):
+    """La búsqueda recursiva anterior a los índices: recorre todas las definiciones en cada paso."""
+    if lang_to_run == machine_lang:
+        return True
+    if lang_to_run in visited:
+        return False
+    visited.add(lang_to_run)
+    if (machine_lang, lang_to_run) in sim.interpreters:
+        return True
+    for base_lang, target_lang in sim.interpreters:
+        if target_lang == lang_to_run:
+            if buscar_con_recorrido(sim, base_lang, machine_lang, visited.copy()):
+                return True
+    for t_base, t_source, t_dest in sim.translators:
+        if t_source == lang_to_run:
+            if buscar_con_recorrido(sim, t_base, machine_lang, visited.copy()):
+                if buscar_con_recorrido(sim, t_dest, machine_lang, visited.copy()):
+                    return True
+    return False
+
+
+def _ms(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def comparar(definiciones, profundidad=20, repeticiones=20, semilla=0):
+    """
+    Mide, con `definiciones` definiciones, lo que aceleran los índices:
+
+    - "definir": cargar todas las definiciones propagando el punto fijo (el
+      camino que usa is_executable), contra la misma propagación sin índices;
+    - "busca_exito" / "busca_fallo": solo la búsqueda de referencia
+      `_can_run_language` (que is_executable ya no usa) hasta el final de una
+      cadena ejecutable y de una cadena rota, contra la búsqueda que recorre todo.
+    """
+    resultados = []
+    lista = generar_definiciones(definiciones, semilla)
+    assert definir_con_recorrido(lista) == definir_con_indices(lista)._runnable
+    recorrido = _ms(lambda: definir_con_recorrido(lista), 1)
+    indices = _ms(lambda: definir_con_indices(lista), 1)
+    resultados.append(Resultado(definiciones, "definir", recorrido, indices, recorrido / indices))
+
+    sim, ejecutable, roto = generar_simulador(definiciones, profundidad, semilla)
+    local = sim.LOCAL_LANGUAGE
+    for medicion, lenguaje in (("busca_exito", ejecutable), ("busca_fallo", roto)):
+        assert buscar_con_recorrido(sim, lenguaje, local, set()) == sim._can_run_language(lenguaje, local, set())
+        recorrido = _ms(lambda: buscar_con_recorrido(sim, lenguaje, local, set()), repeticiones)
+        indices = _ms(lambda: sim._can_run_language(lenguaje, local, set()), repeticiones)
+        resultados.append(Resultado(definiciones, medicion, recorrido, indices, recorrido / indices))
+    return resultados
+
+
+def formatear_tabla(resultados):
+    """Tabla de texto con una fila por (cantidad de definiciones, medición)."""
+    encabezado = f"{'definiciones':>12} {'medicion':<12} {'recorrido ms':>13} {'indices ms':>11} {'aceleracion':>12}"
+    filas = [encabezado, "-" * len(encabezado)]
+    for r in resultados:
+        filas.append(
+            f"{r.definiciones:>12} {r.medicion:<12} {r.recorrido_ms:>13.3f} {r.indices_ms:>11.4f} "
+            f"{r.aceleracion:>11.0f}x"
+        )
+    return "\n".join(filas)
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos del benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark de los índices de adyacencia de TDiagramSimulator.")
+    parser.add_argument("--definiciones", type=int, nargs="+", default=[10**3, 10**4, 2 * 10**4])
+    parser.add_argument("--profundidad", type=int, default=20, help="largo de las cadenas de la búsqueda")
+    parser.add_argument("--repeticiones", type=int, default=20, help="repeticiones de cada búsqueda")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if min(args.definiciones) <= 0 or args.profundidad <= 0 or args.repeticiones <= 0:
+        print("Error: Las definiciones, la profundidad y las repeticiones deben ser positivas.")
+        sys.exit(1)
+    resultados = []
+    for cantidad in args.definiciones:
+        resultados += comparar(cantidad, args.profundidad, args.repeticiones, args.semilla)
+    print(formatear_tabla(resultados))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,25 @@
 # tdiagram.py
+import heapq
 import sys
+from collections import namedtuple
+
+# Plan de ejecución de `plan_execution`: el programa, su lenguaje, el costo total y
+# la raíz del árbol de pasos.
+ExecutionPlan = namedtuple("ExecutionPlan", ["program", "language", "cost", "root"])
+# Un paso del plan: cómo se ejecuta `language` y con qué costo. `kind` es "LOCAL",
+# "INTERPRETE" o "TRADUCTOR"; `definition` es la clave de la definición usada y
+# `inputs` los pasos de los lenguajes que esa definición necesita (la base del
+# intérprete, o la base y el destino del traductor).
+PlanStep = namedtuple("PlanStep", ["language", "cost", "kind", "definition", "inputs"])
+
+# Costos por defecto de las definiciones.
+DEFAULT_SLOWDOWN = 2.0
+DEFAULT_TRANSLATION_COST = 1.0
+
+# Argumentos que admite cada tipo de definición (mínimo, máximo) y el método que la define.
+DEFINITION_ARITY = {"PROGRAMA": (2, 2), "INTERPRETE": (2, 3), "TRADUCTOR": (3, 5), "MAQUINA": (1, 1)}
+DEFINITION_METHODS = {"PROGRAMA": "define_program", "INTERPRETE": "define_interpreter",
+                      "TRADUCTOR": "define_translator", "MAQUINA": "define_machine"}
 
 class TDiagramSimulator:
     """
@@ -16,6 +36,31 @@ class TDiagramSimulator:
         self.interpreters = {}
         # {('base', 'origen', 'destino'): True}
         self.translators = {}
+        # Costos para plan_execution: {clave_intérprete: factor} y {clave_traductor: (costo, con_cache)}
+        self._interpreter_slowdown = {}
+        self._translator_cost = {}
+
+        # Índices de adyacencia, mantenidos en cada define_*:
+        # {'destino': ['base', ...]} y {'base': ['destino', ...]}
+        self._interpreters_by_target = {}
+        self._interpreters_by_base = {}
+        # {'origen': [('base', 'destino'), ...]}, {'base': [('origen', 'destino'), ...]}
+        # y {'destino': [('base', 'origen'), ...]}
+        self._translators_by_source = {}
+        self._translators_by_base = {}
+        self._translators_by_dest = {}
+
+        # Máquinas declaradas, en orden; la máquina i es el bit i de las máscaras.
+        # LOCAL es siempre la máquina 0.
+        self.machines = [self.LOCAL_LANGUAGE]
+        # {'lenguaje': máscara}: bit i encendido si el lenguaje se puede ejecutar
+        # en la máquina i (clausura transitiva, actualizada en cada define_*).
+        self._masks = {self.LOCAL_LANGUAGE: 1}
+        # Lenguajes ejecutables en LOCAL (los que tienen el bit 0), para consultas
+        # directas. Como las definiciones nunca se quitan, las máscaras solo crecen.
+        self._runnable = {self.LOCAL_LANGUAGE}
+        # Durante load_definitions la propagación se hace una sola vez al final.
+        self._deferred = False
 
     def define_program(self, name, language):
         """Define un nuevo programa."""
@@ -24,22 +69,118 @@ class TDiagramSimulator:
         self.programs[name.upper()] = language.upper()
         return f"Éxito: Programa '{name}' en lenguaje '{language.upper()}' definido."
 
-    def define_interpreter(self, base_lang, target_lang):
-        """Define un nuevo intérprete."""
+    def define_interpreter(self, base_lang, target_lang, slowdown=DEFAULT_SLOWDOWN):
+        """
+        Define un nuevo intérprete. `slowdown` es el factor por el que la
+        interpretación multiplica el costo de ejecutar la base (al menos 1).
+        """
         key = (base_lang.upper(), target_lang.upper())
         if key in self.interpreters:
             return f"Advertencia: Intérprete para '{target_lang.upper()}' en '{base_lang.upper()}' ya existe."
+        if not slowdown >= 1:
+            return "Error: El factor de interpretación debe ser al menos 1."
         self.interpreters[key] = True
+        self._interpreter_slowdown[key] = slowdown
+        base, target = key
+        self._interpreters_by_target.setdefault(target, []).append(base)
+        self._interpreters_by_base.setdefault(base, []).append(target)
+        if not self._deferred:
+            self._propagate(target, self._masks.get(base, 0))
         return f"Éxito: Intérprete para '{target_lang.upper()}' en '{base_lang.upper()}' definido."
 
-    def define_translator(self, base_lang, source_lang, dest_lang):
-        """Define un nuevo traductor."""
+    def define_translator(self, base_lang, source_lang, dest_lang, cost=DEFAULT_TRANSLATION_COST, cached=False):
+        """
+        Define un nuevo traductor. `cost` es el costo de una traducción, en
+        unidades del costo de ejecutar la base; con `cached` la traducción se
+        hace una sola vez y su costo no se cuenta al ejecutar.
+        """
         key = (base_lang.upper(), source_lang.upper(), dest_lang.upper())
         if key in self.translators:
             return "Advertencia: Traductor ya existe."
+        if not cost >= 1:
+            return "Error: El costo de traducción debe ser al menos 1."
         self.translators[key] = True
+        self._translator_cost[key] = (cost, cached)
+        base, source, dest = key
+        self._translators_by_source.setdefault(source, []).append((base, dest))
+        self._translators_by_base.setdefault(base, []).append((source, dest))
+        self._translators_by_dest.setdefault(dest, []).append((base, source))
+        if not self._deferred:
+            self._propagate(source, self._masks.get(base, 0) & self._masks.get(dest, 0))
         return f"Éxito: Traductor de '{source_lang.upper()}' a '{dest_lang.upper()}' en '{base_lang.upper()}' definido."
 
+    def define_machine(self, language):
+        """Declara una máquina cuyo lenguaje nativo es `language` (LOCAL ya está declarada)."""
+        language = language.upper()
+        if language in self.machines:
+            return f"Advertencia: La máquina '{language}' ya existe."
+        self.machines.append(language)
+        if not self._deferred:
+            self._propagate(language, 1 << (len(self.machines) - 1))
+        return f"Éxito: Máquina '{language}' definida."
+
+    def load_definitions(self, definitions):
+        """
+        Carga muchas definiciones de una vez. Cada elemento es una línea
+        "DEFINIR <tipo> ..." como las del simulador o una tupla (tipo, *argumentos),
+        por ejemplo ("TRADUCTOR", "LOCAL", "JAVA", "C", 2.0, True). Solo se
+        actualizan los índices por definición; el conjunto de lenguajes
+        ejecutables se recalcula una vez al final. Devuelve el mensaje de cada
+        definición, en orden (las inválidas devuelven "Error: ..." y se omiten).
+        """
+        messages = []
+        self._deferred = True
+        try:
+            for definition in definitions:
+                try:
+                    if isinstance(definition, str):
+                        definition = parse_definition(definition)
+                    messages.append(self.apply_definition(definition))
+                except ValueError as e:
+                    messages.append(str(e))
+        finally:
+            self._deferred = False
+            self._masks = {}
+            self._runnable = set()
+            for bit, machine in enumerate(self.machines):
+                self._propagate(machine, 1 << bit)
+        return messages
+
+    def apply_definition(self, definition):
+        """Aplica una definición (tipo, *argumentos) con el define_* que corresponde y devuelve su mensaje."""
+        def_type, *args = definition
+        def_type = def_type.upper()
+        if def_type not in DEFINITION_ARITY or not DEFINITION_ARITY[def_type][0] <= len(args) <= DEFINITION_ARITY[def_type][1]:
+            return f"Error: Tipo de definición '{def_type}' o número de argumentos incorrecto."
+        return getattr(self, DEFINITION_METHODS[def_type])(*args)
+
+    def executable_programs(self, machine=None):
+        """
+        Ejecutabilidad de todos los programas definidos en `machine` (por defecto
+        LOCAL), en el orden en que se definieron: lista de tuplas (programa,
+        lenguaje, es_ejecutable). Es una sola pasada sobre los programas contra
+        las máscaras de los lenguajes.
+        """
+        machine = (machine or self.LOCAL_LANGUAGE).upper()
+        if machine not in self.machines:
+            raise ValueError(f"La máquina '{machine}' no está definida.")
+        bit = 1 << self.machines.index(machine)
+        return [(name, language, bool(self._masks.get(language, 0) & bit))
+                for name, language in self.programs.items()]
+
+    def executability_matrix(self):
+        """
+        Qué programas se ejecutan en qué máquinas: lista de tuplas (programa,
+        lenguaje, fila), donde fila[i] indica si el programa se ejecuta en
+        self.machines[i]. Cada fila sale de la máscara del lenguaje del programa.
+        """
+        bits = [1 << i for i in range(len(self.machines))]
+        matrix = []
+        for name, language in self.programs.items():
+            mask = self._masks.get(language, 0)
+            matrix.append((name, language, tuple(bool(mask & bit) for bit in bits)))
+        return matrix
+
     def is_executable(self, program_name):
         """
         Verifica si un programa es ejecutable en la máquina LOCAL.
@@ -49,17 +190,144 @@ class TDiagramSimulator:
             
         program_language = self.programs[program_name.upper()]
         
-        # Usamos un conjunto para evitar ciclos infinitos en la recursión
-        visited = set()
-        
-        if self._can_run_language(program_language, self.LOCAL_LANGUAGE, visited):
+        if program_language in self._runnable:
             return True, f"El programa '{program_name}' es ejecutable."
         else:
             return False, f"El programa '{program_name}' NO es ejecutable."
 
+    def _propagate(self, lang, bits):
+        """
+        Agrega las máquinas `bits` a la máscara de `lang` y propaga con una lista
+        de trabajo: un intérprete pasa a su lenguaje los bits nuevos de la base, y
+        un traductor a su origen los bits nuevos de la base o del destino que el
+        otro también tiene. Usando los índices por base (y por destino para los
+        traductores) solo se revisan las definiciones que dependen de cada
+        lenguaje, y cada par (lenguaje, máquina) se agrega una sola vez.
+        """
+        masks = self._masks
+        pending = [(lang, bits)]
+        while pending:
+            lang, bits = pending.pop()
+            new = bits & ~masks.get(lang, 0)
+            if not new:
+                continue
+            masks[lang] = masks.get(lang, 0) | new
+            if new & 1:
+                self._runnable.add(lang)
+            for target in self._interpreters_by_base.get(lang, ()):
+                pending.append((target, new))
+            for source, dest in self._translators_by_base.get(lang, ()):
+                pending.append((source, new & masks.get(dest, 0)))
+            for base, source in self._translators_by_dest.get(lang, ()):
+                pending.append((source, new & masks.get(base, 0)))
+
+    def plan_execution(self, program_name):
+        """
+        Busca la forma más barata de ejecutar un programa en LOCAL. Devuelve
+        (ExecutionPlan, mensaje), o (None, mensaje) si no es ejecutable.
+
+        Modelo de costos (costo de ejecutar una unidad de trabajo):
+        - LOCAL cuesta 1;
+        - con un intérprete (B, L): factor * costo(B);
+        - con un traductor (T, S, D): costo(D) + costo * costo(T), o solo
+          costo(D) si la traducción está en caché (basta con poder ejecutar T).
+
+        Como los factores y los costos de traducción son al menos 1, ningún paso
+        cuesta menos que sus entradas y el plan es el más barato de todos los
+        posibles, incluidos los que ejecutan un lenguaje de dos formas distintas
+        (por ejemplo, un traductor en caché escrito en el lenguaje que traduce).
+        """
+        if program_name.upper() not in self.programs:
+            return None, f"Error: El programa '{program_name}' no está definido."
+        program_language = self.programs[program_name.upper()]
+        if program_language not in self._runnable:
+            return None, f"El programa '{program_name}' NO es ejecutable."
+        root = self._plan_step(program_language)
+        plan = ExecutionPlan(program_name.upper(), program_language, root.cost, root)
+        return plan, f"El programa '{program_name}' es ejecutable con costo {root.cost:g}."
+
+    def _cheapest_costs(self, cached_base_done=False):
+        """
+        Dijkstra sobre el grafo de lenguajes desde LOCAL (es exacto porque ningún
+        paso cuesta menos que sus entradas). Un traductor se relaja cuando su base
+        y su destino ya salieron de la cola; uno en caché, apenas sale el destino
+        si su base es ejecutable, porque el costo de la base no cuenta. Con
+        `cached_base_done` también espera a la base: el resultado es más caro
+        pero cada lenguaje depende solo de lenguajes procesados antes.
+        Devuelve ({lenguaje: costo}, {lenguaje: (tipo, definición, entradas)},
+        {lenguaje: orden en que salió de la cola}).
+        """
+        local = self.LOCAL_LANGUAGE
+        costs = {local: 1.0}
+        via = {local: ("LOCAL", None, ())}
+        order = {}
+        heap = [(1.0, local)]
+
+        def relax(lang, cost, step):
+            if lang not in order and cost < costs.get(lang, float("inf")):
+                costs[lang] = cost
+                via[lang] = step
+                heapq.heappush(heap, (cost, lang))
+
+        while heap:
+            cost, lang = heapq.heappop(heap)
+            if lang in order:
+                continue
+            order[lang] = len(order)
+            for target in self._interpreters_by_base.get(lang, ()):
+                key = (lang, target)
+                relax(target, self._interpreter_slowdown[key] * cost, ("INTERPRETE", key, (lang,)))
+            translators = [(lang, source, dest) for source, dest in self._translators_by_base.get(lang, ())]
+            translators += [(base, source, lang) for base, source in self._translators_by_dest.get(lang, ())]
+            for key in translators:
+                base, source, dest = key
+                translation_cost, cached = self._translator_cost[key]
+                if dest not in order:
+                    continue
+                if cached and (base in order or not cached_base_done and base in self._runnable):
+                    relax(source, costs[dest], ("TRADUCTOR", key, (base, dest)))
+                elif not cached and base in order:
+                    relax(source, costs[dest] + translation_cost * costs[base], ("TRADUCTOR", key, (base, dest)))
+        return costs, via, order
+
+    def _plan_step(self, lang):
+        """
+        Arma el árbol de PlanStep de `lang` (sin recursión: los planes pueden ser
+        muy profundos). La base de un traductor en caché que se procesó después
+        del lenguaje traducido (o que es ese mismo lenguaje) puede depender de
+        él: su subárbol sale del Dijkstra con `cached_base_done`, que no tiene
+        ciclos. Cualquier plan de esa base sirve, porque su costo no cuenta.
+        """
+        searches = {False: self._cheapest_costs()}
+        steps = {}
+        pending = [(lang, False)]
+        while pending:
+            current = pending[-1]
+            if current in steps:
+                pending.pop()
+                continue
+            name, strict = current
+            costs, via, order = searches[strict]
+            kind, definition, inputs = via[name]
+            children = [(child, strict) for child in inputs]
+            if kind == "TRADUCTOR" and self._translator_cost[definition][1] and not strict:
+                base = inputs[0]
+                if order.get(base, len(order)) >= order[name]:
+                    children[0] = (base, True)
+                    if True not in searches:
+                        searches[True] = self._cheapest_costs(cached_base_done=True)
+            missing = [child for child in children if child not in steps]
+            if missing:
+                pending.extend(missing)
+                continue
+            pending.pop()
+            steps[current] = PlanStep(name, costs[name], kind, definition, tuple(steps[child] for child in children))
+        return steps[(lang, False)]
+
     def _can_run_language(self, lang_to_run, machine_lang, visited):
         """
         Función recursiva para determinar si un lenguaje puede ejecutarse en una máquina.
+        Es la versión de referencia de la clausura que mantiene `_propagate`.
         """
         # Caso base: El lenguaje es el nativo de la máquina.
         if lang_to_run == machine_lang:
@@ -78,33 +346,138 @@ class TDiagramSimulator:
         # Opción 2: Buscar un intérprete que necesite ser interpretado (cadena de intérpretes).
         # ¿Existe un intérprete para `lang_to_run` en `intermediate_lang`?
         # Si es así, ¿podemos ejecutar `intermediate_lang` en nuestra `machine_lang`?
-        for base_lang, target_lang in self.interpreters:
-            if target_lang == lang_to_run:
-                if self._can_run_language(base_lang, machine_lang, visited.copy()):
-                    return True
+        for base_lang in self._interpreters_by_target.get(lang_to_run, ()):
+            if self._can_run_language(base_lang, machine_lang, visited.copy()):
+                return True
 
         # Opción 3: Buscar un traductor.
         # ¿Existe un traductor que convierta `lang_to_run` a `new_lang`?
         # Y, ¿podemos ejecutar el traductor Y el resultado de la traducción?
-        for t_base, t_source, t_dest in self.translators:
-            if t_source == lang_to_run:
-                # Verificar si podemos ejecutar el traductor Y el lenguaje destino
-                can_run_translator = self._can_run_language(t_base, machine_lang, visited.copy())
-                if can_run_translator:
-                    can_run_result = self._can_run_language(t_dest, machine_lang, visited.copy())
-                    if can_run_result:
-                        return True
+        for t_base, t_dest in self._translators_by_source.get(lang_to_run, ()):
+            # Verificar si podemos ejecutar el traductor Y el lenguaje destino
+            can_run_translator = self._can_run_language(t_base, machine_lang, visited.copy())
+            if can_run_translator:
+                can_run_result = self._can_run_language(t_dest, machine_lang, visited.copy())
+                if can_run_result:
+                    return True
         
         return False
 
-def main():
-    """Bucle principal de la interfaz de usuario."""
+def parse_definition(line):
+    """
+    Convierte una línea "DEFINIR <tipo> <argumentos...>" en una tupla
+    (tipo, *argumentos) para apply_definition. Los factores y costos se
+    convierten a float y la marca CACHE final de un traductor a True. Lanza
+    ValueError con el mensaje de error si la línea no es válida.
+    """
+    parts = line.strip().upper().split()
+    if parts[:1] != ["DEFINIR"]:
+        raise ValueError(f"Error: Se esperaba una definición 'DEFINIR': '{line.strip()}'.")
+    if len(parts) < 3:
+        raise ValueError("Error: Comando 'DEFINIR' incompleto.")
+    def_type, args = parts[1], parts[2:]
+    if def_type not in DEFINITION_ARITY or not DEFINITION_ARITY[def_type][0] <= len(args) <= DEFINITION_ARITY[def_type][1]:
+        # apply_definition informa el tipo o la cantidad de argumentos incorrecta.
+        return (def_type, *args)
+    fixed = DEFINITION_ARITY[def_type][0]
+    cached = def_type == "TRADUCTOR" and len(args) > fixed and args[-1] == "CACHE"
+    costs = args[fixed:len(args) - cached]
+    if len(costs) > 1:
+        raise ValueError("Error: Argumentos de costo incorrectos para 'TRADUCTOR'.")
+    try:
+        costs = [float(cost) for cost in costs]
+    except ValueError:
+        raise ValueError(f"Error: Costo inválido en la definición de '{def_type}'.")
+    if cached:
+        return (def_type, *args[:fixed], *(costs or [DEFAULT_TRANSLATION_COST]), True)
+    return (def_type, *args[:fixed], *costs)
+
+def format_executable_programs(rows):
+    """Texto separado por tabuladores de executable_programs: encabezado y una fila "programa lenguaje SI|NO" por programa."""
+    lines = ["programa\tlenguaje\tejecutable"]
+    lines.extend(f"{name}\t{language}\t{'SI' if executable else 'NO'}" for name, language, executable in rows)
+    return "\n".join(lines)
+
+def format_executability_matrix(machines, matrix):
+    """Texto separado por tabuladores de executability_matrix: una columna SI|NO por máquina."""
+    lines = ["\t".join(["programa", "lenguaje", *machines])]
+    for name, language, row in matrix:
+        lines.append("\t".join([name, language, *("SI" if cell else "NO" for cell in row)]))
+    return "\n".join(lines)
+
+def run_batch(stream, out=None, err=None):
+    """
+    Modo por lotes: carga todas las líneas DEFINIR de `stream` con
+    load_definitions y escribe en `out` la tabla de format_executable_programs
+    (o la de format_executability_matrix si se declararon otras máquinas).
+    Se ignoran las líneas vacías y los comentarios (#); los errores se informan
+    en `err` con su número de línea. Devuelve la cantidad de errores.
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    numbers, lines = [], []
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            numbers.append(number)
+            lines.append(line)
+    sim = TDiagramSimulator()
+    errors = 0
+    for number, message in zip(numbers, sim.load_definitions(lines)):
+        if message.startswith("Error"):
+            errors += 1
+            print(f"Línea {number}: {message}", file=err)
+    if len(sim.machines) > 1:
+        print(format_executability_matrix(sim.machines, sim.executability_matrix()), file=out)
+    else:
+        print(format_executable_programs(sim.executable_programs()), file=out)
+    return errors
+
+def format_plan(plan):
+    """Texto del plan: un paso por línea, con las entradas de cada paso indentadas debajo."""
+    lines = [f"Plan para '{plan.program}' ({plan.language}), costo total {plan.cost:g}:"]
+    pending = [(plan.root, 1)]
+    while pending:
+        step, depth = pending.pop()
+        if step.kind == "LOCAL":
+            detail = "máquina local"
+        elif step.kind == "INTERPRETE":
+            detail = f"intérprete de {step.definition[1]} escrito en {step.definition[0]}"
+        else:
+            base, source, dest = step.definition
+            detail = f"traductor de {source} a {dest} escrito en {base}"
+        lines.append(f"{'  ' * depth}{step.language} (costo {step.cost:g}): {detail}")
+        pending.extend((child, depth + 1) for child in reversed(step.inputs))
+    return "\n".join(lines)
+
+def main(argv=None):
+    """
+    Bucle principal de la interfaz de usuario. Con un archivo en `argv` (o "-"
+    para la entrada estándar) se ejecuta el modo por lotes de run_batch.
+    """
+    if argv:
+        if len(argv) != 1:
+            print("Uso: python tdiagram.py [archivo | -]")
+            sys.exit(1)
+        if argv[0] == "-":
+            sys.exit(1 if run_batch(sys.stdin) else 0)
+        try:
+            with open(argv[0], encoding="utf-8") as stream:
+                errors = run_batch(stream)
+        except OSError as e:
+            print(f"Error: No se pudo leer '{argv[0]}': {e.strerror}.")
+            sys.exit(1)
+        sys.exit(1 if errors else 0)
+
     sim = TDiagramSimulator()
     print("Simulador de Diagramas de T. Escriba 'SALIR' para terminar.")
     print("Ejemplos:")
     print("  DEFINIR PROGRAMA mi_app PYTHON")
     print("  DEFINIR INTERPRETE LOCAL PYTHON")
     print("  EJECUTABLE mi_app")
+    print("  EJECUTABLE mi_app PLAN")
+    print("  DEFINIR MAQUINA ARM")
+    print("  MATRIZ")
 
     while True:
         try:
@@ -120,29 +493,27 @@ def main():
                 break
             
             elif command == "DEFINIR":
-                if len(parts) < 3:
-                    print("Error: Comando 'DEFINIR' incompleto.")
-                    continue
-                
-                def_type = parts[1]
-                args = parts[2:]
-
-                if def_type == "PROGRAMA" and len(args) == 2:
-                    print(sim.define_program(args[0], args[1]))
-                elif def_type == "INTERPRETE" and len(args) == 2:
-                    print(sim.define_interpreter(args[0], args[1]))
-                elif def_type == "TRADUCTOR" and len(args) == 3:
-                    print(sim.define_translator(args[0], args[1], args[2]))
-                else:
-                    print(f"Error: Tipo de definición '{def_type}' o número de argumentos incorrecto.")
+                # DEFINIR INTERPRETE <base> <lenguaje> [factor]
+                # DEFINIR TRADUCTOR <base> <origen> <destino> [costo] [CACHE]
+                try:
+                    print(sim.apply_definition(parse_definition(line)))
+                except ValueError as e:
+                    print(e)
 
             elif command == "EJECUTABLE":
+                if len(parts) == 3 and parts[2] == "PLAN":
+                    plan, message = sim.plan_execution(parts[1])
+                    print(format_plan(plan) if plan else message)
+                    continue
                 if len(parts) != 2:
                     print("Error: Comando 'EJECUTABLE' requiere un nombre de programa.")
                     continue
                 
                 _, message = sim.is_executable(parts[1])
                 print(message)
+
+            elif command == "MATRIZ":
+                print(format_executability_matrix(sim.machines, sim.executability_matrix()))
             
             else:
                 print(f"Error: Comando '{command}' no reconocido.")
@@ -151,4 +522,4 @@ def main():
             print(f"Ocurrió un error inesperado: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
\ No newline at end of file
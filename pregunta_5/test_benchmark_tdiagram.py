@@ -0,0 +1,41 @@
+# test_benchmark_tdiagram.py
+import pytest
+from benchmark_tdiagram import (
+    generar_definiciones, definir_con_indices, definir_con_recorrido,
+    generar_simulador, buscar_con_recorrido, comparar, formatear_tabla, main,
+)
+
+def test_propagacion_sin_indices_igual_al_simulador():
+    definiciones = generar_definiciones(400, semilla=2)
+    assert definiciones == generar_definiciones(400, semilla=2)
+    ejecutables = definir_con_recorrido(definiciones)
+    assert len(ejecutables) > 10
+    assert ejecutables == definir_con_indices(definiciones)._runnable
+
+def test_generar_simulador_cadenas():
+    """Las dos cadenas se resuelven en pasos lineales con y sin índices."""
+    sim, ejecutable, roto = generar_simulador(200, profundidad=8, semilla=1)
+    assert len(sim.interpreters) + len(sim.translators) <= 216
+    local = sim.LOCAL_LANGUAGE
+    assert sim._can_run_language(ejecutable, local, set())
+    assert buscar_con_recorrido(sim, ejecutable, local, set())
+    assert not sim._can_run_language(roto, local, set())
+    assert not buscar_con_recorrido(sim, roto, local, set())
+    assert ejecutable in sim._runnable and roto not in sim._runnable
+
+def test_comparar_reporta_cada_medicion():
+    resultados = comparar(500, profundidad=5, repeticiones=2)
+    assert [r.medicion for r in resultados] == ["definir", "busca_exito", "busca_fallo"]
+    for r in resultados:
+        assert r.definiciones == 500
+        assert r.recorrido_ms > 0 and r.indices_ms > 0
+        assert r.aceleracion == pytest.approx(r.recorrido_ms / r.indices_ms)
+    assert "aceleracion" in formatear_tabla(resultados)
+
+def test_main(capsys):
+    main(["--definiciones", "100", "--profundidad", "3", "--repeticiones", "1"])
+    salida = capsys.readouterr().out
+    assert "definir" in salida and "busca_fallo" in salida
+    with pytest.raises(SystemExit):
+        main(["--profundidad", "0"])
+    assert "positivas" in capsys.readouterr().out
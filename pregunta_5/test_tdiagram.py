@@ -1,6 +1,8 @@
 # test_tdiagram.py
+import random
 import pytest
-from tdiagram import TDiagramSimulator, main
+import io
+from tdiagram import TDiagramSimulator, format_executability_matrix, format_plan, main, parse_definition, run_batch
 from unittest.mock import patch
 
 @pytest.fixture
@@ -21,6 +23,16 @@ def test_define_translator(sim):
     sim.define_translator("C", "PASCAL", "ASM")
     assert ("C", "PASCAL", "ASM") in sim.translators
 
+def test_indices_de_adyacencia(sim):
+    sim.define_interpreter("C", "PYTHON")
+    sim.define_interpreter("C", "PYTHON")  # repetido: no se indexa dos veces
+    sim.define_translator("C", "PASCAL", "ASM")
+    assert sim._interpreters_by_target == {"PYTHON": ["C"]}
+    assert sim._interpreters_by_base == {"C": ["PYTHON"]}
+    assert sim._translators_by_source == {"PASCAL": [("C", "ASM")]}
+    assert sim._translators_by_base == {"C": [("PASCAL", "ASM")]}
+    assert sim._translators_by_dest == {"ASM": [("C", "PASCAL")]}
+
 # --- Pruebas de Lógica 'is_executable' ---
 def test_executable_directo(sim):
     sim.define_program("juego", "LOCAL")
@@ -78,6 +90,280 @@ def test_programa_no_definido(sim):
     assert not is_exec
     assert "no está definido" in msg
 
+# --- Pruebas del punto fijo incremental ---
+@pytest.mark.parametrize("semilla", range(30))
+def test_punto_fijo_igual_a_busqueda_recursiva(semilla):
+    """Prueba que el conjunto incremental coincide con `_can_run_language` en grafos aleatorios."""
+    rng = random.Random(semilla)
+    sim = TDiagramSimulator()
+    lenguajes = ["LOCAL"] + [f"L{i}" for i in range(rng.randint(3, 12))]
+    for _ in range(rng.randint(1, 25)):
+        if rng.random() < 0.5:
+            sim.define_interpreter(rng.choice(lenguajes), rng.choice(lenguajes))
+        else:
+            sim.define_translator(rng.choice(lenguajes), rng.choice(lenguajes), rng.choice(lenguajes))
+        # Se compara después de cada definición: el conjunto se actualiza en cada paso.
+        for lenguaje in lenguajes:
+            esperado = sim._can_run_language(lenguaje, sim.LOCAL_LANGUAGE, set())
+            assert (lenguaje in sim._runnable) == esperado
+
+def test_traductor_habilitado_por_el_ultimo_lenguaje(sim):
+    sim.define_program("prog", "FORTRAN")
+    sim.define_translator("C", "FORTRAN", "ASM")
+    sim.define_interpreter("JAVA", "ASM")
+    sim.define_interpreter("LOCAL", "C")
+    assert not sim.is_executable("PROG")[0]
+    sim.define_interpreter("LOCAL", "JAVA")  # habilita ASM, lo último que faltaba
+    assert sim.is_executable("PROG")[0]
+
+# --- Pruebas de plan_execution ---
+def _costos_minimos(sim):
+    """
+    Costo mínimo de cada lenguaje por iteración de valores: en la ronda k se
+    consideran todos los árboles de definiciones de altura k, aunque repitan un
+    lenguaje en un camino (un traductor escrito en el lenguaje que traduce, por
+    ejemplo). Termina cuando una ronda no mejora nada.
+    """
+    infinito = float("inf")
+    costos = {sim.LOCAL_LANGUAGE: 1.0}
+    for _ in range(1000):
+        nuevos = dict(costos)
+        for (base, lenguaje), factor in sim._interpreter_slowdown.items():
+            nuevos[lenguaje] = min(nuevos.get(lenguaje, infinito), factor * costos.get(base, infinito))
+        for (base, origen, destino), (costo, en_cache) in sim._translator_cost.items():
+            costo_base = costos.get(base, infinito)
+            if costo_base < infinito:
+                total = costos.get(destino, infinito) + (0 if en_cache else costo * costo_base)
+                nuevos[origen] = min(nuevos.get(origen, infinito), total)
+        if nuevos == costos:
+            return costos
+        costos = nuevos
+    raise AssertionError("La iteración de valores no converge.")
+
+def _verificar_plan(sim, paso):
+    """Recalcula el costo de cada paso a partir de sus entradas (el árbol es finito)."""
+    for entrada in paso.inputs:
+        _verificar_plan(sim, entrada)
+    if paso.kind == "LOCAL":
+        esperado = 1.0
+    elif paso.kind == "INTERPRETE":
+        esperado = sim._interpreter_slowdown[paso.definition] * paso.inputs[0].cost
+    else:
+        costo, en_cache = sim._translator_cost[paso.definition]
+        base, destino = paso.inputs
+        assert (base.language, destino.language) == (paso.definition[0], paso.definition[2])
+        esperado = destino.cost if en_cache else destino.cost + costo * base.cost
+    assert paso.cost == pytest.approx(esperado)
+
+@pytest.mark.parametrize("semilla", range(60))
+def test_plan_igual_a_iteracion_de_valores(semilla):
+    rng = random.Random(semilla)
+    sim = TDiagramSimulator()
+    lenguajes = ["LOCAL"] + [f"L{i}" for i in range(rng.randint(2, 6))]
+    for _ in range(rng.randint(1, 12)):
+        if rng.random() < 0.5:
+            sim.define_interpreter(rng.choice(lenguajes), rng.choice(lenguajes), rng.choice([1, 1.5, 2, 10]))
+        else:
+            sim.define_translator(rng.choice(lenguajes), rng.choice(lenguajes), rng.choice(lenguajes),
+                                  rng.choice([1, 1.5, 4]), cached=rng.random() < 0.3)
+    costos = _costos_minimos(sim)
+    for i, lenguaje in enumerate(lenguajes):
+        sim.define_program(f"p{i}", lenguaje)
+        plan, _ = sim.plan_execution(f"p{i}")
+        if costos.get(lenguaje, float("inf")) == float("inf"):
+            assert plan is None
+            continue
+        _verificar_plan(sim, plan.root)
+        assert plan.cost == pytest.approx(costos[lenguaje])
+
+def test_plan_con_traductor_escrito_en_el_lenguaje_que_traduce(sim):
+    sim.define_program("app", "L3")
+    sim.define_interpreter("LOCAL", "L3", slowdown=6)
+    # Un costo de traducción menor que 1 haría que cada arranque en cascada
+    # abarate el anterior (6, 4, 3, 2.5, ...) sin llegar nunca al mínimo.
+    assert sim.define_translator("L3", "L3", "LOCAL", cost=0.5).startswith("Error")
+    sim.define_translator("L3", "L3", "LOCAL", cost=1)
+    assert sim.plan_execution("app")[0].cost == 6 # 1 + 1 * 6 = 7 es peor
+    assert _costos_minimos(sim)["L3"] == 6
+    # En caché: el traductor, ejecutado con el intérprete, traduce una vez el programa.
+    sim = TDiagramSimulator()
+    sim.define_program("app", "L3")
+    sim.define_interpreter("LOCAL", "L3", slowdown=6)
+    sim.define_translator("L3", "L3", "LOCAL", cached=True)
+    plan, _ = sim.plan_execution("app")
+    assert plan.cost == 1
+    base, destino = plan.root.inputs
+    assert (base.language, base.kind, base.cost) == ("L3", "INTERPRETE", 6)
+    assert destino.kind == "LOCAL"
+    _verificar_plan(sim, plan.root)
+
+def test_plan_prefiere_traduccion_en_cache(sim):
+    sim.define_program("app", "JAVA")
+    sim.define_interpreter("LOCAL", "JVM", slowdown=3)
+    sim.define_interpreter("JVM", "JAVA", slowdown=3)              # costo 9
+    sim.define_translator("LOCAL", "JAVA", "JVM", cost=20)         # costo 3 + 20 = 23
+    plan, mensaje = sim.plan_execution("app")
+    assert plan.cost == 9 and plan.root.kind == "INTERPRETE" and "9" in mensaje
+    sim.define_translator("JVM", "JAVA", "LOCAL", cost=50, cached=True)  # compilado una vez: costo 1
+    plan, _ = sim.plan_execution("app")
+    assert plan.cost == 1
+    assert plan.root.definition == ("JVM", "JAVA", "LOCAL")
+    assert [paso.language for paso in plan.root.inputs] == ["JVM", "LOCAL"]
+    texto = format_plan(plan)
+    assert "traductor de JAVA a LOCAL escrito en JVM" in texto and "intérprete de JVM escrito en LOCAL" in texto
+
+def test_plan_errores_y_costos_invalidos(sim):
+    assert sim.plan_execution("nada")[0] is None
+    sim.define_program("lejos", "HASKELL")
+    plan, mensaje = sim.plan_execution("lejos")
+    assert plan is None and "NO es ejecutable" in mensaje
+    assert sim.define_interpreter("LOCAL", "X", slowdown=0.5).startswith("Error")
+    assert sim.define_translator("LOCAL", "X", "LOCAL", cost=-1).startswith("Error")
+    assert sim.define_translator("LOCAL", "X", "LOCAL", cost=0).startswith("Error")
+    assert not sim.interpreters and not sim.translators
+
+def test_plan_cadena_larga(sim):
+    """El plan se arma sin recursión: una cadena de miles de intérpretes no agota la pila."""
+    anterior = "LOCAL"
+    for i in range(3000):
+        sim.define_interpreter(anterior, f"L{i}", slowdown=1)
+        anterior = f"L{i}"
+    sim.define_program("fondo", anterior)
+    plan, _ = sim.plan_execution("fondo")
+    assert plan.cost == 1 and len(format_plan(plan).splitlines()) == 3002
+
+# --- Pruebas de carga masiva y consultas por lote ---
+def test_parse_definition():
+    assert parse_definition("definir programa app java") == ("PROGRAMA", "APP", "JAVA")
+    assert parse_definition("DEFINIR INTERPRETE LOCAL JVM 3") == ("INTERPRETE", "LOCAL", "JVM", 3.0)
+    assert parse_definition("DEFINIR TRADUCTOR LOCAL JAVA C CACHE") == ("TRADUCTOR", "LOCAL", "JAVA", "C", 1.0, True)
+    assert parse_definition("DEFINIR TRADUCTOR LOCAL JAVA C 2") == ("TRADUCTOR", "LOCAL", "JAVA", "C", 2.0)
+    for linea in ("DEFINIR PROGRAMA", "EJECUTABLE app", "DEFINIR TRADUCTOR A B C 1 2", "DEFINIR INTERPRETE A B x"):
+        with pytest.raises(ValueError):
+            parse_definition(linea)
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_carga_masiva_igual_a_definir_una_por_una(semilla):
+    rng = random.Random(semilla)
+    lenguajes = ["LOCAL"] + [f"L{i}" for i in range(8)]
+    definiciones = []
+    for i in range(40):
+        if rng.random() < 0.4:
+            definiciones.append(("INTERPRETE", rng.choice(lenguajes), rng.choice(lenguajes)))
+        elif rng.random() < 0.8:
+            definiciones.append(("TRADUCTOR", rng.choice(lenguajes), rng.choice(lenguajes), rng.choice(lenguajes)))
+        else:
+            definiciones.append(("PROGRAMA", f"P{i}", rng.choice(lenguajes)))
+    uno_por_uno = TDiagramSimulator()
+    mensajes = [uno_por_uno.apply_definition(definicion) for definicion in definiciones]
+    masivo = TDiagramSimulator()
+    lineas = ["DEFINIR " + " ".join(definicion) for definicion in definiciones]
+    assert masivo.load_definitions(lineas) == mensajes
+    assert masivo._runnable == uno_por_uno._runnable
+    assert masivo.executable_programs() == uno_por_uno.executable_programs()
+    for nombre, lenguaje, ejecutable in masivo.executable_programs():
+        assert ejecutable == masivo.is_executable(nombre)[0]
+    # Después de la carga, las definiciones sueltas vuelven a propagar al momento.
+    masivo.define_interpreter("LOCAL", "NUEVO")
+    assert masivo.define_program("p_nuevo", "NUEVO").startswith("Éxito")
+    assert masivo.is_executable("p_nuevo")[0]
+
+def test_carga_masiva_informa_errores(sim):
+    mensajes = sim.load_definitions([
+        ("PROGRAMA", "app", "java"),
+        ("TRADUCTOR", "LOCAL", "JAVA", "C", 2.0, True),
+        "DEFINIR INTERPRETE LOCAL C",
+        ("INTERPRETE", "LOCAL"),
+        "DEFINIR INTERPRETE LOCAL D 0.5",
+        "DEFINIR COSA a b",
+    ])
+    assert [m.split(":")[0] for m in mensajes] == ["Éxito", "Éxito", "Éxito", "Error", "Error", "Error"]
+    assert sim.executable_programs() == [("APP", "JAVA", True)]
+    assert sim._translator_cost[("LOCAL", "JAVA", "C")] == (2.0, True)
+
+def test_run_batch():
+    entrada = io.StringIO(
+        "# catálogo\n"
+        "DEFINIR PROGRAMA app JAVA\n"
+        "DEFINIR PROGRAMA otro HASKELL\n"
+        "\n"
+        "DEFINIR TRADUCTOR LOCAL JAVA C\n"
+        "DEFINIR INTERPRETE LOCAL C\n"
+        "EJECUTABLE app\n"
+    )
+    salida, errores = io.StringIO(), io.StringIO()
+    assert run_batch(entrada, salida, errores) == 1
+    assert salida.getvalue().splitlines() == ["programa\tlenguaje\tejecutable", "APP\tJAVA\tSI", "OTRO\tHASKELL\tNO"]
+    assert errores.getvalue().startswith("Línea 7: Error")
+
+def test_main_por_lotes(tmp_path, capsys):
+    archivo = tmp_path / "catalogo.txt"
+    archivo.write_text("DEFINIR PROGRAMA app LOCAL\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as salida:
+        main([str(archivo)])
+    assert salida.value.code == 0
+    assert capsys.readouterr().out.splitlines()[1] == "APP\tLOCAL\tSI"
+    with patch('sys.stdin', io.StringIO("DEFINIR PROGRAMA app PYTHON\n")), pytest.raises(SystemExit):
+        main(["-"])
+    assert capsys.readouterr().out.splitlines()[1] == "APP\tPYTHON\tNO"
+    with pytest.raises(SystemExit) as salida:
+        main([str(tmp_path / "no_existe.txt")])
+    assert salida.value.code == 1 and "No se pudo leer" in capsys.readouterr().out
+
+# --- Pruebas de varias máquinas ---
+@pytest.mark.parametrize("semilla", range(30))
+def test_matriz_igual_a_busqueda_recursiva(semilla):
+    """Definiciones y máquinas intercaladas al azar: la matriz incremental coincide con _can_run_language."""
+    rng = random.Random(semilla)
+    sim = TDiagramSimulator()
+    lenguajes = ["LOCAL"] + [f"L{i}" for i in range(7)]
+    for i, lenguaje in enumerate(lenguajes):
+        sim.define_program(f"P{i}", lenguaje)
+    for _ in range(30):
+        r = rng.random()
+        if r < 0.1:
+            sim.define_machine(rng.choice(lenguajes))
+        elif r < 0.5:
+            sim.define_interpreter(rng.choice(lenguajes), rng.choice(lenguajes))
+        else:
+            sim.define_translator(rng.choice(lenguajes), rng.choice(lenguajes), rng.choice(lenguajes))
+        for nombre, lenguaje, fila in sim.executability_matrix():
+            assert fila == tuple(sim._can_run_language(lenguaje, maquina, set()) for maquina in sim.machines)
+    for maquina in sim.machines:
+        assert [e for _, _, e in sim.executable_programs(maquina)] == \
+            [sim._can_run_language(lenguaje, maquina, set()) for lenguaje in lenguajes]
+    masivo = TDiagramSimulator()
+    masivo.load_definitions([("MAQUINA", m) for m in sim.machines[1:]] +
+                            [("PROGRAMA", n, l) for n, l in sim.programs.items()] +
+                            [("INTERPRETE", *k) for k in sim.interpreters] +
+                            [("TRADUCTOR", *k) for k in sim.translators])
+    assert masivo.executability_matrix() == sim.executability_matrix()
+
+def test_definir_maquina(sim):
+    sim.define_program("app", "JAVA")
+    sim.define_interpreter("ARM", "JVM")
+    sim.define_translator("LOCAL", "JAVA", "JVM")
+    assert sim.executability_matrix() == [("APP", "JAVA", (False,))]
+    assert sim.define_machine("arm").startswith("Éxito")
+    assert sim.define_machine("ARM").startswith("Advertencia")
+    assert sim.define_machine("LOCAL").startswith("Advertencia")
+    assert sim.machines == ["LOCAL", "ARM"]
+    # JVM corre en ARM, pero el traductor corre en LOCAL: JAVA no corre en ninguna.
+    assert sim.executability_matrix() == [("APP", "JAVA", (False, False))]
+    sim.define_interpreter("ARM", "LOCAL")
+    assert sim.executability_matrix() == [("APP", "JAVA", (False, True))]
+    assert not sim.is_executable("app")[0]
+    assert format_executability_matrix(sim.machines, sim.executability_matrix()).splitlines() == [
+        "programa\tlenguaje\tLOCAL\tARM", "APP\tJAVA\tNO\tSI"]
+    with pytest.raises(ValueError):
+        sim.executable_programs("X86")
+
+def test_run_batch_con_maquinas():
+    entrada = io.StringIO("DEFINIR MAQUINA ARM\nDEFINIR PROGRAMA app C\nDEFINIR INTERPRETE ARM C\n")
+    salida = io.StringIO()
+    assert run_batch(entrada, salida) == 0
+    assert salida.getvalue().splitlines() == ["programa\tlenguaje\tLOCAL\tARM", "APP\tC\tNO\tSI"]
+
 # --- Prueba para la Interfaz de Usuario (main) ---
 def test_main_flujo_completo(capsys):
     """Prueba un flujo completo simulando la entrada del usuario."""
@@ -102,4 +388,26 @@ def test_main_flujo_completo(capsys):
     assert "Traductor de 'PASCAL' a 'ASM' en 'C' definido" in output
     assert "El programa 'OTRO_APP' no está definido" in output
     assert "Comando 'DEFINIR' incompleto" in output
-    assert "Saliendo del simulador" in output
\ No newline at end of file
+    assert "Saliendo del simulador" in output
+
+def test_main_plan_y_costos(capsys):
+    user_inputs = [
+        "DEFINIR PROGRAMA app JAVA",
+        "DEFINIR INTERPRETE LOCAL JVM 3",
+        "DEFINIR TRADUCTOR JVM JAVA LOCAL 50 CACHE",
+        "DEFINIR TRADUCTOR LOCAL JAVA JVM 2",
+        "DEFINIR TRADUCTOR LOCAL A B 1 2",
+        "EJECUTABLE app PLAN",
+        "EJECUTABLE nada PLAN",
+        "DEFINIR MAQUINA JVM",
+        "MATRIZ",
+        "SALIR",
+    ]
+    with patch('builtins.input', side_effect=user_inputs):
+        main()
+    output = capsys.readouterr().out
+    assert "Plan para 'APP' (JAVA), costo total 1:" in output
+    assert "traductor de JAVA a LOCAL escrito en JVM" in output
+    assert "Argumentos de costo incorrectos" in output
+    assert "El programa 'NADA' no está definido" in output
+    assert "APP\tJAVA\tSI\tNO" in output
\ No newline at end of file